@@ -11,11 +11,58 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class APIConfig(BaseModel):
     """API configuration."""
 
-    base_url: str
+    base_url: str | None = None
     timeout: int = 30
     max_articles: int | None = None
 
 
+class NewsAPIConfig(APIConfig):
+    """NewsAPI provider configuration."""
+
+    base_url: str = "https://newsapi.org/v2"
+    max_articles: int = 30
+    # Symbols are packed into OR queries up to this length
+    max_query_length: int = 500
+    page_size: int = 100
+    max_pages: int = 1
+    # The developer plan rejects requests past its first 100 results
+    max_results: int = 100
+
+
+class FinnhubConfig(APIConfig):
+    """Finnhub provider configuration."""
+
+    base_url: str = "https://finnhub.io/api/v1"
+    max_articles: int = 20
+    use_social_sentiment: bool = True
+
+
+class RedditConfig(APIConfig):
+    """Reddit provider configuration."""
+
+    user_agent: str = "stock_signal_bot/1.0"
+    subreddits: List[str] = ["wallstreetbets", "stocks", "investing"]
+    # Posts per search query (providers pick a default if unset)
+    post_limit: int | None = None
+    min_upvotes: int = 10
+    max_post_age_days: int = 7
+    # Comment trees loaded at once, and seconds allowed per symbol
+    comment_concurrency: int = 8
+    time_budget_seconds: float = 20
+    # Single-pass crawl of new posts/comments for the whole watchlist
+    crawl_watchlist: bool = False
+    crawl_limit: int = 1000
+    crawl_window_hours: float = 24
+
+
+# Configuration model per ``api`` section name (others use APIConfig)
+API_CONFIGS = {
+    "news_api": NewsAPIConfig,
+    "finnhub": FinnhubConfig,
+    "reddit": RedditConfig,
+}
+
+
 class ThresholdsConfig(BaseModel):
     """Signal threshold configuration."""
 
@@ -40,6 +87,8 @@ class TechnicalWeightsConfig(BaseModel):
     rsi: float = 0.3
     momentum: float = 0.2
     volume: float = 0.1
+    macd: float = 0.0
+    bollinger: float = 0.0
 
 
 class DataConfig(BaseModel):
@@ -48,6 +97,34 @@ class DataConfig(BaseModel):
     sentiment_lookback_days: int = 7
     price_history_months: int = 6
     min_sentiment_sources: int = 10
+    cache_dir: Path = Path("./cache")
+    memory_cache_mb: int = 256
+    cache_max_mb: int = 2048
+    cache_max_idle_days: int = 30
+    cache_gc_interval_minutes: int = 60
+    market_calendar: Path = Path("config/market_calendar.yaml")
+    intraday_max_age_minutes: int = 15
+    refresh_intraday: bool = False
+    replay_dir: Path | None = None
+    fetch_workers: int = 8
+    indicator_cache_mb: int = 16
+    indicator_cache_file: Path | None = None
+    kernel_backend: str = "numpy"
+
+
+class ConcurrencyConfig(BaseModel):
+    """Watchlist analysis concurrency limits."""
+
+    max_symbols: int = 16
+    provider_limits: Dict[str, int] = {
+        "NewsAPI": 4,
+        "Reddit": 4,
+        "Reddit_Enhanced": 4,
+        "Finnhub": 8,
+        "Finnhub_Enhanced": 8,
+    }
+    http_connections: int = 100
+    http_connections_per_host: int = 10
 
 
 class OutputConfig(BaseModel):
@@ -100,6 +177,15 @@ class Settings(BaseSettings):
         "AMD": "AMD",
     }
 
+    # Other names a symbol is mentioned by in news and social text
+    symbol_aliases: Dict[str, List[str]] = {
+        "GOOGL": ["Alphabet"],
+        "META": ["Facebook", "Meta Platforms"],
+        "AMD": ["Advanced Micro Devices"],
+        "MSFT": ["Microsoft Corp"],
+        "NVDA": ["Nvidia Corp"],
+    }
+
     # Configuration from YAML
     thresholds: ThresholdsConfig = Field(default_factory=ThresholdsConfig)
     weights: WeightsConfig = Field(default_factory=WeightsConfig)
@@ -107,6 +193,7 @@ class Settings(BaseSettings):
         default_factory=TechnicalWeightsConfig
     )
     data: DataConfig = Field(default_factory=DataConfig)
+    concurrency: ConcurrencyConfig = Field(default_factory=ConcurrencyConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
     logging_config: LoggingConfig = Field(default_factory=LoggingConfig)
 
@@ -139,6 +226,11 @@ class Settings(BaseSettings):
             if "data" in yaml_config:
                 settings.data = DataConfig(**yaml_config["data"])
 
+            if "concurrency" in yaml_config:
+                settings.concurrency = ConcurrencyConfig(
+                    **yaml_config["concurrency"]
+                )
+
             if "output" in yaml_config:
                 settings.output = OutputConfig(**yaml_config["output"])
 
@@ -147,7 +239,7 @@ class Settings(BaseSettings):
 
             if "api" in yaml_config:
                 settings.api_configs = {
-                    name: APIConfig(**config)
+                    name: API_CONFIGS.get(name, APIConfig)(**config)
                     for name, config in yaml_config["api"].items()
                 }
 
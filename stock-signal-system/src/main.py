@@ -1,22 +1,34 @@
 """Main application entry point with all sentiment providers."""
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List
 
+import numpy as np
 from tabulate import tabulate
 
-from .config.settings import get_settings
-from .models.signal import TradingSignal
+from .config.settings import RedditConfig, get_settings
+from .models.signal import SentimentScore, TradingSignal
+from .models.signal_frame import SignalFrame
+from .repositories.cache_manager import CacheManager
+from .repositories.freshness import MarketSessionPolicy
+from .repositories.market_data import MarketDataRepository
+from .repositories.sources import ReplaySource, YFinanceSource
+from .services.scheduler import AnalysisScheduler
 from .services.sentiment.finnhub import FinnhubSentimentProvider
+from .services.sentiment.matching import SymbolMatcher
 from .services.sentiment.news_api import NewsAPISentimentProvider
 from .services.sentiment.reddit import RedditSentimentProvider
 from .services.signal_generator import SignalGenerator
+from .services.technical import kernels
 from .services.technical.analyzers import TechnicalAnalyzer
 from .services.technical.indicators import TechnicalIndicatorCalculator
+from .services.technical.result_cache import IndicatorResultCache
 from .utils.decorators import log_execution_time
+from .utils.http import HttpClient
 from .utils.logger import get_logger, setup_logging
+from .utils.market_calendar import MarketCalendar
 from .visualization.dashboard import Dashboard
 
 logger = get_logger(__name__)
@@ -35,6 +47,12 @@ class StockSignalSystem:
             log_file=self.settings.logging_config.file,
         )
 
+        # Keep-alive connections shared by the async API providers
+        self.http = HttpClient(
+            limit=self.settings.concurrency.http_connections,
+            limit_per_host=self.settings.concurrency.http_connections_per_host,
+        )
+
         # Initialize all sentiment providers
         self.sentiment_providers = []
 
@@ -42,7 +60,8 @@ class StockSignalSystem:
         try:
             news_provider = NewsAPISentimentProvider(
                 api_key=self.settings.news_api_key.get_secret_value(),
-                config=self.settings.api_configs.get("news_api", {}),
+                config=self.settings.api_configs.get("news_api"),
+                http=self.http,
             )
             self.sentiment_providers.append(news_provider)
             logger.info("NewsAPI provider initialized")
@@ -51,13 +70,14 @@ class StockSignalSystem:
 
         # Reddit provider
         try:
+            reddit_config = (
+                self.settings.api_configs.get("reddit") or RedditConfig()
+            )
             reddit_provider = RedditSentimentProvider(
                 client_id=self.settings.reddit_client_id.get_secret_value(),
                 client_secret=self.settings.reddit_secret.get_secret_value(),
-                user_agent=self.settings.api_configs.get("reddit", {}).get(
-                    "user_agent", "stock_signal_bot/1.0"
-                ),
-                config=self.settings.api_configs.get("reddit", {}),
+                user_agent=reddit_config.user_agent,
+                config=reddit_config,
             )
             self.sentiment_providers.append(reddit_provider)
             logger.info("Reddit provider initialized")
@@ -68,7 +88,8 @@ class StockSignalSystem:
         try:
             finnhub_provider = FinnhubSentimentProvider(
                 api_key=self.settings.finnhub_key.get_secret_value(),
-                config=self.settings.api_configs.get("finnhub", {}),
+                config=self.settings.api_configs.get("finnhub"),
+                http=self.http,
             )
             self.sentiment_providers.append(finnhub_provider)
             logger.info("Finnhub provider initialized")
@@ -78,20 +99,89 @@ class StockSignalSystem:
         if not self.sentiment_providers:
             logger.error("No sentiment providers available!")
 
+        # Market data: recorded files when replaying, else cached yfinance
+        self.cache_manager: CacheManager | None = None
+        if self.settings.data.replay_dir:
+            self.market_data = ReplaySource(self.settings.data.replay_dir)
+            logger.info(
+                "Replaying recorded prices",
+                directory=str(self.settings.data.replay_dir),
+            )
+        else:
+            # An indicator cache kept inside cache_dir is not a price file
+            cache_dir = Path(self.settings.data.cache_dir)
+            indicator_file = self.settings.data.indicator_cache_file
+            exempt = []
+            if (
+                indicator_file
+                and Path(indicator_file).resolve().parent
+                == cache_dir.resolve()
+            ):
+                exempt.append(Path(indicator_file).name)
+
+            self.cache_manager = CacheManager(
+                cache_dir=cache_dir,
+                max_bytes=self.settings.data.cache_max_mb * 1024 * 1024,
+                max_idle_days=self.settings.data.cache_max_idle_days,
+                exempt=exempt,
+            )
+            self.cache_manager.start(
+                interval=self.settings.data.cache_gc_interval_minutes * 60
+            )
+
+            self.market_data = MarketDataRepository(
+                cache_dir=self.settings.data.cache_dir,
+                source=YFinanceSource(),
+                memory_cache_bytes=self.settings.data.memory_cache_mb
+                * 1024
+                * 1024,
+                freshness=MarketSessionPolicy(
+                    calendar=MarketCalendar.load(
+                        self.settings.data.market_calendar
+                    ),
+                    intraday_max_age=timedelta(
+                        minutes=self.settings.data.intraday_max_age_minutes
+                    ),
+                    refresh_intraday=self.settings.data.refresh_intraday,
+                ),
+                cache_manager=self.cache_manager,
+            )
+
         # Technical analysis services
-        self.technical_calculator = TechnicalIndicatorCalculator(
-            history_months=self.settings.data.price_history_months
-        )
+        try:
+            kernels.set_backend(self.settings.data.kernel_backend)
+        except ImportError as e:
+            logger.warning(f"Using numpy kernels: {e}")
 
         self.technical_analyzer = TechnicalAnalyzer(
             weights=self.settings.technical_weights
         )
 
+        # Only indicators consumed downstream are calculated
+        self.technical_calculator = TechnicalIndicatorCalculator(
+            history_months=self.settings.data.price_history_months,
+            data_source=self.market_data,
+            fetch_workers=self.settings.data.fetch_workers,
+            indicators=sorted(
+                self.technical_analyzer.required_indicators
+                | SignalGenerator.REQUIRED_INDICATORS
+            ),
+            result_cache=IndicatorResultCache(
+                max_bytes=self.settings.data.indicator_cache_mb * 1024 * 1024,
+                path=self.settings.data.indicator_cache_file,
+            ),
+        )
+
         self.signal_generator = SignalGenerator(
             thresholds=self.settings.thresholds,
             weights=self.settings.weights,
         )
 
+        self.scheduler = AnalysisScheduler(
+            max_concurrency=self.settings.concurrency.max_symbols,
+            provider_limits=self.settings.concurrency.provider_limits,
+        )
+
         self.dashboard = Dashboard(
             output_path=self.settings.output.save_path
         )
@@ -114,56 +204,17 @@ class StockSignalSystem:
         self.logger.info("Analyzing", symbol=symbol, company=company_name)
 
         try:
-            # Fetch sentiment from all providers concurrently
-            sentiment_tasks = [
-                provider.fetch_sentiment(symbol, company_name)
-                for provider in self.sentiment_providers
-            ]
-            sentiment_results = await asyncio.gather(
-                *sentiment_tasks, return_exceptions=True
+            # Price data downloads in a worker thread meanwhile
+            technical_task = asyncio.create_task(
+                self.technical_calculator.calculate_async(symbol)
             )
 
-            # Combine sentiment scores
-            all_sentiments = []
-            source_scores = {}
-
-            for provider, result in zip(
-                self.sentiment_providers, sentiment_results
-            ):
-                if isinstance(result, Exception):
-                    self.logger.warning(
-                        f"Provider {provider.name} failed: {result}"
-                    )
-                    continue
-
-                scores = result
-                all_sentiments.extend(scores)
-                
-                if scores:
-                    source_scores[provider.name] = sum(scores) / len(scores)
-                    self.logger.info(
-                        f"{provider.name}: {len(scores)} sources, "
-                        f"avg {source_scores[provider.name]:.3f}"
-                    )
-
-            if not all_sentiments:
-                avg_sentiment = 0.0
-                self.logger.warning(
-                    "No sentiment data available", symbol=symbol
-                )
-            else:
-                avg_sentiment = sum(all_sentiments) / len(all_sentiments)
-
-            from .models.signal import SentimentScore
-
-            sentiment_score = SentimentScore(
-                value=avg_sentiment,
-                source_count=len(all_sentiments),
-                sources=source_scores,
+            sentiment_score = await self._sentiment_score(
+                symbol, company_name
             )
 
             # Calculate technical indicators
-            indicators = self.technical_calculator.calculate(symbol)
+            indicators = await technical_task
             if indicators is None:
                 self.logger.error("Technical analysis failed", symbol=symbol)
                 return None
@@ -190,6 +241,73 @@ class StockSignalSystem:
             )
             return None
 
+    async def _sentiment_score(
+        self, symbol: str, company_name: str
+    ) -> SentimentScore:
+        """
+        Combine sentiment from all providers.
+
+        Args:
+            symbol: Stock ticker symbol
+            company_name: Company name
+
+        Returns:
+            SentimentScore averaged over every provider's sources
+        """
+        # Fetch sentiment from all providers concurrently
+        sentiment_tasks = [
+            self._fetch_sentiment(provider, symbol, company_name)
+            for provider in self.sentiment_providers
+        ]
+        sentiment_results = await asyncio.gather(
+            *sentiment_tasks, return_exceptions=True
+        )
+
+        # Combine sentiment scores
+        all_sentiments = []
+        source_scores = {}
+
+        for provider, result in zip(
+            self.sentiment_providers, sentiment_results
+        ):
+            if isinstance(result, Exception):
+                self.logger.warning(
+                    f"Provider {provider.name} failed: {result}"
+                )
+                continue
+
+            scores = result
+            all_sentiments.extend(scores)
+
+            if scores:
+                source_scores[provider.name] = sum(scores) / len(scores)
+                self.logger.info(
+                    f"{provider.name}: {len(scores)} sources, "
+                    f"avg {source_scores[provider.name]:.3f}",
+                    symbol=symbol,
+                )
+
+        if not all_sentiments:
+            avg_sentiment = 0.0
+            self.logger.warning(
+                "No sentiment data available", symbol=symbol
+            )
+        else:
+            avg_sentiment = sum(all_sentiments) / len(all_sentiments)
+
+        return SentimentScore(
+            value=avg_sentiment,
+            source_count=len(all_sentiments),
+            sources=source_scores,
+        )
+
+    async def _fetch_sentiment(
+        self, provider, symbol: str, company_name: str
+    ) -> List[float]:
+        """Fetch sentiment within the provider's concurrency limit."""
+        async with self.scheduler.limit(provider.name):
+            return await provider.fetch_sentiment(symbol, company_name)
+
     def _print_signal_report(self, signal: TradingSignal):
         """Print formatted signal report."""
         print(f"\n{'='*60}")
@@ -234,12 +352,12 @@ class StockSignalSystem:
         )
 
     @log_execution_time
-    async def analyze_watchlist(self) -> List[TradingSignal]:
+    async def analyze_watchlist(self) -> SignalFrame:
         """
         Analyze all symbols in watchlist.
 
         Returns:
-            List of trading signals
+            Trading signals for the symbols that could be analyzed
         """
         print("\n" + "=" * 60)
         print("🚀 STOCK SIGNAL SYSTEM - STARTING ANALYSIS")
@@ -251,25 +369,102 @@ class StockSignalSystem:
         print(f"⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
 
-        signals = []
+        # Providers that can batch symbols fetch the watchlist up front
+        company_names = {
+            symbol: self.settings.company_names.get(symbol, symbol)
+            for symbol in self.settings.watchlist
+        }
+        matcher = SymbolMatcher(
+            company_names, aliases=self.settings.symbol_aliases
+        )
+        prefetched = await asyncio.gather(
+            *(
+                provider.prefetch(company_names, matcher)
+                for provider in self.sentiment_providers
+            ),
+            return_exceptions=True,
+        )
+        for provider, result in zip(self.sentiment_providers, prefetched):
+            if isinstance(result, Exception):
+                self.logger.warning(
+                    "Prefetch failed, fetching per symbol",
+                    provider=provider.name,
+                    error=str(result),
+                )
+
+        # Indicators for the whole watchlist are calculated as one panel
+        # in a worker thread while sentiment is fetched per symbol
+        symbols = list(company_names)
+        technical_task = asyncio.create_task(
+            self.technical_calculator.calculate_batch_async(symbols)
+        )
+        report = await self.scheduler.run(
+            symbols,
+            lambda symbol: self._sentiment_score(
+                symbol, company_names[symbol]
+            ),
+        )
+
+        print(f"\n⏱️  Sentiment in {report.elapsed_ms / 1000:.1f}s")
+        for timing in report.slowest[:5]:
+            status = "✓" if timing.ok else "✗"
+            print(
+                f"   {status} {timing.symbol:<6} "
+                f"{timing.duration_ms / 1000:.2f}s"
+            )
 
-        for symbol in self.settings.watchlist:
-            company_name = self.settings.company_names.get(symbol, symbol)
+        try:
+            panel = await technical_task
+        except Exception as e:
+            self.logger.error("Technical analysis failed", error=str(e))
+            return SignalFrame.empty()
+
+        # Symbols without price data get no signal
+        valid = panel.valid
+        for symbol in np.asarray(symbols, dtype=object)[~valid]:
+            self.logger.error("Technical analysis failed", symbol=symbol)
+        panel = panel.select(valid)
+
+        scores = [
+            score or SentimentScore(value=0.0, source_count=0)
+            for score, keep in zip(report.results, valid)
+            if keep
+        ]
+        batch = self.signal_generator.generate_batch(
+            symbols=panel.symbols,
+            company_names=[company_names[s] for s in panel.symbols],
+            sentiment_values=np.array([s.value for s in scores]),
+            source_counts=np.array([s.source_count for s in scores]),
+            technical=self.technical_analyzer.analyze_batch(panel),
+            indicators=panel,
+            sentiment_sources=[s.sources for s in scores],
+        )
+        signals = SignalFrame.from_batch(batch)
 
-            signal = await self.analyze_symbol(symbol, company_name)
-            if signal:
-                signals.append(signal)
+        for row in range(len(signals)):
+            self._print_signal_report(signals.signal(row))
 
         return signals
 
-    def process_results(self, signals: List[TradingSignal]):
+    async def close(self):
+        """Release pooled connections and persist cache state."""
+        await self.http.close()
+        self.technical_calculator.close()
+
+        if self.technical_calculator.result_cache is not None:
+            self.technical_calculator.result_cache.save()
+
+        if self.cache_manager is not None:
+            self.cache_manager.stop()
+
+    def process_results(self, signals: SignalFrame):
         """
         Process and display results.
 
         Args:
-            signals: List of trading signals
+            signals: Trading signals
         """
-        if not signals:
+        if not len(signals):
             print("\n❌ No signals generated")
             return
 
@@ -285,23 +480,17 @@ class StockSignalSystem:
         # Print summary
         self._print_summary(signals)
 
-    def _print_summary(self, signals: List[TradingSignal]):
+    def _print_summary(self, signals: SignalFrame):
         """Print summary statistics."""
         print("\n" + "=" * 60)
         print("📊 SUMMARY")
         print("=" * 60)
 
-        buy_signals = sum(
-            1 for s in signals if "BUY" in s.signal_type.value
-        )
-        sell_signals = sum(
-            1 for s in signals if "SELL" in s.signal_type.value
-        )
-        hold_signals = sum(
-            1 for s in signals if s.signal_type.value == "HOLD"
-        )
+        buy_signals = int(signals.buy_mask.sum())
+        sell_signals = int(signals.sell_mask.sum())
+        hold_signals = int(signals.hold_mask.sum())
 
-        avg_confidence = sum(s.confidence for s in signals) / len(signals)
+        avg_confidence = signals.confidence.mean()
 
         print(f"🟢 Buy Signals: {buy_signals}")
         print(f"🔴 Sell Signals: {sell_signals}")
@@ -309,7 +498,7 @@ class StockSignalSystem:
         print(f"📈 Average Confidence: {avg_confidence:.1f}%")
 
         # Top recommendation
-        best = max(signals, key=lambda x: x.combined_score)
+        best = signals.best()
         print(
             f"\n⭐ TOP PICK: {best.symbol} - {best.signal_type.value} "
             f"({best.confidence:.0f}% confidence)"
@@ -321,8 +510,11 @@ class StockSignalSystem:
 async def main():
     """Main entry point."""
     system = StockSignalSystem()
-    signals = await system.analyze_watchlist()
-    system.process_results(signals)
+    try:
+        signals = await system.analyze_watchlist()
+        system.process_results(signals)
+    finally:
+        await system.close()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,34 @@
 """Technical indicator data models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
+from .market_data import PriceHistoryRef
 
-@dataclass
+# Indicators stored as TechnicalIndicators fields
+CORE_INDICATORS = (
+    "price",
+    "ma_20",
+    "ma_50",
+    "ma_200",
+    "rsi",
+    "volume_ratio",
+    "week_change",
+    "month_change",
+)
+
+
+@dataclass(slots=True)
 class TechnicalIndicators:
-    """Container for technical indicators."""
+    """
+    Container for technical indicators.
+
+    The price history is only referenced (see PriceHistoryRef), so
+    holding indicators does not keep their DataFrames alive.
+    """
 
     price: float
     ma_20: float
@@ -17,7 +38,48 @@ class TechnicalIndicators:
     volume_ratio: float
     week_change: float
     month_change: float
-    price_history: pd.DataFrame
+    history: Optional[PriceHistoryRef] = None
+    # Only allocated when non-core indicators are calculated
+    extra: Optional[Dict[str, float]] = None
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Mapping[str, float],
+        history: Optional[PriceHistoryRef] = None,
+    ) -> "TechnicalIndicators":
+        """
+        Build indicators from named values.
+
+        Args:
+            values: Indicator values; core fields not given are NaN,
+                other names go to ``extra``
+            history: Reference to the price history
+
+        Returns:
+            TechnicalIndicators instance
+        """
+        extra = {
+            name: value
+            for name, value in values.items()
+            if name not in CORE_INDICATORS
+        }
+        return cls(
+            **{name: values.get(name, np.nan) for name in CORE_INDICATORS},
+            history=history,
+            extra=extra or None,
+        )
+
+    @property
+    def price_history(self) -> Optional[pd.DataFrame]:
+        """Price history, loaded again if it has been released."""
+        return self.history.get() if self.history is not None else None
+
+    def value(self, name: str) -> float:
+        """Get an indicator value by name (core field or extra)."""
+        if self.extra and name in self.extra:
+            return self.extra[name]
+        return getattr(self, name)
 
     def is_above_ma20(self) -> bool:
         """Check if price is above 20-day MA."""
@@ -42,3 +104,131 @@ class TechnicalIndicators:
     def has_high_volume(self, threshold: float = 1.5) -> bool:
         """Check if volume is elevated."""
         return self.volume_ratio > threshold
+
+
+@dataclass
+class IndicatorPanel:
+    """Columnar technical indicators for many symbols."""
+
+    symbols: List[str]
+    price: np.ndarray
+    ma_20: np.ndarray
+    ma_50: np.ndarray
+    ma_200: np.ndarray
+    rsi: np.ndarray
+    volume_ratio: np.ndarray
+    week_change: np.ndarray
+    month_change: np.ndarray
+    extra: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    COLUMNS = CORE_INDICATORS
+
+    def __post_init__(self):
+        """Index rows by symbol."""
+        self._rows = {symbol: row for row, symbol in enumerate(self.symbols)}
+
+    @classmethod
+    def from_columns(
+        cls, symbols: List[str], columns: Mapping[str, np.ndarray]
+    ) -> "IndicatorPanel":
+        """
+        Build a panel from named indicator arrays.
+
+        Args:
+            symbols: Row symbols
+            columns: Indicator values per name; core indicators not
+                given are NaN, other names go to ``extra``
+
+        Returns:
+            IndicatorPanel instance
+        """
+        missing = np.full(len(symbols), np.nan)
+        return cls(
+            symbols=list(symbols),
+            **{
+                column: columns.get(column, missing)
+                for column in cls.COLUMNS
+            },
+            extra={
+                name: values
+                for name, values in columns.items()
+                if name not in cls.COLUMNS
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Mask of symbols with a usable latest price."""
+        return ~np.isnan(self.price)
+
+    def select(self, mask: np.ndarray) -> "IndicatorPanel":
+        """
+        Select rows.
+
+        Args:
+            mask: Boolean mask over the panel's symbols
+
+        Returns:
+            IndicatorPanel with the selected rows
+        """
+        columns = {
+            **{column: getattr(self, column) for column in self.COLUMNS},
+            **self.extra,
+        }
+        return IndicatorPanel.from_columns(
+            [s for s, keep in zip(self.symbols, mask) if keep],
+            {name: values[mask] for name, values in columns.items()},
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get indicators as a DataFrame indexed by symbol."""
+        return pd.DataFrame(
+            {
+                **{column: getattr(self, column) for column in self.COLUMNS},
+                **self.extra,
+            },
+            index=pd.Index(self.symbols, name="symbol"),
+        )
+
+    def get(
+        self, symbol: str, history: Optional[PriceHistoryRef] = None
+    ) -> Optional[TechnicalIndicators]:
+        """
+        Get one symbol's indicators as a TechnicalIndicators object.
+
+        Args:
+            symbol: Stock ticker symbol
+            history: Reference to the symbol's price history
+
+        Returns:
+            TechnicalIndicators or None if the symbol has no data
+        """
+        values = self.values(symbol)
+        if values is None:
+            return None
+
+        return TechnicalIndicators.from_values(values, history)
+
+    def values(self, symbol: str) -> Optional[Dict[str, float]]:
+        """
+        Get one symbol's indicator values by name.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            Core and extra indicator values, or None if the symbol has
+            no data
+        """
+        row = self._rows.get(symbol)
+        if row is None or np.isnan(self.price[row]):
+            return None
+
+        columns = {
+            **{column: getattr(self, column) for column in self.COLUMNS},
+            **self.extra,
+        }
+        return {name: float(values[row]) for name, values in columns.items()}
@@ -0,0 +1,166 @@
+"""Market data models."""
+
+import weakref
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class PriceBatch:
+    """Result of a multi-symbol price history request."""
+
+    frames: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    cache_hits: List[str] = field(default_factory=list)
+    fetched: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+    def get(self, symbol: str) -> pd.DataFrame | None:
+        """Get price history for a symbol, if available."""
+        return self.frames.get(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.frames
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+
+class PriceHistoryRef:
+    """
+    Reference to a symbol's price history that does not own it.
+
+    The DataFrame is held weakly, so it stays shared while the data
+    source (or anyone else) keeps it alive and is reloaded on demand
+    once it has been released.
+    """
+
+    __slots__ = ("symbol", "_loader", "_frame")
+
+    def __init__(
+        self,
+        symbol: str,
+        loader: Callable[[str], Optional[pd.DataFrame]],
+        frame: Optional[pd.DataFrame] = None,
+    ):
+        """
+        Initialize reference.
+
+        Args:
+            symbol: Stock ticker symbol
+            loader: Loads the symbol's price history
+            frame: Already loaded price history
+        """
+        self.symbol = symbol
+        self._loader = loader
+        self._frame = weakref.ref(frame) if frame is not None else None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the price history is currently in memory."""
+        return self._frame is not None and self._frame() is not None
+
+    def get(self) -> Optional[pd.DataFrame]:
+        """
+        Get the price history, loading it if it was released.
+
+        Returns:
+            Price DataFrame or None if the loader has no data
+        """
+        frame = self._frame() if self._frame is not None else None
+        if frame is None:
+            frame = self._loader(self.symbol)
+            if frame is not None:
+                self._frame = weakref.ref(frame)
+        return frame
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "released"
+        return f"PriceHistoryRef({self.symbol!r}, {state})"
+
+
+@dataclass
+class PricePanel:
+    """
+    Aligned (symbols x bars) price arrays for vectorized calculations.
+
+    Rows are right-aligned so the last column is every symbol's latest
+    bar; symbols with shorter histories are NaN-padded on the left.
+    """
+
+    symbols: List[str]
+    closes: np.ndarray
+    volumes: np.ndarray
+    lengths: np.ndarray
+    highs: Optional[np.ndarray] = None
+    lows: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: Mapping[str, pd.DataFrame],
+        symbols: Optional[Sequence[str]] = None,
+        max_bars: Optional[int] = None,
+    ) -> "PricePanel":
+        """
+        Build a panel from per-symbol price histories.
+
+        Args:
+            frames: Price DataFrames with Close and Volume columns
+            symbols: Row order (defaults to the order of ``frames``;
+                symbols without a frame become all-NaN rows)
+            max_bars: Keep at most this many trailing bars per symbol
+
+        Returns:
+            PricePanel instance (highs/lows only when some frame has
+            High/Low columns)
+        """
+        symbols = list(frames if symbols is None else symbols)
+        lengths = np.array(
+            [
+                len(frames[s]) if s in frames and frames[s] is not None
+                else 0
+                for s in symbols
+            ],
+            dtype=np.int64,
+        )
+        if max_bars is not None:
+            lengths = np.minimum(lengths, max_bars)
+
+        width = int(lengths.max()) if len(lengths) else 0
+        present = {
+            column
+            for symbol, length in zip(symbols, lengths)
+            if length
+            for column in frames[symbol].columns
+        }
+        columns = ["Close", "Volume"] + [
+            column for column in ("High", "Low") if column in present
+        ]
+        arrays = {
+            column: np.full((len(symbols), width), np.nan)
+            for column in columns
+        }
+
+        for row, (symbol, length) in enumerate(zip(symbols, lengths)):
+            if length == 0:
+                continue
+            df = frames[symbol]
+            for column, array in arrays.items():
+                if column in df:
+                    values = df[column].to_numpy()[-length:]
+                    array[row, width - length:] = values
+
+        return cls(
+            symbols=symbols,
+            closes=arrays["Close"],
+            volumes=arrays["Volume"],
+            lengths=lengths,
+            highs=arrays.get("High"),
+            lows=arrays.get("Low"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
@@ -2,8 +2,8 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import List
+from enum import Enum, IntFlag
+from typing import Dict, Iterator, List, Optional
 
 import numpy as np
 
@@ -40,7 +40,48 @@ class SignalType(Enum):
         }[self]
 
 
-@dataclass(frozen=True)
+# Signal types from most bearish to most bullish
+SIGNAL_ORDER = (
+    SignalType.STRONG_SELL,
+    SignalType.SELL,
+    SignalType.HOLD,
+    SignalType.BUY,
+    SignalType.STRONG_BUY,
+)
+
+
+class SignalWarning(IntFlag):
+    """Risk warning flags."""
+
+    OVERBOUGHT = 1
+    OVERSOLD = 2
+    LOW_SENTIMENT = 4
+    LOW_VOLUME = 8
+
+    @property
+    def message(self) -> str:
+        """Get the report message for a single flag."""
+        return WARNING_MESSAGES[self]
+
+    @staticmethod
+    def messages(flags: int) -> List[str]:
+        """Get report messages for a combination of flags."""
+        return [
+            message
+            for flag, message in WARNING_MESSAGES.items()
+            if flags & flag
+        ]
+
+
+WARNING_MESSAGES = {
+    SignalWarning.OVERBOUGHT: "⚠️ Overbought (RSI > 70)",
+    SignalWarning.OVERSOLD: "✅ Oversold (RSI < 30)",
+    SignalWarning.LOW_SENTIMENT: "⚠️ Low sentiment data",
+    SignalWarning.LOW_VOLUME: "⚠️ Low volume",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class SentimentScore:
     """Sentiment analysis score."""
 
@@ -54,7 +95,7 @@ class SentimentScore:
             raise ValueError("Sentiment score must be between -1 and 1")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TechnicalScore:
     """Technical analysis score."""
 
@@ -68,6 +109,28 @@ class TechnicalScore:
 
 
 @dataclass
+class TechnicalScoreBatch:
+    """Technical scores for many symbols as arrays."""
+
+    symbols: List[str]
+    values: np.ndarray
+    components: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, row: int) -> TechnicalScore:
+        """Get one symbol's score as a TechnicalScore."""
+        return TechnicalScore(
+            value=float(self.values[row]),
+            components={
+                name: float(scores[row])
+                for name, scores in self.components.items()
+            },
+        )
+
+
+@dataclass(slots=True)
 class TradingSignal:
     """Complete trading signal with all analysis data."""
 
@@ -113,3 +176,78 @@ class TradingSignal:
             "Combined": f"{self.combined_score:+.3f}",
             "Timestamp": self.timestamp.isoformat(),
         }
+
+
+@dataclass
+class SignalBatch:
+    """
+    Trading signals for many symbols as arrays.
+
+    TradingSignal objects are only built when requested.
+    """
+
+    symbols: List[str]
+    company_names: List[str]
+    signal_codes: np.ndarray  # indexes into SIGNAL_ORDER
+    confidence: np.ndarray
+    combined_score: np.ndarray
+    sentiment_values: np.ndarray
+    source_counts: np.ndarray
+    technical: TechnicalScoreBatch
+    current_price: np.ndarray
+    rsi: np.ndarray
+    week_change: np.ndarray
+    warnings: np.ndarray  # SignalWarning bitmasks
+    sentiment_sources: Optional[List[Dict[str, float]]] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def signal_type(self, row: int) -> SignalType:
+        """Get one symbol's signal type."""
+        return SIGNAL_ORDER[self.signal_codes[row]]
+
+    def mask(self, signal_type: SignalType) -> np.ndarray:
+        """Mask of symbols with the given signal type."""
+        return self.signal_codes == SIGNAL_ORDER.index(signal_type)
+
+    def has_warning(self, flag: SignalWarning) -> np.ndarray:
+        """Mask of symbols carrying a warning flag."""
+        return (self.warnings & flag) != 0
+
+    def signal(self, row: int) -> TradingSignal:
+        """
+        Build one symbol's TradingSignal.
+
+        Args:
+            row: Symbol position in the batch
+
+        Returns:
+            TradingSignal for that symbol
+        """
+        sources = (
+            self.sentiment_sources[row] if self.sentiment_sources else {}
+        )
+
+        return TradingSignal(
+            symbol=self.symbols[row],
+            company_name=self.company_names[row],
+            signal_type=self.signal_type(row),
+            confidence=float(self.confidence[row]),
+            combined_score=float(self.combined_score[row]),
+            sentiment_score=SentimentScore(
+                value=float(self.sentiment_values[row]),
+                source_count=int(self.source_counts[row]),
+                sources=sources,
+            ),
+            technical_score=self.technical[row],
+            current_price=float(self.current_price[row]),
+            rsi=float(self.rsi[row]),
+            week_change=float(self.week_change[row]),
+            warnings=SignalWarning.messages(int(self.warnings[row])),
+            timestamp=self.timestamp,
+        )
+
+    def __iter__(self) -> Iterator[TradingSignal]:
+        return (self.signal(row) for row in range(len(self)))
@@ -0,0 +1,425 @@
+"""Columnar container for large sets of trading signals."""
+
+import dataclasses
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from .signal import (
+    SIGNAL_ORDER,
+    WARNING_MESSAGES,
+    SentimentScore,
+    SignalBatch,
+    SignalType,
+    SignalWarning,
+    TechnicalScore,
+    TradingSignal,
+)
+
+# Signal codes at or above BUY are buys, at or below SELL are sells
+_HOLD_CODE = SIGNAL_ORDER.index(SignalType.HOLD)
+
+_SIGNAL_VALUES = np.array([s.value for s in SIGNAL_ORDER], dtype=object)
+_SIGNAL_COLORS = np.array([s.color for s in SIGNAL_ORDER], dtype=object)
+
+_WARNING_FLAGS = {
+    message: flag for flag, message in WARNING_MESSAGES.items()
+}
+
+# Sortable numeric columns
+SORT_COLUMNS = (
+    "confidence",
+    "combined_score",
+    "sentiment",
+    "technical",
+    "current_price",
+    "rsi",
+    "week_change",
+)
+
+RowSelector = Union[slice, np.ndarray, Iterable[int]]
+
+
+def _columns_from_dicts(
+    rows: Iterable[Mapping[str, float]], length: int
+) -> Dict[str, np.ndarray]:
+    """Spread per-row dicts into NaN-filled arrays, one per key."""
+    columns: Dict[str, np.ndarray] = {}
+    for row, values in enumerate(rows):
+        for name, value in values.items():
+            if name not in columns:
+                columns[name] = np.full(length, np.nan)
+            columns[name][row] = value
+    return columns
+
+
+def _dict_at(columns: Mapping[str, np.ndarray], row: int) -> Dict:
+    """Collect one row of NaN-filled columns back into a dict."""
+    return {
+        name: float(values[row])
+        for name, values in columns.items()
+        if not np.isnan(values[row])
+    }
+
+
+@dataclass(frozen=True)
+class SignalFrame:
+    """
+    Trading signals stored as one array per field.
+
+    Slicing returns views of the same arrays; masks and index arrays
+    select rows without touching TradingSignal objects, which are only
+    built on request.
+    """
+
+    symbols: np.ndarray  # object array of tickers
+    company_names: np.ndarray
+    signal_codes: np.ndarray  # indexes into SIGNAL_ORDER
+    confidence: np.ndarray
+    combined_score: np.ndarray
+    sentiment: np.ndarray
+    source_counts: np.ndarray
+    technical: np.ndarray
+    current_price: np.ndarray
+    rsi: np.ndarray
+    week_change: np.ndarray
+    warnings: np.ndarray  # SignalWarning bitmasks
+    timestamps: np.ndarray  # datetime64[us]
+    components: Dict[str, np.ndarray] = field(default_factory=dict)
+    sources: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls) -> "SignalFrame":
+        """Create a frame without signals."""
+        return cls.from_signals([])
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[TradingSignal]) -> "SignalFrame":
+        """
+        Build a frame from TradingSignal objects.
+
+        Args:
+            signals: Trading signals
+
+        Returns:
+            SignalFrame with one row per signal
+        """
+        signals = list(signals)
+        n = len(signals)
+
+        def column(get, dtype=float):
+            return np.fromiter((get(s) for s in signals), dtype, count=n)
+
+        return cls(
+            symbols=column(lambda s: s.symbol, object),
+            company_names=column(lambda s: s.company_name, object),
+            signal_codes=column(
+                lambda s: SIGNAL_ORDER.index(s.signal_type), np.int8
+            ),
+            confidence=column(lambda s: s.confidence),
+            combined_score=column(lambda s: s.combined_score),
+            sentiment=column(lambda s: s.sentiment_score.value),
+            source_counts=column(
+                lambda s: s.sentiment_score.source_count, np.int64
+            ),
+            technical=column(lambda s: s.technical_score.value),
+            current_price=column(lambda s: s.current_price),
+            rsi=column(lambda s: s.rsi),
+            week_change=column(lambda s: s.week_change),
+            warnings=column(
+                lambda s: sum(_WARNING_FLAGS[w] for w in s.warnings),
+                np.uint8,
+            ),
+            timestamps=np.array(
+                [s.timestamp for s in signals], dtype="datetime64[us]"
+            ),
+            components=_columns_from_dicts(
+                (s.technical_score.components for s in signals), n
+            ),
+            sources=_columns_from_dicts(
+                (s.sentiment_score.sources for s in signals), n
+            ),
+        )
+
+    @classmethod
+    def from_batch(cls, batch: SignalBatch) -> "SignalFrame":
+        """
+        Build a frame from a SignalBatch, sharing its arrays.
+
+        Args:
+            batch: Batch of generated signals
+
+        Returns:
+            SignalFrame with one row per symbol
+        """
+        n = len(batch)
+        return cls(
+            symbols=np.array(batch.symbols, dtype=object),
+            company_names=np.array(batch.company_names, dtype=object),
+            signal_codes=batch.signal_codes,
+            confidence=batch.confidence,
+            combined_score=batch.combined_score,
+            sentiment=batch.sentiment_values,
+            source_counts=batch.source_counts,
+            technical=batch.technical.values,
+            current_price=batch.current_price,
+            rsi=batch.rsi,
+            week_change=batch.week_change,
+            warnings=batch.warnings,
+            timestamps=np.full(n, np.datetime64(batch.timestamp, "us")),
+            components=dict(batch.technical.components),
+            sources=_columns_from_dicts(batch.sentiment_sources or (), n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, rows: RowSelector) -> "SignalFrame":
+        """
+        Select rows.
+
+        Args:
+            rows: Slice (returns views), boolean mask or row indices
+
+        Returns:
+            SignalFrame with the selected rows
+        """
+        if not isinstance(rows, slice):
+            rows = np.asarray(rows)
+            if rows.dtype != bool:
+                rows = rows.astype(np.intp, copy=False)
+
+        def select(values: np.ndarray) -> np.ndarray:
+            return values[rows]
+
+        return self._map(select)
+
+    def _map(self, func) -> "SignalFrame":
+        """Apply ``func`` to every column."""
+        changes = {
+            f.name: func(getattr(self, f.name))
+            for f in dataclasses.fields(self)
+            if f.name not in ("components", "sources")
+        }
+        changes["components"] = {
+            name: func(values) for name, values in self.components.items()
+        }
+        changes["sources"] = {
+            name: func(values) for name, values in self.sources.items()
+        }
+        return dataclasses.replace(self, **changes)
+
+    def signal(self, row: int) -> TradingSignal:
+        """
+        Build one row's TradingSignal.
+
+        Args:
+            row: Row position
+
+        Returns:
+            TradingSignal for that row
+        """
+        return TradingSignal(
+            symbol=self.symbols[row],
+            company_name=self.company_names[row],
+            signal_type=SIGNAL_ORDER[self.signal_codes[row]],
+            confidence=float(self.confidence[row]),
+            combined_score=float(self.combined_score[row]),
+            sentiment_score=SentimentScore(
+                value=float(self.sentiment[row]),
+                source_count=int(self.source_counts[row]),
+                sources=_dict_at(self.sources, row),
+            ),
+            technical_score=TechnicalScore(
+                value=float(self.technical[row]),
+                components=_dict_at(self.components, row),
+            ),
+            current_price=float(self.current_price[row]),
+            rsi=float(self.rsi[row]),
+            week_change=float(self.week_change[row]),
+            warnings=SignalWarning.messages(int(self.warnings[row])),
+            timestamp=self.timestamps[row].item(),
+        )
+
+    def __iter__(self) -> Iterator[TradingSignal]:
+        return (self.signal(row) for row in range(len(self)))
+
+    def to_signals(self) -> List[TradingSignal]:
+        """Build TradingSignal objects for every row."""
+        return list(self)
+
+    # Masks
+
+    @property
+    def buy_mask(self) -> np.ndarray:
+        """Mask of BUY and STRONG BUY signals."""
+        return self.signal_codes > _HOLD_CODE
+
+    @property
+    def sell_mask(self) -> np.ndarray:
+        """Mask of SELL and STRONG SELL signals."""
+        return self.signal_codes < _HOLD_CODE
+
+    @property
+    def hold_mask(self) -> np.ndarray:
+        """Mask of HOLD signals."""
+        return self.signal_codes == _HOLD_CODE
+
+    def mask(self, signal_type: SignalType) -> np.ndarray:
+        """Mask of rows with the given signal type."""
+        return self.signal_codes == SIGNAL_ORDER.index(signal_type)
+
+    def has_warning(self, flag: SignalWarning) -> np.ndarray:
+        """Mask of rows carrying a warning flag."""
+        return (self.warnings & flag) != 0
+
+    # Ordering
+
+    def _sort_key(self, by: str) -> np.ndarray:
+        if by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort signals by {by}")
+        return getattr(self, by)
+
+    def argsort(self, by: str = "combined_score", descending: bool = True):
+        """
+        Row order by a numeric column (stable, NaNs last).
+
+        Args:
+            by: Column name from SORT_COLUMNS
+            descending: Largest values first
+
+        Returns:
+            Row indices
+        """
+        key = self._sort_key(by)
+        if descending:
+            key = -key
+        return np.argsort(key, kind="stable")
+
+    def sort(
+        self, by: str = "combined_score", descending: bool = True
+    ) -> "SignalFrame":
+        """Get the frame sorted by a numeric column."""
+        return self[self.argsort(by, descending)]
+
+    def top(
+        self, k: int, by: str = "combined_score", descending: bool = True
+    ) -> "SignalFrame":
+        """
+        Get the ``k`` best rows by a numeric column, in order.
+
+        Uses a partial sort, so only the selected rows are fully
+        ordered.
+
+        Args:
+            k: Number of rows
+            by: Column name from SORT_COLUMNS
+            descending: Largest values first
+
+        Returns:
+            SignalFrame with at most ``k`` rows
+        """
+        if k >= len(self):
+            return self.sort(by, descending)
+        if k <= 0:
+            return self[:0]
+
+        key = self._sort_key(by)
+        if descending:
+            key = -key
+
+        # Keep every row tied with the k-th value so ties resolve by
+        # position, like a full stable sort
+        kth = np.partition(key, k - 1)[k - 1]
+        if np.isnan(kth):
+            return self.sort(by, descending)[:k]
+
+        candidates = np.flatnonzero(key <= kth)
+        order = candidates[np.argsort(key[candidates], kind="stable")]
+        return self[order[:k]]
+
+    # Aggregates
+
+    def counts(self) -> Dict[SignalType, int]:
+        """Number of signals per type, most bullish first."""
+        counts = np.bincount(self.signal_codes, minlength=len(SIGNAL_ORDER))
+        return {
+            signal_type: int(counts[code])
+            for code, signal_type in reversed(list(enumerate(SIGNAL_ORDER)))
+        }
+
+    def best(self, by: str = "combined_score") -> Optional[TradingSignal]:
+        """Get the signal with the highest value of a column."""
+        if not len(self):
+            return None
+
+        key = self._sort_key(by)
+        # All-NaN columns fall back to the first row, like max()
+        if np.isnan(key).all():
+            return self.signal(0)
+        return self.signal(int(np.nanargmax(key)))
+
+    @property
+    def signal_values(self) -> np.ndarray:
+        """Signal type label per row."""
+        return _SIGNAL_VALUES[self.signal_codes]
+
+    @property
+    def colors(self) -> np.ndarray:
+        """Signal color per row."""
+        return _SIGNAL_COLORS[self.signal_codes]
+
+    # Conversion
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Get numeric columns as a DataFrame indexed by symbol."""
+        return pd.DataFrame(
+            {
+                "company_name": self.company_names,
+                "signal": self.signal_values,
+                "confidence": self.confidence,
+                "combined_score": self.combined_score,
+                "sentiment": self.sentiment,
+                "source_count": self.source_counts,
+                "technical": self.technical,
+                "current_price": self.current_price,
+                "rsi": self.rsi,
+                "week_change": self.week_change,
+                "warnings": self.warnings,
+                "timestamp": self.timestamps,
+            },
+            index=pd.Index(self.symbols, name="symbol"),
+        )
+
+    def to_export_frame(self) -> pd.DataFrame:
+        """Get the formatted columns of ``TradingSignal.to_dict``."""
+        # Few distinct timestamps: format each once
+        unique, inverse = np.unique(self.timestamps, return_inverse=True)
+        timestamps = np.array(
+            [t.item().isoformat() for t in unique], dtype=object
+        )[inverse]
+
+        return pd.DataFrame(
+            {
+                "Symbol": self.symbols,
+                "Signal": self.signal_values,
+                "Confidence": np.char.mod("%.1f%%", self.confidence),
+                "Price": np.char.mod("$%.2f", self.current_price),
+                "Week_Change": np.char.mod("%+.2f%%", self.week_change),
+                "RSI": np.char.mod("%.1f", self.rsi),
+                "Sentiment": np.char.mod("%+.3f", self.sentiment),
+                "Technical": np.char.mod("%+.3f", self.technical),
+                "Combined": np.char.mod("%+.3f", self.combined_score),
+                "Timestamp": timestamps,
+            }
+        )
@@ -0,0 +1,373 @@
+"""Cache directory lifecycle management."""
+
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def is_readable_parquet(path: Path) -> bool:
+    """Check that a file is a readable parquet file."""
+    if path.suffix != ".parquet":
+        return False
+
+    try:
+        pd.read_parquet(path, columns=[])
+        return True
+    except Exception:
+        return False
+
+
+@dataclass
+class CacheEntry:
+    """Manifest record for one cache file."""
+
+    size: int
+    written_at: float
+    accessed_at: float
+
+
+@dataclass
+class CollectionReport:
+    """Outcome of a garbage collection pass."""
+
+    expired: List[str] = field(default_factory=list)
+    evicted: List[str] = field(default_factory=list)
+    orphans: List[str] = field(default_factory=list)
+    adopted: List[str] = field(default_factory=list)
+    freed_bytes: int = 0
+
+    @property
+    def removed(self) -> int:
+        """Number of files deleted."""
+        return len(self.expired) + len(self.evicted) + len(self.orphans)
+
+
+class CacheManager:
+    """
+    Manage a cache directory through a manifest index.
+
+    Features:
+    - Manifest of file size/write/access times, so lookups need no
+      ``glob`` or ``stat``
+    - Disk budget enforced by age- then LRU-based eviction
+    - Cleanup of the manager's own orphaned temp files and of records
+      whose file disappeared; other files are never deleted
+    - Exempt files owned by other components are never touched
+    - Optional periodic collection on a background thread
+
+    The owner calls ``stop()`` (or ``flush()``) on shutdown to persist
+    the latest access times.
+    """
+
+    MANIFEST = "manifest.json"
+    # Leftover temp files older than this are from crashed writers
+    TEMP_GRACE_SECONDS = 3600
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = 2 * 1024 * 1024 * 1024,
+        max_idle_days: float = 30,
+        flush_interval: float = 5.0,
+        validator: Callable[[Path], bool] = is_readable_parquet,
+        exempt: Iterable[str] = (),
+    ):
+        """
+        Initialize manager.
+
+        Args:
+            cache_dir: Directory to manage
+            max_bytes: Disk budget for cached files
+            max_idle_days: Files not accessed for this long are removed
+            flush_interval: Minimum seconds between manifest writes
+            validator: Decides whether unknown files found during
+                collection are adopted (True) or left alone (False)
+            exempt: Names of files in ``cache_dir`` that other
+                components own; collection leaves them alone
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_idle_seconds = max_idle_days * 86400
+        self.flush_interval = flush_interval
+        self.validator = validator
+        self.exempt = frozenset(exempt)
+        self.logger = logger.bind(component="CacheManager")
+
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_flush = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._entries: Dict[str, CacheEntry] = self._load_manifest()
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the manifest file."""
+        return self.cache_dir / self.MANIFEST
+
+    def _load_manifest(self) -> Dict[str, CacheEntry]:
+        """Read the manifest, rebuilding it from a scan if unusable."""
+        try:
+            with open(self.manifest_path) as f:
+                raw = json.load(f)
+            return {
+                name: CacheEntry(*values)
+                for name, values in raw["entries"].items()
+            }
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(
+                "Manifest unreadable, rebuilding", error=str(e)
+            )
+
+        return self._scan()
+
+    def _scan(self) -> Dict[str, CacheEntry]:
+        """Build manifest entries from the files on disk."""
+        entries = {}
+
+        for path in self.cache_dir.glob("*.parquet"):
+            stat = path.stat()
+            entries[path.name] = CacheEntry(
+                size=stat.st_size,
+                written_at=stat.st_mtime,
+                accessed_at=stat.st_mtime,
+            )
+
+        self._dirty = bool(entries)
+        return entries
+
+    def lookup(self, name: str) -> Optional[CacheEntry]:
+        """
+        Get the manifest record for a cache file.
+
+        Args:
+            name: File name inside the cache directory
+
+        Returns:
+            CacheEntry or None if the file is not cached
+        """
+        with self._lock:
+            return self._entries.get(name)
+
+    def record_write(self, name: str, size: int):
+        """Register a newly written cache file."""
+        now = time.time()
+        with self._lock:
+            self._entries[name] = CacheEntry(size, now, now)
+            self._dirty = True
+        self.maybe_flush()
+
+    def record_access(self, name: str):
+        """Mark a cache file as recently used."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                entry.accessed_at = time.time()
+                self._dirty = True
+
+    def remove(self, name: str) -> int:
+        """
+        Delete a cache file and its manifest record.
+
+        Args:
+            name: File name inside the cache directory
+
+        Returns:
+            Bytes freed
+        """
+        with self._lock:
+            entry = self._entries.pop(name, None)
+            self._dirty = True
+
+        (self.cache_dir / name).unlink(missing_ok=True)
+        return entry.size if entry else 0
+
+    def names(self, prefix: str = "") -> List[str]:
+        """List cached file names, optionally filtered by prefix."""
+        with self._lock:
+            return [name for name in self._entries if name.startswith(prefix)]
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of all cached files."""
+        with self._lock:
+            return sum(entry.size for entry in self._entries.values())
+
+    def flush(self):
+        """Write the manifest to disk if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            raw = {
+                "version": 1,
+                "entries": {
+                    name: [e.size, e.written_at, e.accessed_at]
+                    for name, e in self._entries.items()
+                },
+            }
+            self._dirty = False
+            self._last_flush = time.monotonic()
+
+        tmp_path = self.manifest_path.with_name(
+            f".{self.MANIFEST}.{uuid.uuid4().hex}.tmp"
+        )
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(raw, f, separators=(",", ":"))
+            os.replace(tmp_path, self.manifest_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            self.logger.warning("Manifest write failed", error=str(e))
+
+    def maybe_flush(self):
+        """Flush the manifest at most once per ``flush_interval``."""
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def _is_own_temp(self, name: str) -> bool:
+        """
+        Check whether a file is a temp file of an atomic cache write.
+
+        Writers use ``.{target}.{token}.tmp`` names; temps of exempt
+        targets belong to their owners.
+        """
+        if not (name.startswith(".") and name.endswith(".tmp")):
+            return False
+
+        target = name[1:].rsplit(".", 2)[0]
+        return target not in self.exempt
+
+    def _collect_orphans(self, report: CollectionReport):
+        """Remove stale temp files and adopt valid unknown files."""
+        now = time.time()
+
+        for path in self.cache_dir.iterdir():
+            name = path.name
+            if name == self.MANIFEST or name in self.exempt or path.is_dir():
+                continue
+
+            if self._is_own_temp(name):
+                stat = path.stat()
+                if now - stat.st_mtime > self.TEMP_GRACE_SECONDS:
+                    path.unlink(missing_ok=True)
+                    report.orphans.append(name)
+                    report.freed_bytes += stat.st_size
+                continue
+
+            if self.lookup(name) is not None:
+                continue
+
+            # Files that are not price stores belong to someone else
+            if not self.validator(path):
+                continue
+
+            stat = path.stat()
+            with self._lock:
+                self._entries[name] = CacheEntry(
+                    stat.st_size, stat.st_mtime, stat.st_mtime
+                )
+                self._dirty = True
+            report.adopted.append(name)
+
+        # Manifest records whose file disappeared
+        with self._lock:
+            missing = [
+                name
+                for name in self._entries
+                if not (self.cache_dir / name).exists()
+            ]
+            for name in missing:
+                del self._entries[name]
+                self._dirty = True
+
+    def collect(self, scan: bool = True) -> CollectionReport:
+        """
+        Run one garbage collection pass.
+
+        Args:
+            scan: Also scan the directory for orphaned/unknown files
+
+        Returns:
+            CollectionReport describing what was removed
+        """
+        report = CollectionReport()
+
+        if scan:
+            self._collect_orphans(report)
+
+        cutoff = time.time() - self.max_idle_seconds
+        with self._lock:
+            by_access = sorted(
+                self._entries.items(), key=lambda item: item[1].accessed_at
+            )
+            total = sum(entry.size for entry in self._entries.values())
+
+        for name, entry in by_access:
+            if entry.accessed_at < cutoff:
+                report.expired.append(name)
+            elif total > self.max_bytes:
+                report.evicted.append(name)
+            else:
+                break
+            total -= entry.size
+            report.freed_bytes += self.remove(name)
+
+        self.flush()
+
+        if report.removed or report.adopted:
+            self.logger.info(
+                "Cache collected",
+                expired=len(report.expired),
+                evicted=len(report.evicted),
+                orphans=len(report.orphans),
+                adopted=len(report.adopted),
+                freed_mb=f"{report.freed_bytes / 1024 / 1024:.1f}",
+            )
+
+        return report
+
+    def start(self, interval: float = 3600):
+        """
+        Run collection periodically on a daemon thread.
+
+        Args:
+            interval: Seconds between collection passes
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.collect()
+                except Exception as e:
+                    self.logger.error("Cache collection failed", error=str(e))
+
+        self._thread = threading.Thread(
+            target=run, name="cache-gc", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop background collection and flush the manifest."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
@@ -0,0 +1,106 @@
+"""Cache freshness policies for price data."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Optional
+
+from ..utils.market_calendar import MarketCalendar
+
+
+class FreshnessPolicy(ABC):
+    """Decide how long cached price data stays valid."""
+
+    @abstractmethod
+    def expires_at(self, fetched_at: datetime) -> datetime:
+        """
+        Get the time at which data fetched at ``fetched_at`` goes stale.
+
+        Args:
+            fetched_at: When the data was downloaded (tz-aware)
+
+        Returns:
+            Expiry time (tz-aware)
+        """
+        pass
+
+    def ttl(
+        self, fetched_at: datetime, now: Optional[datetime] = None
+    ) -> float:
+        """
+        Seconds of freshness left for data fetched at ``fetched_at``.
+
+        Args:
+            fetched_at: When the data was downloaded (tz-aware)
+            now: Reference time (defaults to now)
+
+        Returns:
+            Remaining seconds (0 if stale)
+        """
+        now = now or datetime.now().astimezone()
+        remaining = self.expires_at(fetched_at) - now
+        return max(remaining.total_seconds(), 0.0)
+
+
+class MaxAgePolicy(FreshnessPolicy):
+    """Data is valid for a fixed time after download."""
+
+    def __init__(self, max_age: timedelta = timedelta(hours=1)):
+        self.max_age = max_age
+
+    def expires_at(self, fetched_at: datetime) -> datetime:
+        """Expire a fixed age after download."""
+        return fetched_at + self.max_age
+
+
+class MarketSessionPolicy(FreshnessPolicy):
+    """
+    Exchange-session-aware freshness for daily bars.
+
+    - By default daily bars are treated as final only once a session
+      has closed and settled (``settle_delay``), so data stays valid
+      until the next session close
+    - With ``refresh_intraday`` the in-progress bar is refreshed during
+      sessions (and until the bar settles) every ``intraday_max_age``,
+      and data fetched outside sessions expires at the next open
+    """
+
+    def __init__(
+        self,
+        calendar: MarketCalendar,
+        intraday_max_age: timedelta = timedelta(minutes=15),
+        settle_delay: timedelta = timedelta(minutes=30),
+        refresh_intraday: bool = False,
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            calendar: Exchange session calendar
+            intraday_max_age: Validity of data fetched during a session
+            settle_delay: Time after the close before the bar is final
+            refresh_intraday: Refresh the in-progress bar during
+                sessions instead of once per session close
+        """
+        self.calendar = calendar
+        self.intraday_max_age = intraday_max_age
+        self.settle_delay = settle_delay
+        self.refresh_intraday = refresh_intraday
+
+    def expires_at(self, fetched_at: datetime) -> datetime:
+        """Expire at the next moment new bars can appear."""
+        fetched_at = fetched_at.astimezone(self.calendar.tz)
+        day = fetched_at.date()
+
+        if self.calendar.is_session_day(day):
+            open_, close = self.calendar.session_bounds(day)
+            settled = close + self.settle_delay
+
+            if open_ <= fetched_at < settled:
+                if not self.refresh_intraday and fetched_at < close:
+                    return settled
+                return min(fetched_at + self.intraday_max_age, settled)
+
+        if self.refresh_intraday:
+            return self.calendar.next_open(fetched_at)
+
+        return self.calendar.next_close(fetched_at) + self.settle_delay
@@ -1,105 +1,632 @@
 """Market data repository for caching and data management."""
 
+import os
+import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
 
+from ..models.market_data import PriceBatch
+from ..utils.cache import CacheStats, LRUCache
 from ..utils.logger import get_logger
+from ..utils.singleflight import SingleFlight
+from .cache_manager import CacheManager
+from .freshness import FreshnessPolicy, MaxAgePolicy
+from .sources import (
+    MarketDataSource,
+    YFinanceSource,
+    localize,
+    period_start,
+    project,
+)
+from .storage import (
+    STORE_SCHEMA,
+    TIMESTAMP_COLUMN,
+    from_storage,
+    normalize_bars,
+    to_storage,
+)
 
 logger = get_logger(__name__)
 
 
-class MarketDataRepository:
+class MarketDataRepository(MarketDataSource):
     """
     Repository for market data with caching.
+
+    Wraps an upstream MarketDataSource (yfinance by default) with a
+    parquet cache, and is itself a MarketDataSource.
     
     Features:
-    - Cache price data to disk
-    - Avoid redundant API calls
+    - In-memory LRU tier (bounded by bytes) over the disk store
+    - Append-only per-symbol bar store on disk (compact schema, zstd)
+    - Column projection on read
+    - Incremental refresh (only bars after the last cached one), with
+      a full re-download when a split or dividend changes adjusted prices
+    - Any period served by slicing the stored history
+    - Batched multi-symbol downloads
+    - Concurrent requests for the same data share one fetch
+    - Atomic cache writes (temp file + rename)
+    - Manifest-indexed disk cache with a size budget and GC
     - Data validation
     """
 
-    def __init__(self, cache_dir: Path = Path("./cache")):
+    # Store attribute recording how far back the bar history reaches
+    COVERAGE_KEY = "covered_from"
+    # Relative close difference on re-fetched bars that means the
+    # source re-adjusted the history (split or dividend)
+    ADJUSTMENT_TOLERANCE = 1e-4
+
+    def __init__(
+        self,
+        cache_dir: Path = Path("./cache"),
+        batch_size: int = 100,
+        max_age_hours: int = 1,
+        source: Optional[MarketDataSource] = None,
+        memory_cache_bytes: int = 256 * 1024 * 1024,
+        freshness: Optional[FreshnessPolicy] = None,
+        cache_manager: Optional[CacheManager] = None,
+    ):
         """
         Initialize repository.
 
         Args:
             cache_dir: Directory for cached data
+            batch_size: Maximum symbols per batched download request
+            max_age_hours: Age after which a bar store is topped up
+                (used when no freshness policy is given)
+            source: Upstream data source (defaults to yfinance)
+            memory_cache_bytes: Size budget of the in-memory tier
+                (0 disables it)
+            freshness: Policy deciding when cached bars go stale
+            cache_manager: Manifest/GC manager for ``cache_dir``
         """
+        super().__init__()
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.logger = logger.bind(repo="MarketData")
+        self.freshness = freshness or MaxAgePolicy(
+            timedelta(hours=max_age_hours)
+        )
+        self.source = source or YFinanceSource(batch_size=batch_size)
+        self.memory_cache = LRUCache(max_bytes=memory_cache_bytes)
+        self.cache_manager = cache_manager or CacheManager(cache_dir)
+        self._flights = SingleFlight()
+        # Column projections held in the memory tier
+        self._projections: set = set()
+        self.logger = logger.bind(repo="MarketData", source=self.source.name)
+
+    @property
+    def name(self) -> str:
+        """Source name."""
+        return f"cache({self.source.name})"
 
     def _get_cache_path(self, symbol: str, data_type: str) -> Path:
         """Get cache file path for symbol."""
         return self.cache_dir / f"{symbol}_{data_type}.parquet"
 
-    def _is_cache_valid(
-        self, cache_path: Path, max_age_hours: int = 1
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit/miss/eviction counters of the in-memory tier."""
+        return self.memory_cache.stats
+
+    def _cache_ttl(self, cache_path: Path) -> float:
+        """Seconds until a cached file goes stale (0 if missing/stale)."""
+        entry = self.cache_manager.lookup(cache_path.name)
+        if entry is None:
+            return 0.0
+
+        written_at = datetime.fromtimestamp(entry.written_at).astimezone()
+
+        return self.freshness.ttl(written_at)
+
+    def _lookup_store(
+        self, symbol: str, columns: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[Optional[pd.DataFrame], bool]:
+        """
+        Find the bar store for a symbol, memory tier first.
+
+        Args:
+            symbol: Stock ticker
+            columns: Columns to load (None for all)
+
+        Returns:
+            Tuple of (store or None, whether it is still fresh)
+        """
+        cache_path = self._get_cache_path(symbol, "bars")
+
+        # The full store can serve any projection
+        for key in dict.fromkeys([(symbol, None), (symbol, columns)]):
+            store = self.memory_cache.get(key)
+            if store is not None:
+                self.cache_manager.record_access(cache_path.name)
+                return project(store, columns), True
+
+        store = self._load_store(symbol, columns)
+        if store is None:
+            return None, False
+
+        ttl = self._cache_ttl(cache_path)
+        if ttl > 0:
+            if columns is not None:
+                self._projections.add(columns)
+            self.memory_cache.put((symbol, columns), store, ttl=ttl)
+            return store, True
+
+        return store, False
+
+    def _load_store(
+        self, symbol: str, columns: Optional[Tuple[str, ...]] = None
+    ) -> Optional[pd.DataFrame]:
+        """Load the stored bar history for a symbol."""
+        cache_path = self._get_cache_path(symbol, "bars")
+
+        if self.cache_manager.lookup(cache_path.name) is None:
+            return None
+
+        try:
+            read_columns = None
+            if columns is not None:
+                read_columns = [TIMESTAMP_COLUMN] + [
+                    c for c in columns if c in STORE_SCHEMA
+                ]
+            store = from_storage(
+                pd.read_parquet(cache_path, columns=read_columns)
+            )
+        except Exception as e:
+            # Missing or corrupt file: drop it so it is re-downloaded
+            self.logger.warning(
+                "Cache read failed", symbol=symbol, error=str(e)
+            )
+            self.cache_manager.remove(cache_path.name)
+            return None
+
+        self.cache_manager.record_access(cache_path.name)
+        return store
+
+    def _save_store(self, symbol: str, df: pd.DataFrame):
+        """Persist the bar history for a symbol atomically."""
+        cache_path = self._get_cache_path(symbol, "bars")
+        # Readers never observe a partially written file
+        tmp_path = cache_path.with_name(
+            f".{cache_path.name}.{uuid.uuid4().hex}.tmp"
+        )
+
+        try:
+            to_storage(df).to_parquet(
+                tmp_path, index=False, compression="zstd"
+            )
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, cache_path)
+            self.cache_manager.record_write(cache_path.name, size)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            self.logger.warning(
+                "Cache write failed", symbol=symbol, error=str(e)
+            )
+
+        for columns in tuple(self._projections):
+            self.memory_cache.invalidate((symbol, columns))
+        self.memory_cache.put(
+            (symbol, None),
+            df,
+            ttl=self.freshness.ttl(datetime.now().astimezone()),
+        )
+
+    def _covers(
+        self, store: pd.DataFrame, start: Optional[pd.Timestamp]
     ) -> bool:
-        """Check if cached data is still valid."""
-        if not cache_path.exists():
+        """Check whether a bar store reaches back to ``start``."""
+        covered_from = store.attrs.get(self.COVERAGE_KEY)
+        if covered_from is None:
+            return False
+        if covered_from == "max":
+            return True
+        if start is None:
             return False
+        return pd.Timestamp(covered_from) <= start
 
-        mod_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        age = datetime.now() - mod_time
+    def _merge(
+        self,
+        store: Optional[pd.DataFrame],
+        new: pd.DataFrame,
+        covered_from: Optional[pd.Timestamp | str] = None,
+    ) -> pd.DataFrame:
+        """
+        Append new bars to a store, replacing overlapping bars.
+
+        Args:
+            store: Existing bar history (or None)
+            new: Freshly downloaded bars
+            covered_from: Start of the window ``new`` was requested for
+
+        Returns:
+            Merged, deduplicated and sorted bar history
+        """
+        # Keep the store's index timezone; a new store takes the source's
+        if store is None or store.empty:
+            tz = new.index.tz
+            merged = normalize_bars(new, tz)
+            previous = None
+        else:
+            tz = store.index.tz if store.index.tz is not None else new.index.tz
+            merged = pd.concat(
+                [normalize_bars(store, tz), normalize_bars(new, tz)]
+            )
+            previous = store.attrs.get(self.COVERAGE_KEY)
+
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+
+        # Coverage only ever widens
+        candidates = [c for c in (previous, covered_from) if c is not None]
+        if "max" in candidates:
+            merged.attrs[self.COVERAGE_KEY] = "max"
+        elif candidates:
+            merged.attrs[self.COVERAGE_KEY] = str(
+                min(pd.Timestamp(c) for c in candidates).date()
+            )
+
+        return merged
+
+    def _slice(
+        self, store: pd.DataFrame, start: Optional[pd.Timestamp]
+    ) -> pd.DataFrame:
+        """Return the part of a bar store inside the requested period."""
+        if start is None:
+            return store
+        return store[store.index >= localize(start, store.index)]
+
+    def _refresh_start(self, store: pd.DataFrame) -> pd.Timestamp:
+        """
+        Date to resume downloading from.
+
+        The last two bars are re-fetched: the latest may still be in
+        progress, and the one before it is a settled bar to compare
+        against for adjustment changes.
+        """
+        bar = store.index[-2] if len(store) > 1 else store.index[-1]
+        return bar.tz_localize(None).normalize()
+
+    def _readjusted(self, store: pd.DataFrame, new: pd.DataFrame) -> bool:
+        """
+        Check whether re-fetched bars disagree with stored settled bars.
+
+        Adjusted prices are rewritten for the whole history after a
+        split or dividend, so appending to the old bars would mix two
+        adjustments.
+
+        Args:
+            store: Existing bar history
+            new: Bars downloaded from ``_refresh_start``
+
+        Returns:
+            True if an overlapping settled close differs beyond
+            ``ADJUSTMENT_TOLERANCE``
+        """
+        if "Close" not in store.columns or "Close" not in new.columns:
+            return False
+
+        # The latest stored bar may legitimately have changed
+        settled = store.index[:-1]
+        new = normalize_bars(new, store.index.tz)
+        common = settled.intersection(new.index)
+        if common.empty:
+            return False
 
-        return age < timedelta(hours=max_age_hours)
+        stored = store.loc[common, "Close"].to_numpy(dtype=float)
+        fetched = new.loc[common, "Close"].to_numpy(dtype=float)
+        return not np.allclose(
+            fetched, stored, rtol=self.ADJUSTMENT_TOLERANCE, atol=0
+        )
+
+    def _redownload(
+        self, symbol: str, store: pd.DataFrame, period: str
+    ) -> Optional[pd.DataFrame]:
+        """
+        Replace a store with a fresh download of its whole coverage.
+
+        Returns:
+            New store or None if the download returned nothing
+        """
+        covered_from = (
+            store.attrs.get(self.COVERAGE_KEY) or period_start(period) or "max"
+        )
+        start = None if covered_from == "max" else pd.Timestamp(covered_from)
+
+        self.logger.info(
+            "Price adjustment changed, re-downloading",
+            symbol=symbol,
+            covered_from=str(covered_from),
+        )
+        df = self.source.get_price_history(
+            symbol, period="max" if start is None else period, start=start
+        )
+
+        if df is None or df.empty:
+            return None
+
+        return self._merge(None, df, covered_from)
+
+    def _update_store(
+        self,
+        symbol: str,
+        store: Optional[pd.DataFrame],
+        new: pd.DataFrame,
+        period: str,
+        covered_from: Optional[pd.Timestamp | str],
+    ) -> Optional[pd.DataFrame]:
+        """
+        Merge downloaded bars into a store and persist it.
+
+        An incremental top-up (``covered_from`` None) whose overlap
+        shows re-adjusted prices triggers a full re-download instead.
+
+        Returns:
+            Updated store or None if a needed re-download failed
+        """
+        if (
+            covered_from is None
+            and store is not None
+            and not store.empty
+            and self._readjusted(store, new)
+        ):
+            merged = self._redownload(symbol, store, period)
+            if merged is None:
+                return None
+        else:
+            merged = self._merge(store, new, covered_from)
+
+        self._save_store(symbol, merged)
+        return merged
+
+    def _refresh_store(
+        self,
+        symbol: str,
+        store: Optional[pd.DataFrame],
+        period: str,
+        fetch_start: Optional[pd.Timestamp],
+        covered_from: Optional[pd.Timestamp | str],
+    ) -> Optional[pd.DataFrame]:
+        """
+        Download bars for a symbol and merge them into its store.
+
+        Returns:
+            Updated store or None if the download returned nothing
+        """
+        df = self.source.get_price_history(
+            symbol, period=period, start=fetch_start
+        )
+
+        if df is None or df.empty:
+            return None
+
+        merged = self._update_store(symbol, store, df, period, covered_from)
+        if merged is None:
+            return None
+
+        self.logger.debug(
+            "Fetched and cached", symbol=symbol, new_bars=len(df)
+        )
+
+        return merged
+
+    def _refresh_stores(
+        self,
+        symbols: List[str],
+        stores: Dict[str, Optional[pd.DataFrame]],
+        period: str,
+        fetch_start: Optional[pd.Timestamp],
+        covered_from: Optional[pd.Timestamp | str],
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download bars for several symbols and merge them into stores.
+
+        Returns:
+            Mapping of symbol to updated store for symbols with data
+        """
+        fetched = self.source.get_price_histories(
+            symbols, period=period, start=fetch_start
+        )
+        refreshed = {}
+
+        for symbol in symbols:
+            df = fetched.get(symbol)
+            if df is None or df.empty:
+                continue
+
+            merged = self._update_store(
+                symbol, stores[symbol], df, period, covered_from
+            )
+            if merged is not None:
+                refreshed[symbol] = merged
+
+        return refreshed
 
     def get_price_history(
         self,
         symbol: str,
         period: str = "6mo",
+        start: Optional[pd.Timestamp] = None,
+        columns: Optional[Sequence[str]] = None,
         use_cache: bool = True,
     ) -> Optional[pd.DataFrame]:
         """
         Get price history with caching.
 
+        Only bars after the last stored one are downloaded when the
+        store is stale; a period longer than the stored history triggers
+        a full download that is merged into the store.
+
         Args:
             symbol: Stock ticker
             period: History period
+            start: First date to return; overrides ``period`` when given
+            columns: Columns to return (None for all stored columns)
             use_cache: Whether to use cache
 
         Returns:
             DataFrame with price data or None
         """
-        cache_path = self._get_cache_path(symbol, f"prices_{period}")
-
-        # Try cache first
-        if use_cache and self._is_cache_valid(cache_path):
-            try:
-                df = pd.read_parquet(cache_path)
-                self.logger.debug("Loaded from cache", symbol=symbol)
-                return df
-            except Exception as e:
-                self.logger.warning(
-                    "Cache read failed", symbol=symbol, error=str(e)
-                )
+        requested = start
+        start = period_start(period) if start is None else pd.Timestamp(start)
+        columns = tuple(columns) if columns else None
+        store, fresh = (
+            self._lookup_store(symbol, columns)
+            if use_cache
+            else (None, False)
+        )
 
-        # Fetch fresh data
-        try:
-            stock = yf.Ticker(symbol)
-            df = stock.history(period=period)
+        covered = store is not None and self._covers(store, start)
+        if covered and fresh:
+            self.logger.debug("Loaded from cache", symbol=symbol)
+            return self._slice(store, start)
 
-            if df.empty:
-                self.logger.warning("No data available", symbol=symbol)
-                return None
+        # Merging needs every stored column; the file may be gone by now
+        if covered and columns is not None:
+            store = self._load_store(symbol)
+            covered = store is not None
 
-            # Cache the data
-            df.to_parquet(cache_path)
-            self.logger.debug("Fetched and cached", symbol=symbol)
+        if covered:
+            fetch_start = self._refresh_start(store)
+            covered_from = None
+        else:
+            fetch_start = requested
+            covered_from = "max" if start is None else start
 
-            return df
+        merged = self._flights.do(
+            ("history", symbol, period, fetch_start),
+            self._refresh_store,
+            symbol,
+            store,
+            period,
+            fetch_start,
+            covered_from,
+        )
 
-        except Exception as e:
-            self.logger.error(
-                "Failed to fetch data", symbol=symbol, error=str(e)
-            )
+        if merged is None:
+            if store is not None and not store.empty:
+                self.logger.warning("Serving stale cache", symbol=symbol)
+                return project(self._slice(store, start), columns)
+
+            self.logger.warning("No data available", symbol=symbol)
             return None
 
+        return project(self._slice(merged, start), columns)
+
+    def get_price_histories(
+        self,
+        symbols: Iterable[str],
+        period: str = "6mo",
+        start: Optional[pd.Timestamp] = None,
+        columns: Optional[Sequence[str]] = None,
+        use_cache: bool = True,
+    ) -> PriceBatch:
+        """
+        Get price history for many symbols with batched downloads.
+
+        Fresh stores are served from memory or disk. Stale stores are
+        topped up with one upstream batch request per resume date, and
+        symbols without enough stored history are downloaded for the
+        full period.
+
+        Args:
+            symbols: Stock tickers
+            period: History period
+            start: First date to return; overrides ``period`` when given
+            columns: Columns to return (None for all stored columns)
+            use_cache: Whether to use cache
+
+        Returns:
+            PriceBatch with frames and cache hit/fetch/miss report
+        """
+        requested = start
+        start = period_start(period) if start is None else pd.Timestamp(start)
+        columns = tuple(columns) if columns else None
+        batch = PriceBatch()
+        stores: Dict[str, Optional[pd.DataFrame]] = {}
+        # Download groups: resume date (or None for a full period fetch)
+        groups: Dict[Optional[pd.Timestamp], List[str]] = {}
+
+        for symbol in dict.fromkeys(symbols):
+            store, fresh = (
+                self._lookup_store(symbol, columns)
+                if use_cache
+                else (None, False)
+            )
+            covered = store is not None and self._covers(store, start)
+            if covered and fresh:
+                stores[symbol] = store
+                batch.frames[symbol] = self._slice(store, start)
+                batch.cache_hits.append(symbol)
+                continue
+
+            # Merging needs every stored column; the file may be gone
+            if covered and columns is not None:
+                store = self._load_store(symbol)
+                covered = store is not None
+            stores[symbol] = store
+
+            if covered:
+                groups.setdefault(self._refresh_start(store), []).append(
+                    symbol
+                )
+            else:
+                groups.setdefault(None, []).append(symbol)
+
+        for resume, pending in groups.items():
+            if resume is None:
+                fetch_start = requested
+                covered_from = "max" if start is None else start
+            else:
+                fetch_start = resume
+                covered_from = None
+
+            refreshed = self._flights.do(
+                ("histories", tuple(pending), period, fetch_start),
+                self._refresh_stores,
+                pending,
+                stores,
+                period,
+                fetch_start,
+                covered_from,
+            )
+
+            for symbol in pending:
+                store = stores[symbol]
+                merged = refreshed.get(symbol)
+
+                if merged is None:
+                    if store is not None and not store.empty:
+                        batch.frames[symbol] = project(
+                            self._slice(store, start), columns
+                        )
+                        batch.cache_hits.append(symbol)
+                    else:
+                        batch.missing.append(symbol)
+                    continue
+
+                batch.frames[symbol] = project(
+                    self._slice(merged, start), columns
+                )
+                batch.fetched.append(symbol)
+
+        self.cache_manager.flush()
+
+        self.logger.info(
+            "Price histories loaded",
+            cache_hits=len(batch.cache_hits),
+            fetched=len(batch.fetched),
+            missing=len(batch.missing),
+            memory_cache=self.memory_cache.stats.to_dict(),
+        )
+
+        if batch.missing:
+            self.logger.warning("No data available", symbols=batch.missing)
+
+        return batch
+
     def clear_cache(self, symbol: Optional[str] = None):
         """
         Clear cached data.
@@ -108,10 +635,16 @@ class MarketDataRepository:
             symbol: Specific symbol to clear, or None for all
         """
         if symbol:
-            for file in self.cache_dir.glob(f"{symbol}_*.parquet"):
-                file.unlink()
+            self.memory_cache.invalidate((symbol, None))
+            for columns in tuple(self._projections):
+                self.memory_cache.invalidate((symbol, columns))
+            for name in self.cache_manager.names(prefix=f"{symbol}_"):
+                self.cache_manager.remove(name)
             self.logger.info("Cache cleared", symbol=symbol)
         else:
-            for file in self.cache_dir.glob("*.parquet"):
-                file.unlink()
+            self.memory_cache.clear()
+            for name in self.cache_manager.names():
+                self.cache_manager.remove(name)
             self.logger.info("All cache cleared")
+
+        self.cache_manager.flush()
@@ -0,0 +1,337 @@
+"""Market data sources."""
+
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+import yfinance as yf
+
+from ..models.market_data import PriceBatch
+from ..utils.logger import get_logger
+from .storage import from_storage
+
+logger = get_logger(__name__)
+
+_PERIOD_PATTERN = re.compile(r"(\d+)(d|wk|mo|y)")
+_PERIOD_UNITS = {"d": "days", "wk": "weeks", "mo": "months", "y": "years"}
+
+
+def period_start(
+    period: str, now: Optional[datetime] = None
+) -> Optional[pd.Timestamp]:
+    """
+    Convert a yfinance-style period into its first calendar day.
+
+    Args:
+        period: Period string such as "5d", "6mo", "1y", "ytd" or "max"
+        now: Reference time (defaults to now)
+
+    Returns:
+        Start timestamp (tz-naive, midnight) or None for "max"
+    """
+    today = pd.Timestamp(now or datetime.now()).normalize()
+
+    if period == "max":
+        return None
+
+    if period == "ytd":
+        return today.replace(month=1, day=1)
+
+    match = _PERIOD_PATTERN.fullmatch(period)
+    if not match:
+        raise ValueError(f"Unsupported period: {period}")
+
+    amount, unit = match.groups()
+    return today - pd.DateOffset(**{_PERIOD_UNITS[unit]: int(amount)})
+
+
+def localize(ts: pd.Timestamp, index: pd.DatetimeIndex) -> pd.Timestamp:
+    """Make a naive timestamp comparable with a (possibly tz-aware) index."""
+    ts = pd.Timestamp(ts)
+    if index.tz is not None and ts.tzinfo is None:
+        return ts.tz_localize(index.tz)
+    return ts
+
+
+def project(
+    df: Optional[pd.DataFrame], columns: Optional[Sequence[str]]
+) -> Optional[pd.DataFrame]:
+    """Select the requested columns (all when ``columns`` is None)."""
+    if df is None or columns is None:
+        return df
+    return df[[c for c in columns if c in df.columns]]
+
+
+class MarketDataSource(ABC):
+    """Abstract base class for price history sources."""
+
+    def __init__(self):
+        """Initialize source logger."""
+        self.logger = logger.bind(source=self.__class__.__name__)
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Source name for logging."""
+        pass
+
+    @abstractmethod
+    def get_price_history(
+        self,
+        symbol: str,
+        period: str = "6mo",
+        start: Optional[pd.Timestamp] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get OHLCV price history for a symbol.
+
+        Args:
+            symbol: Stock ticker symbol
+            period: History period (e.g. "6mo")
+            start: First date to return; overrides ``period`` when given
+            columns: Columns to return (None for all)
+
+        Returns:
+            DataFrame indexed by bar timestamp or None if unavailable
+        """
+        pass
+
+    def get_price_histories(
+        self,
+        symbols: Iterable[str],
+        period: str = "6mo",
+        start: Optional[pd.Timestamp] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> PriceBatch:
+        """
+        Get price history for many symbols.
+
+        Sources with a native bulk endpoint should override this.
+
+        Args:
+            symbols: Stock ticker symbols
+            period: History period
+            start: First date to return; overrides ``period`` when given
+            columns: Columns to return (None for all)
+
+        Returns:
+            PriceBatch with one frame per available symbol
+        """
+        batch = PriceBatch()
+
+        for symbol in dict.fromkeys(symbols):
+            df = self.get_price_history(
+                symbol, period=period, start=start, columns=columns
+            )
+            if df is None:
+                batch.missing.append(symbol)
+            else:
+                batch.frames[symbol] = df
+                batch.fetched.append(symbol)
+
+        return batch
+
+
+class YFinanceSource(MarketDataSource):
+    """Price history from Yahoo Finance."""
+
+    def __init__(self, batch_size: int = 100):
+        """
+        Initialize source.
+
+        Args:
+            batch_size: Maximum symbols per batched download request
+        """
+        super().__init__()
+        self.batch_size = batch_size
+
+    @property
+    def name(self) -> str:
+        """Source name."""
+        return "yfinance"
+
+    def get_price_history(
+        self,
+        symbol: str,
+        period: str = "6mo",
+        start: Optional[pd.Timestamp] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Download price history for one symbol."""
+        window = {"start": start} if start is not None else {"period": period}
+
+        try:
+            df = yf.Ticker(symbol).history(**window)
+        except Exception as e:
+            self.logger.error(
+                "Failed to fetch data", symbol=symbol, error=str(e)
+            )
+            return None
+
+        if df.empty:
+            return None
+
+        return project(df, columns)
+
+    def _download_batch(
+        self,
+        symbols: List[str],
+        period: str,
+        start: Optional[pd.Timestamp],
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download price history for several symbols in one request.
+
+        Args:
+            symbols: Stock tickers
+            period: History period (ignored when ``start`` is given)
+            start: First date to download
+
+        Returns:
+            Mapping of symbol to its price DataFrame
+        """
+        window = {"start": start} if start is not None else {"period": period}
+        data = yf.download(
+            tickers=symbols,
+            group_by="ticker",
+            auto_adjust=True,
+            actions=True,
+            threads=True,
+            progress=False,
+            **window,
+        )
+
+        frames = {}
+        if data is None or data.empty:
+            return frames
+
+        grouped = isinstance(data.columns, pd.MultiIndex)
+        available = (
+            set(data.columns.get_level_values(0)) if grouped else set()
+        )
+
+        for symbol in symbols:
+            if grouped:
+                if symbol not in available:
+                    continue
+                df = data[symbol]
+            elif len(symbols) == 1:
+                df = data
+            else:
+                continue
+
+            # Rows are aligned across tickers; drop dates this symbol lacks
+            df = df.dropna(subset=["Close"])
+            if not df.empty:
+                frames[symbol] = df.copy()
+
+        return frames
+
+    def get_price_histories(
+        self,
+        symbols: Iterable[str],
+        period: str = "6mo",
+        start: Optional[pd.Timestamp] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> PriceBatch:
+        """Download price history in groups of ``batch_size`` symbols."""
+        batch = PriceBatch()
+        pending = list(dict.fromkeys(symbols))
+
+        for offset in range(0, len(pending), self.batch_size):
+            chunk = pending[offset : offset + self.batch_size]
+
+            try:
+                frames = self._download_batch(chunk, period, start)
+            except Exception as e:
+                self.logger.error(
+                    "Batch download failed", symbols=len(chunk), error=str(e)
+                )
+                frames = {}
+
+            for symbol in chunk:
+                if symbol in frames:
+                    batch.frames[symbol] = project(frames[symbol], columns)
+                    batch.fetched.append(symbol)
+                else:
+                    batch.missing.append(symbol)
+
+        return batch
+
+
+class ReplaySource(MarketDataSource):
+    """
+    Price history replayed from recorded files.
+
+    Reads ``{symbol}.parquet``, ``{symbol}_bars.parquet`` or
+    ``{symbol}.csv`` from a directory, so a cache directory or an
+    exported dataset can drive the pipeline offline. Periods are
+    measured back from the last recorded bar rather than from now.
+    """
+
+    PATTERNS = ("{symbol}.parquet", "{symbol}_bars.parquet", "{symbol}.csv")
+
+    def __init__(self, directory: Path):
+        """
+        Initialize source.
+
+        Args:
+            directory: Directory containing recorded price files
+        """
+        super().__init__()
+        self.directory = Path(directory)
+
+    @property
+    def name(self) -> str:
+        """Source name."""
+        return "replay"
+
+    def _read(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Read the recorded history for a symbol."""
+        for pattern in self.PATTERNS:
+            path = self.directory / pattern.format(symbol=symbol)
+            if not path.exists():
+                continue
+
+            if path.suffix == ".csv":
+                df = pd.read_csv(path, index_col=0)
+                df.index = pd.to_datetime(df.index, utc=True)
+                return df
+
+            return from_storage(pd.read_parquet(path))
+
+        return None
+
+    def get_price_history(
+        self,
+        symbol: str,
+        period: str = "6mo",
+        start: Optional[pd.Timestamp] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Load recorded price history for one symbol."""
+        try:
+            df = self._read(symbol)
+        except Exception as e:
+            self.logger.error(
+                "Failed to read recording", symbol=symbol, error=str(e)
+            )
+            return None
+
+        if df is None or df.empty:
+            return None
+
+        df = df.sort_index()
+
+        if start is None:
+            as_of = df.index[-1].tz_localize(None)
+            start = period_start(period, now=as_of)
+
+        if start is not None:
+            df = df[df.index >= localize(start, df.index)]
+
+        return project(df, columns) if not df.empty else None
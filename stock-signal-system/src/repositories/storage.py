@@ -0,0 +1,104 @@
+"""On-disk layout of cached price bars."""
+
+from datetime import tzinfo
+from typing import Optional
+
+import pandas as pd
+
+# Compact schema for price bars; the index is stored as int64 epoch ns
+STORE_SCHEMA = {
+    "Open": "float32",
+    "High": "float32",
+    "Low": "float32",
+    "Close": "float32",
+    "Volume": "int64",
+}
+
+TIMESTAMP_COLUMN = "ts"
+# Frame attribute holding the bar index timezone
+TZ_KEY = "tz"
+
+
+def normalize_bars(
+    df: pd.DataFrame, tz: Optional[tzinfo | str] = None
+) -> pd.DataFrame:
+    """
+    Reduce price bars to the compact store schema.
+
+    Sources disagree on the index timezone (yfinance's bulk download
+    returns naive dates, single-ticker history exchange-local ones), so
+    the index is aligned to ``tz``: naive bars are localized to it and
+    aware bars converted. With ``tz`` None, aware bars keep their wall
+    time and drop the timezone.
+
+    Args:
+        df: Bars as returned by a data source
+        tz: Timezone for the bar index (None for tz-naive)
+
+    Returns:
+        Bars with only schema columns, cast to their storage dtypes
+    """
+    columns = [c for c in STORE_SCHEMA if c in df.columns]
+    out = df[columns].copy()
+
+    index = pd.DatetimeIndex(out.index)
+    if tz is None:
+        index = index.tz_localize(None)
+    elif index.tz is None:
+        index = index.tz_localize(tz)
+    else:
+        index = index.tz_convert(tz)
+    out.index = index.rename(df.index.name)
+
+    if "Volume" in out:
+        out["Volume"] = out["Volume"].fillna(0)
+
+    out = out.astype({c: STORE_SCHEMA[c] for c in columns})
+    out.attrs = dict(df.attrs)
+    return out
+
+
+def to_storage(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert bars to their on-disk layout.
+
+    Args:
+        df: Normalized bars indexed by timestamp
+
+    Returns:
+        Frame with an int64 epoch-ns timestamp column and no index
+    """
+    index = df.index.as_unit("ns")
+    out = df.reset_index(drop=True)
+    out.insert(0, TIMESTAMP_COLUMN, index.asi8)
+    out.attrs = {
+        **df.attrs,
+        TZ_KEY: str(index.tz) if index.tz is not None else None,
+    }
+    return out
+
+
+def from_storage(raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rebuild bars from their on-disk layout.
+
+    Args:
+        raw: Frame as read from a store file
+
+    Returns:
+        Bars indexed by (timezone-restored) timestamp
+    """
+    if TIMESTAMP_COLUMN not in raw.columns:
+        return raw
+
+    tz = raw.attrs.get(TZ_KEY)
+    index = pd.DatetimeIndex(
+        pd.to_datetime(
+            raw.pop(TIMESTAMP_COLUMN), unit="ns", utc=tz is not None
+        )
+    )
+    if tz is not None:
+        index = index.tz_convert(tz)
+
+    raw.index = index.rename("Date")
+    return raw
@@ -0,0 +1,180 @@
+"""Bounded-concurrency scheduling of per-symbol analysis."""
+
+import asyncio
+import contextlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Provider semaphores of the run in progress. They are created per run
+# because asyncio primitives belong to the event loop they were first
+# used on, and a scheduler may outlive several ``asyncio.run`` calls.
+_run_semaphores: ContextVar[Optional[Dict[str, asyncio.Semaphore]]] = (
+    ContextVar("run_semaphores", default=None)
+)
+
+
+@dataclass
+class SymbolTiming:
+    """Wall-clock timing of one symbol's analysis."""
+
+    symbol: str
+    queued_ms: float
+    duration_ms: float
+    ok: bool
+
+
+@dataclass
+class ScheduleResult(Generic[T]):
+    """Results of a scheduled run, in input order."""
+
+    results: List[Optional[T]] = field(default_factory=list)
+    timings: List[SymbolTiming] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def slowest(self) -> List[SymbolTiming]:
+        """Timings sorted from slowest to fastest."""
+        return sorted(
+            self.timings, key=lambda t: t.duration_ms, reverse=True
+        )
+
+
+class AnalysisScheduler:
+    """
+    Run per-symbol analysis concurrently under concurrency limits.
+
+    Features:
+    - Global limit on symbols analyzed at once
+    - Per-provider limits on concurrent requests, shared by all symbols
+    - Results returned in input order with per-symbol timing
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        provider_limits: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Maximum symbols analyzed at once
+            provider_limits: Maximum concurrent requests per provider
+                name; providers not listed are only bounded globally
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.provider_limits = dict(provider_limits or {})
+        self.logger = logger.bind(component="AnalysisScheduler")
+
+    def limit(self, provider: str) -> AsyncContextManager:
+        """
+        Get the concurrency guard for a provider.
+
+        Limits are shared by the symbols of one ``run()``; calls made
+        outside a run are not limited.
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            Async context manager holding one of the provider's slots
+        """
+        semaphores = _run_semaphores.get()
+        if semaphores is None:
+            return contextlib.nullcontext()
+
+        return semaphores.get(provider) or contextlib.nullcontext()
+
+    async def run(
+        self,
+        symbols: Sequence[str],
+        analyze: Callable[[str], Awaitable[Optional[T]]],
+    ) -> ScheduleResult[T]:
+        """
+        Analyze symbols concurrently.
+
+        Args:
+            symbols: Symbols in the order results should be returned
+            analyze: Coroutine function analyzing one symbol; returning
+                None or raising marks the symbol as failed
+
+        Returns:
+            ScheduleResult aligned with ``symbols``
+        """
+        gate = asyncio.Semaphore(self.max_concurrency)
+        token = _run_semaphores.set(
+            {
+                provider: asyncio.Semaphore(limit)
+                for provider, limit in self.provider_limits.items()
+                if limit
+            }
+        )
+        start = time.perf_counter()
+
+        async def run_one(symbol: str):
+            queued = time.perf_counter()
+            async with gate:
+                began = time.perf_counter()
+                try:
+                    result = await analyze(symbol)
+                except Exception as e:
+                    self.logger.error(
+                        "Analysis failed", symbol=symbol, error=str(e)
+                    )
+                    result = None
+
+            timing = SymbolTiming(
+                symbol=symbol,
+                queued_ms=(began - queued) * 1000,
+                duration_ms=(time.perf_counter() - began) * 1000,
+                ok=result is not None,
+            )
+            self.logger.debug(
+                "Symbol analyzed",
+                symbol=symbol,
+                queued_ms=f"{timing.queued_ms:.0f}",
+                duration_ms=f"{timing.duration_ms:.0f}",
+                ok=timing.ok,
+            )
+            return result, timing
+
+        try:
+            outcomes = await asyncio.gather(
+                *(run_one(symbol) for symbol in symbols)
+            )
+        finally:
+            _run_semaphores.reset(token)
+
+        report = ScheduleResult(
+            results=[result for result, _ in outcomes],
+            timings=[timing for _, timing in outcomes],
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        )
+
+        self.logger.info(
+            "Watchlist analyzed",
+            symbols=len(symbols),
+            succeeded=sum(t.ok for t in report.timings),
+            elapsed_ms=f"{report.elapsed_ms:.0f}",
+            concurrency=self.max_concurrency,
+        )
+
+        return report
@@ -1,9 +1,11 @@
 """Base class for sentiment providers."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Mapping, Optional
 
+from ...config.settings import APIConfig
 from ...utils.logger import get_logger
+from .matching import SymbolMatcher
 
 logger = get_logger(__name__)
 
@@ -11,7 +13,7 @@ logger = get_logger(__name__)
 class SentimentProvider(ABC):
     """Abstract base class for sentiment data providers."""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: APIConfig):
         """Initialize provider with configuration."""
         self.config = config
         self.logger = logger.bind(provider=self.__class__.__name__)
@@ -32,6 +34,24 @@ class SentimentProvider(ABC):
         """
         pass
 
+    async def prefetch(
+        self,
+        company_names: Mapping[str, str],
+        matcher: Optional[SymbolMatcher] = None,
+    ):
+        """
+        Fetch data for a whole watchlist ahead of per-symbol calls.
+
+        Providers that can serve many symbols per request override this
+        and answer later ``fetch_sentiment`` calls from the results.
+
+        Args:
+            company_names: Company name per symbol
+            matcher: Compiled matcher for attributing fetched text to
+                symbols (built from ``company_names`` if not given)
+        """
+        return None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -1,34 +1,44 @@
 """Finnhub sentiment provider."""
 
+import asyncio
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 
-import requests
+import aiohttp
 from tenacity import retry, stop_after_attempt, wait_exponential
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from ...config.settings import FinnhubConfig
+from ...utils.decorators import single_flight
+from ...utils.http import HttpClient
 from .base import SentimentProvider
 
 
 class FinnhubSentimentProvider(SentimentProvider):
     """Sentiment provider using Finnhub API."""
 
-    def __init__(self, api_key: str, config: dict):
+    def __init__(
+        self,
+        api_key: str,
+        config: Optional[FinnhubConfig] = None,
+        http: Optional[HttpClient] = None,
+    ):
         """
         Initialize Finnhub client.
 
         Args:
             api_key: Finnhub API key
-            config: Provider configuration
+            config: Provider configuration (defaults if not given)
+            http: Shared HTTP client (defaults to a private one)
         """
+        config = config or FinnhubConfig()
         super().__init__(config)
         
         self.api_key = api_key
-        self.base_url = config.get(
-            "base_url", "https://finnhub.io/api/v1"
-        )
-        self.timeout = config.get("timeout", 30)
-        self.max_articles = config.get("max_articles", 20)
+        self.base_url = config.base_url
+        self.timeout = config.timeout
+        self.max_articles = config.max_articles
+        self.http = http or HttpClient(timeout=self.timeout)
         self.analyzer = SentimentIntensityAnalyzer()
 
     @property
@@ -36,6 +46,7 @@ class FinnhubSentimentProvider(SentimentProvider):
         """Provider name."""
         return "Finnhub"
 
+    @single_flight
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -63,7 +74,7 @@ class FinnhubSentimentProvider(SentimentProvider):
             )
 
             # Fetch company news
-            response = requests.get(
+            articles = await self.http.get_json(
                 f"{self.base_url}/company-news",
                 params={
                     "symbol": symbol,
@@ -74,9 +85,6 @@ class FinnhubSentimentProvider(SentimentProvider):
                 timeout=self.timeout,
             )
 
-            response.raise_for_status()
-            articles = response.json()
-
             # Analyze articles
             for article in articles[: self.max_articles]:
                 headline = article.get("headline", "")
@@ -94,7 +102,7 @@ class FinnhubSentimentProvider(SentimentProvider):
                 symbol=symbol,
             )
 
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             self.logger.error(
                 "Failed to fetch Finnhub data", symbol=symbol, error=str(e)
             )
@@ -118,23 +126,28 @@ class FinnhubSentimentProviderV2(SentimentProvider):
     - Considers news relevance
     """
 
-    def __init__(self, api_key: str, config: dict):
+    def __init__(
+        self,
+        api_key: str,
+        config: Optional[FinnhubConfig] = None,
+        http: Optional[HttpClient] = None,
+    ):
+        config = config or FinnhubConfig()
         super().__init__(config)
         
         self.api_key = api_key
-        self.base_url = config.get(
-            "base_url", "https://finnhub.io/api/v1"
-        )
-        self.timeout = config.get("timeout", 30)
-        self.max_articles = config.get("max_articles", 20)
-        self.use_social_sentiment = config.get("use_social_sentiment", True)
+        self.base_url = config.base_url
+        self.timeout = config.timeout
+        self.max_articles = config.max_articles
+        self.use_social_sentiment = config.use_social_sentiment
+        self.http = http or HttpClient(timeout=self.timeout)
         self.analyzer = SentimentIntensityAnalyzer()
 
     @property
     def name(self) -> str:
         return "Finnhub_Enhanced"
 
-    def _fetch_news_sentiment(self, symbol: str) -> List[float]:
+    async def _fetch_news_sentiment(self, symbol: str) -> List[float]:
         """Fetch sentiment from company news."""
         sentiments = []
 
@@ -144,7 +157,7 @@ class FinnhubSentimentProviderV2(SentimentProvider):
                 "%Y-%m-%d"
             )
 
-            response = requests.get(
+            articles = await self.http.get_json(
                 f"{self.base_url}/company-news",
                 params={
                     "symbol": symbol,
@@ -155,9 +168,6 @@ class FinnhubSentimentProviderV2(SentimentProvider):
                 timeout=self.timeout,
             )
 
-            response.raise_for_status()
-            articles = response.json()
-
             for article in articles[: self.max_articles]:
                 headline = article.get("headline", "")
                 summary = article.get("summary", "")
@@ -174,7 +184,7 @@ class FinnhubSentimentProviderV2(SentimentProvider):
 
         return sentiments
 
-    def _fetch_social_sentiment(self, symbol: str) -> List[float]:
+    async def _fetch_social_sentiment(self, symbol: str) -> List[float]:
         """
         Fetch social sentiment from Finnhub.
         
@@ -187,15 +197,12 @@ class FinnhubSentimentProviderV2(SentimentProvider):
 
         try:
             # Get social sentiment (Twitter, Reddit, etc.)
-            response = requests.get(
+            data = await self.http.get_json(
                 f"{self.base_url}/stock/social-sentiment",
                 params={"symbol": symbol, "token": self.api_key},
                 timeout=self.timeout,
             )
 
-            response.raise_for_status()
-            data = response.json()
-
             # Finnhub provides sentiment scores
             if "twitter" in data:
                 for item in data["twitter"]:
@@ -217,9 +224,9 @@ class FinnhubSentimentProviderV2(SentimentProvider):
                         normalized_score = (score - 0.5) * 2
                         sentiments.append(normalized_score)
 
-        except requests.exceptions.HTTPError as e:
+        except aiohttp.ClientResponseError as e:
             # Social sentiment might require premium subscription
-            if e.response.status_code == 403:
+            if e.status == 403:
                 self.logger.warning(
                     "Social sentiment requires premium subscription"
                 )
@@ -238,6 +245,7 @@ class FinnhubSentimentProviderV2(SentimentProvider):
 
         return sentiments
 
+    @single_flight
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -246,15 +254,12 @@ class FinnhubSentimentProviderV2(SentimentProvider):
         self, symbol: str, company_name: str
     ) -> List[float]:
         """Fetch combined sentiment from news and social data."""
-        all_sentiments = []
-
-        # Fetch news sentiment
-        news_sentiment = self._fetch_news_sentiment(symbol)
-        all_sentiments.extend(news_sentiment)
-
-        # Fetch social sentiment
-        social_sentiment = self._fetch_social_sentiment(symbol)
-        all_sentiments.extend(social_sentiment)
+        # News and social sentiment are independent requests
+        news_sentiment, social_sentiment = await asyncio.gather(
+            self._fetch_news_sentiment(symbol),
+            self._fetch_social_sentiment(symbol),
+        )
+        all_sentiments = news_sentiment + social_sentiment
 
         self.logger.info(
             f"Fetched {len(all_sentiments)} total Finnhub sentiments "
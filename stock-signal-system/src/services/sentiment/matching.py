@@ -0,0 +1,173 @@
+"""Attribute fetched text to the symbols it mentions."""
+
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+# Tickers that are also common words or Reddit/finance jargon; they only
+# match as $cashtags (or through their company name and aliases)
+AMBIGUOUS_TICKERS = frozenset(
+    """
+    A ALL AM AN ANY ARE AT BE BIG CAN CAR CASH CEO DD EOD EPS EV FOR FUN
+    GO GOOD HAS HE HOLD IT KEY LOW MAN NEW NOW ON ONE OPEN OR OUT PLAY
+    REAL RUN SEE SO TRUE TV UK US USA WELL YOU YOLO
+    """.split()
+)
+
+# Match kinds
+TICKER = 0  # bare ticker: case-sensitive, uppercase in the text
+CASHTAG = 1  # $TICKER in any case
+NAME = 2  # company name or alias in any case
+
+Pattern = Tuple[int, str, int]  # (length, symbol, kind)
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _lower(text: str) -> str:
+    """Lowercase without changing the text's length."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters lowercase to several; keep those as they are
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class SymbolMatcher:
+    """
+    Find watchlist symbols mentioned in text.
+
+    All tickers, $cashtags, company names and aliases are compiled into
+    one Aho-Corasick automaton, so a text is scanned once regardless of
+    how many symbols are watched. Matches must start and end on word
+    boundaries. Bare tickers match only as written in uppercase and,
+    if ambiguous (common words such as ALL, or single letters), only
+    as $cashtags. Names and aliases match in any case.
+    """
+
+    def __init__(
+        self,
+        company_names: Mapping[str, str],
+        aliases: Optional[Mapping[str, Iterable[str]]] = None,
+        ambiguous: Iterable[str] = AMBIGUOUS_TICKERS,
+    ):
+        """
+        Compile matcher.
+
+        Args:
+            company_names: Company name per symbol (a name equal to the
+                symbol adds nothing beyond the ticker)
+            aliases: Extra names per symbol (products, former names)
+            ambiguous: Tickers that only match as $cashtags
+        """
+        self.symbols = list(company_names)
+        ambiguous = set(ambiguous)
+
+        # Trie: goto transitions, failure links and outputs per state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Pattern]] = [[]]
+
+        for symbol in self.symbols:
+            ticker = symbol.upper()
+            self._add(f"${ticker}", symbol, CASHTAG)
+            if ticker not in ambiguous and len(ticker) > 1:
+                self._add(ticker, symbol, TICKER)
+
+            names = [company_names[symbol], *(aliases or {}).get(symbol, ())]
+            for name in names:
+                name = name.strip()
+                if name and name.upper() != ticker:
+                    self._add(name, symbol, NAME)
+
+        self._link()
+
+    def _add(self, term: str, symbol: str, kind: int):
+        state = 0
+        for char in _lower(term):
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((len(term), symbol, kind))
+
+    def _link(self):
+        """Build failure links breadth-first and merge outputs."""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[
+                    self._fail[child]
+                ]
+
+    def match(self, text: str) -> Set[str]:
+        """
+        Get the symbols mentioned in a text.
+
+        Args:
+            text: Headline, description or post text
+
+        Returns:
+            Matched symbols
+        """
+        found: Set[str] = set()
+        if not text:
+            return found
+
+        goto, fail, out = self._goto, self._fail, self._out
+        size = len(text)
+        state = 0
+
+        for end, char in enumerate(_lower(text)):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for length, symbol, kind in out[state]:
+                if symbol in found:
+                    continue
+
+                start = end - length + 1
+                if start > 0:
+                    before = text[start - 1]
+                    if _is_word(before) or (kind == TICKER and before == "$"):
+                        continue
+                if end + 1 < size and _is_word(text[end + 1]):
+                    continue
+                if kind == TICKER and not text[start:end + 1].isupper():
+                    continue
+
+                found.add(symbol)
+
+        return found
+
+    def match_many(self, texts: Sequence[str]) -> List[Set[str]]:
+        """
+        Match several texts.
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            Matched symbols per text
+        """
+        return [self.match(text) for text in texts]
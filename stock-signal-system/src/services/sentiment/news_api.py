@@ -1,30 +1,259 @@
 """NewsAPI sentiment provider."""
 
+import asyncio
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List, Mapping, Optional, Tuple
 
-from newsapi import NewsApiClient
 from tenacity import retry, stop_after_attempt, wait_exponential
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from ...config.settings import NewsAPIConfig
+from ...utils.decorators import single_flight
+from ...utils.http import HttpClient
 from .base import SentimentProvider
+from .matching import SymbolMatcher
 
 
 class NewsAPISentimentProvider(SentimentProvider):
-    """Sentiment provider using NewsAPI."""
+    """
+    Sentiment provider using NewsAPI.
 
-    def __init__(self, api_key: str, config: dict):
-        """Initialize NewsAPI client."""
+    Several symbols share one OR query, and returned articles are
+    attributed back to symbols by the tickers and company names in
+    their title and description, so a watchlist costs a few requests
+    rather than one per symbol.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        config: Optional[NewsAPIConfig] = None,
+        http: Optional[HttpClient] = None,
+    ):
+        """
+        Initialize NewsAPI client.
+
+        Args:
+            api_key: NewsAPI key
+            config: Provider configuration (defaults if not given)
+            http: Shared HTTP client (defaults to a private one)
+        """
+        config = config or NewsAPIConfig()
         super().__init__(config)
-        self.client = NewsApiClient(api_key=api_key)
+        self.api_key = api_key
+        self.base_url = config.base_url
+        self.timeout = config.timeout
+        self.max_articles = config.max_articles
+        self.max_query_length = config.max_query_length
+        self.page_size = config.page_size
+        self.max_pages = config.max_pages
+        self.max_results = config.max_results
+        self.http = http or HttpClient(timeout=self.timeout)
         self.analyzer = SentimentIntensityAnalyzer()
-        self.max_articles = config.get("max_articles", 30)
+        self._prefetched: Dict[str, List[float]] = {}
 
     @property
     def name(self) -> str:
         """Provider name."""
         return "NewsAPI"
 
+    @staticmethod
+    def _query_terms(symbol: str, company_name: str) -> str:
+        """Search terms for one symbol."""
+        if not company_name or company_name == symbol:
+            return symbol
+        return f'"{company_name}" OR {symbol}'
+
+    def build_queries(
+        self, company_names: Mapping[str, str]
+    ) -> List[Tuple[List[str], str]]:
+        """
+        Pack symbols into OR queries within the query length limit.
+
+        Args:
+            company_names: Company name per symbol
+
+        Returns:
+            (symbols, query) pairs covering every symbol once
+        """
+        queries = []
+        symbols: List[str] = []
+        query = ""
+
+        for symbol, company_name in company_names.items():
+            terms = self._query_terms(symbol, company_name)
+            packed = f"{query} OR {terms}" if query else terms
+
+            if query and len(packed) > self.max_query_length:
+                queries.append((symbols, query))
+                symbols, packed = [], terms
+
+            symbols.append(symbol)
+            query = packed
+
+        if query:
+            queries.append((symbols, query))
+
+        return queries
+
+    async def _search(
+        self,
+        company_names: Mapping[str, str],
+        query: str,
+        matcher: Optional[SymbolMatcher] = None,
+    ) -> Tuple[Dict[str, List[str]], bool]:
+        """
+        Run one query and collect article texts per symbol.
+
+        Pages are only requested while some symbol still has fewer than
+        ``max_articles`` articles, more results remain and the plan's
+        ``max_results`` allows it. A failing later page ends the search
+        with the articles already collected.
+
+        Args:
+            company_names: Company name per symbol in the query
+            query: NewsAPI ``q`` expression
+            matcher: Matcher covering at least the query's symbols
+
+        Returns:
+            Article texts per symbol, and whether every result of the
+            query was read
+
+        Raises:
+            aiohttp.ClientError: The first page failed
+            asyncio.TimeoutError: The first page timed out
+        """
+        from_date = (datetime.now() - timedelta(days=3)).strftime(
+            "%Y-%m-%d"
+        )
+        # A single-symbol query needs no attribution
+        if len(company_names) > 1:
+            matcher = matcher or SymbolMatcher(company_names)
+        else:
+            matcher = None
+        page_size = self.page_size if matcher else self.max_articles
+        texts: Dict[str, List[str]] = {s: [] for s in company_names}
+        seen = set()
+        received = 0
+        exhausted = False
+
+        pages = max(1, min(self.max_pages, self.max_results // page_size))
+
+        for page in range(1, pages + 1):
+            try:
+                data = await self.http.get_json(
+                    f"{self.base_url}/everything",
+                    params={
+                        "q": query,
+                        "from": from_date,
+                        "language": "en",
+                        "pageSize": page_size,
+                        "page": page,
+                    },
+                    headers={"X-Api-Key": self.api_key},
+                    timeout=self.timeout,
+                )
+            except Exception as e:
+                if page == 1:
+                    raise
+                self.logger.warning(
+                    "News page failed, keeping earlier pages",
+                    page=page,
+                    error=str(e),
+                )
+                break
+
+            articles = data.get("articles", [])
+            received += len(articles)
+
+            for article in articles:
+                url = article.get("url")
+                if url in seen:
+                    continue
+                seen.add(url)
+
+                text = (
+                    f"{article.get('title') or ''} "
+                    f"{article.get('description') or ''}"
+                )
+                symbols = matcher.match(text) if matcher else texts.keys()
+                for symbol in symbols:
+                    if symbol not in texts:
+                        continue
+                    if len(texts[symbol]) < self.max_articles:
+                        texts[symbol].append(text)
+
+            exhausted = len(articles) < page_size or received >= data.get(
+                "totalResults", 0
+            )
+            if exhausted or all(
+                len(t) >= self.max_articles for t in texts.values()
+            ):
+                break
+
+        return texts, exhausted
+
+    def _score(self, texts: List[str]) -> List[float]:
+        """Score article texts."""
+        return [
+            self.analyzer.polarity_scores(text)["compound"] for text in texts
+        ]
+
+    async def prefetch(
+        self,
+        company_names: Mapping[str, str],
+        matcher: Optional[SymbolMatcher] = None,
+    ):
+        """
+        Fetch articles for a whole watchlist with packed queries.
+
+        A symbol's articles are kept only if they are complete: it has
+        ``max_articles`` of them, or the query read every result. Others
+        (crowded out by busier symbols in the same query) fall back to
+        their own query in ``fetch_sentiment``.
+
+        Args:
+            company_names: Company name per symbol
+            matcher: Matcher for attributing articles to symbols
+        """
+        queries = self.build_queries(company_names)
+        matcher = matcher or SymbolMatcher(company_names)
+
+        results = await asyncio.gather(
+            *(
+                self._search(
+                    {symbol: company_names[symbol] for symbol in symbols},
+                    query,
+                    matcher,
+                )
+                for symbols, query in queries
+            ),
+            return_exceptions=True,
+        )
+
+        for (symbols, _), result in zip(queries, results):
+            if isinstance(result, Exception):
+                # These symbols fall back to their own query later
+                self.logger.error(
+                    "Failed to prefetch news",
+                    symbols=len(symbols),
+                    error=str(result),
+                )
+                continue
+
+            texts, exhausted = result
+            for symbol, symbol_texts in texts.items():
+                if exhausted or len(symbol_texts) >= self.max_articles:
+                    self._prefetched[symbol] = self._score(symbol_texts)
+
+        self.logger.info(
+            "Prefetched news",
+            symbols=len(company_names),
+            complete=len(self._prefetched),
+            requests=len(queries),
+        )
+
+    @single_flight
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -33,32 +262,26 @@ class NewsAPISentimentProvider(SentimentProvider):
         self, symbol: str, company_name: str
     ) -> List[float]:
         """Fetch sentiment from news articles."""
+        prefetched = self._prefetched.pop(symbol, None)
+        if prefetched is not None:
+            return prefetched
+
         sentiments = []
 
         try:
-            from_date = (
-                datetime.now() - timedelta(days=3)
-            ).strftime("%Y-%m-%d")
-
-            articles = self.client.get_everything(
-                q=f'"{company_name}" OR {symbol}',
-                from_param=from_date,
-                language="en",
-                page_size=self.max_articles,
-            )["articles"]
-
-            for article in articles:
-                text = (
-                    f"{article['title']} {article.get('description', '')}"
-                )
-                score = self.analyzer.polarity_scores(text)["compound"]
-                sentiments.append(score)
+            texts, _ = await self._search(
+                {symbol: company_name},
+                self._query_terms(symbol, company_name),
+            )
+            sentiments = self._score(texts[symbol])
 
             self.logger.info(
                 f"Fetched {len(sentiments)} articles", symbol=symbol
             )
 
         except Exception as e:
-            self.logger.error(f"Failed to fetch news", error=str(e))
+            self.logger.error(
+                "Failed to fetch news", symbol=symbol, error=str(e)
+            )
 
         return sentiments
@@ -1,25 +1,60 @@
 """Reddit sentiment provider."""
 
+import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import List
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
 
 import asyncpraw
 from tenacity import retry, stop_after_attempt, wait_exponential
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from ...config.settings import RedditConfig
+from ...utils.decorators import single_flight
 from .base import SentimentProvider
+from .matching import SymbolMatcher
 
 
-class RedditSentimentProvider(SentimentProvider):
-    """Sentiment provider using Reddit API."""
+class RedditProviderBase(SentimentProvider):
+    """
+    Shared Reddit client, search and comment loading.
+
+    Posts found by several search queries are only processed once, and
+    comment trees load concurrently (bounded per provider) within a
+    per-symbol time budget.
+
+    With ``crawl_watchlist`` enabled, ``prefetch`` instead reads the
+    subreddits' new posts and comments once per cycle and routes each
+    item to the symbols it mentions, so API calls scale with subreddit
+    activity rather than with the number of symbols.
+    """
 
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         user_agent: str,
-        config: dict,
+        config: Optional[RedditConfig] = None,
     ):
+        """
+        Initialize Reddit client.
+
+        Args:
+            client_id: Reddit API client ID
+            client_secret: Reddit API client secret
+            user_agent: User agent string
+            config: Provider configuration (defaults if not given)
+        """
+        config = config or RedditConfig()
         super().__init__(config)
 
         self.client = asyncpraw.Reddit(
@@ -29,16 +64,255 @@ class RedditSentimentProvider(SentimentProvider):
         )
 
         self.analyzer = SentimentIntensityAnalyzer()
-        self.subreddits = config.get(
-            "subreddits", ["wallstreetbets", "stocks", "investing"]
+        self.subreddits = config.subreddits
+        self.post_limit = config.post_limit or 30
+        self.time_budget = config.time_budget_seconds
+        self.comment_slots = asyncio.Semaphore(config.comment_concurrency)
+
+        self.crawl_watchlist = config.crawl_watchlist
+        self.crawl_limit = config.crawl_limit
+        self.crawl_window = timedelta(
+            hours=config.crawl_window_hours
+        ).total_seconds()
+        # Crawled posts and comments by kind and id, and their routing
+        self._crawled: Dict[tuple, Any] = {}
+        self._routed: Optional[Dict[str, list]] = None
+
+    def _deadline(self) -> float:
+        """Event loop time at which a symbol's budget runs out."""
+        return asyncio.get_running_loop().time() + self.time_budget
+
+    async def _within(
+        self, calls: Sequence[Awaitable[Any]], deadline: float
+    ) -> List[Optional[Any]]:
+        """
+        Run calls concurrently until a deadline.
+
+        Args:
+            calls: Awaitables to run
+            deadline: Event loop time to stop waiting at
+
+        Returns:
+            Result per call, None for calls that failed or did not
+            finish in time (those are cancelled)
+        """
+        tasks = [asyncio.ensure_future(call) for call in calls]
+        if not tasks:
+            return []
+
+        timeout = max(0.0, deadline - asyncio.get_running_loop().time())
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+        if pending:
+            self.logger.warning(
+                "Reddit time budget exceeded",
+                skipped=len(pending),
+                total=len(tasks),
+            )
+
+        results = []
+        for task in tasks:
+            if task not in done:
+                results.append(None)
+            elif task.exception() is not None:
+                self.logger.warning(
+                    "Reddit request failed", error=str(task.exception())
+                )
+                results.append(None)
+            else:
+                results.append(task.result())
+        return results
+
+    async def _search(
+        self, queries: Sequence[str], deadline: float
+    ) -> List[asyncpraw.models.Submission]:
+        """
+        Search the subreddits for several queries at once.
+
+        Args:
+            queries: Search terms
+            deadline: Event loop time to stop waiting at
+
+        Returns:
+            Posts in query order, each post only once
+        """
+        subreddit = await self.client.subreddit("+".join(self.subreddits))
+
+        async def search(query: str) -> list:
+            return [
+                post
+                async for post in subreddit.search(
+                    query, time_filter="week", limit=self.post_limit
+                )
+            ]
+
+        results = await self._within(
+            [search(query) for query in queries], deadline
         )
-        self.post_limit = config.get("post_limit", 30)
+
+        posts = {}
+        for found in results:
+            for post in found or ():
+                posts.setdefault(post.id, post)
+        return list(posts.values())
+
+    async def _load_comments(self, post_id: str, symbol: str) -> list:
+        """
+        Load a post's comment tree (top level and replies).
+
+        Args:
+            post_id: Reddit submission id
+            symbol: Symbol the post was found for (for logging)
+
+        Returns:
+            Flattened comments, or an empty list on failure
+        """
+        async with self.comment_slots:
+            try:
+                submission = await self.client.submission(id=post_id)
+                await submission.load()
+                await submission.comments.replace_more(limit=0)
+                return submission.comments.list()
+            except Exception as comment_error:
+                self.logger.warning(
+                    "Failed to process comments",
+                    symbol=symbol,
+                    post_id=post_id,
+                    error=str(comment_error),
+                )
+                return []
+
+    async def _post_comments(
+        self, posts: Sequence, symbol: str, deadline: float
+    ) -> List[list]:
+        """
+        Load comments for many posts concurrently.
+
+        Args:
+            posts: Posts to load comments for
+            symbol: Symbol the posts were found for
+            deadline: Event loop time to stop waiting at
+
+        Returns:
+            Comments per post (empty for posts without comments or
+            whose comments did not load in time)
+        """
+        with_comments = [
+            row for row, post in enumerate(posts) if post.num_comments > 0
+        ]
+        loaded = await self._within(
+            [
+                self._load_comments(posts[row].id, symbol)
+                for row in with_comments
+            ],
+            deadline,
+        )
+
+        comments: List[list] = [[] for _ in posts]
+        for row, result in zip(with_comments, loaded):
+            comments[row] = result or []
+        return comments
+
+    @staticmethod
+    def _item_text(item) -> str:
+        """Text of a crawled post or comment."""
+        if hasattr(item, "title"):
+            return f"{item.title} {item.selftext or ''}"
+        return item.body or ""
+
+    async def _stream(
+        self, listing: Callable, kind: str, since: float
+    ) -> int:
+        """
+        Read a newest-first listing until items already crawled.
+
+        Args:
+            listing: Subreddit listing method (``new`` or ``comments``)
+            kind: Item kind used in crawl keys
+            since: Creation time of the newest item crawled before
+
+        Returns:
+            Number of new items
+        """
+        count = 0
+        async for item in listing(limit=self.crawl_limit):
+            if item.created_utc <= since:
+                break
+            self._crawled[(kind, item.id)] = item
+            count += 1
+        return count
+
+    async def prefetch(
+        self,
+        company_names: Mapping[str, str],
+        matcher: Optional[SymbolMatcher] = None,
+    ):
+        """
+        Crawl new subreddit posts and comments for the whole watchlist.
+
+        Only items newer than the previous crawl are requested; items
+        older than ``crawl_window_hours`` are dropped.
+
+        Args:
+            company_names: Company name per symbol
+            matcher: Matcher for routing items to symbols
+        """
+        if not self.crawl_watchlist:
+            return
+
+        subreddit = await self.client.subreddit("+".join(self.subreddits))
+        newest = {"post": 0.0, "comment": 0.0}
+        for (kind, _), item in self._crawled.items():
+            newest[kind] = max(newest[kind], item.created_utc)
+
+        counts = await self._within(
+            [
+                self._stream(subreddit.new, "post", newest["post"]),
+                self._stream(subreddit.comments, "comment", newest["comment"]),
+            ],
+            self._deadline(),
+        )
+
+        cutoff = time.time() - self.crawl_window
+        self._crawled = {
+            key: item
+            for key, item in self._crawled.items()
+            if item.created_utc >= cutoff
+        }
+
+        matcher = matcher or SymbolMatcher(company_names)
+        routed: Dict[str, list] = {symbol: [] for symbol in company_names}
+        for item in self._crawled.values():
+            for symbol in matcher.match(self._item_text(item)):
+                if symbol in routed:
+                    routed[symbol].append(item)
+        self._routed = routed
+
+        self.logger.info(
+            "Crawled Reddit",
+            new_items=sum(count or 0 for count in counts),
+            items=len(self._crawled),
+            symbols_mentioned=sum(1 for items in routed.values() if items),
+        )
+
+    def _crawled_items(self, symbol: str) -> Optional[list]:
+        """Crawled items mentioning a symbol (None if not crawled)."""
+        if self._routed is None:
+            return None
+        return self._routed.get(symbol)
+
+
+class RedditSentimentProvider(RedditProviderBase):
+    """Sentiment provider using Reddit API."""
 
     @property
     def name(self) -> str:
         """Provider name."""
         return "Reddit"
 
+    @single_flight
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -56,52 +330,34 @@ class RedditSentimentProvider(SentimentProvider):
         Returns:
             List of sentiment scores (-1 to +1)
         """
+        crawled = self._crawled_items(symbol)
+        if crawled is not None:
+            return [
+                self.analyzer.polarity_scores(text)["compound"]
+                for text in map(self._item_text, crawled)
+            ]
+
         sentiments = []
 
         try:
-            subreddit = await self.client.subreddit(
-                "+".join(self.subreddits)
+            deadline = self._deadline()
+            posts = await self._search(
+                [symbol, f"${symbol}", company_name], deadline
             )
+            comments = await self._post_comments(posts, symbol, deadline)
 
-            search_queries = [symbol, f"${symbol}", company_name]
+            for post, post_comments in zip(posts, comments):
+                # Analyze post title and text
+                text = f"{post.title} {post.selftext or ''}"
+                score = self.analyzer.polarity_scores(text)["compound"]
+                sentiments.append(score)
 
-            for query in search_queries:
-                async for post in subreddit.search(
-                    query, time_filter="week", limit=self.post_limit
-                ):
-                    # Analyze post title and text
-                    text = f"{post.title} {post.selftext or ''}"
-                    score = self.analyzer.polarity_scores(text)["compound"]
-                    sentiments.append(score)
-
-                    # Load and analyze comments
-                    if post.num_comments > 0:
-                        try:
-                            # Load submission to get comments
-                            submission = await self.client.submission(
-                                id=post.id
-                            )
-                            await submission.load()
-                            await submission.comments.replace_more(limit=0)
-
-                            # Get comment list
-                            comments = submission.comments.list()
-                            
-                            for comment in comments[:5]:
-                                if hasattr(comment, "body") and comment.body:
-                                    comment_score = (
-                                        self.analyzer.polarity_scores(
-                                            comment.body
-                                        )["compound"]
-                                    )
-                                    sentiments.append(comment_score)
-                        except Exception as comment_error:
-                            self.logger.warning(
-                                "Failed to process comments",
-                                symbol=symbol,
-                                post_id=post.id,
-                                error=str(comment_error),
-                            )
+                for comment in post_comments[:5]:
+                    if hasattr(comment, "body") and comment.body:
+                        comment_score = self.analyzer.polarity_scores(
+                            comment.body
+                        )["compound"]
+                        sentiments.append(comment_score)
 
             self.logger.info(
                 f"Fetched {len(sentiments)} Reddit posts/comments",
@@ -116,7 +372,7 @@ class RedditSentimentProvider(SentimentProvider):
         return sentiments
 
 
-class RedditSentimentProviderV2(SentimentProvider):
+class RedditSentimentProviderV2(RedditProviderBase):
     """
     Enhanced Reddit provider with filtering and ranking.
 
@@ -131,23 +387,14 @@ class RedditSentimentProviderV2(SentimentProvider):
         client_id: str,
         client_secret: str,
         user_agent: str,
-        config: dict,
+        config: Optional[RedditConfig] = None,
     ):
-        super().__init__(config)
-
-        self.client = asyncpraw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=user_agent,
-        )
+        config = config or RedditConfig()
+        super().__init__(client_id, client_secret, user_agent, config)
 
-        self.analyzer = SentimentIntensityAnalyzer()
-        self.subreddits = config.get(
-            "subreddits", ["wallstreetbets", "stocks", "investing"]
-        )
-        self.post_limit = config.get("post_limit", 50)
-        self.min_upvotes = config.get("min_upvotes", 10)
-        self.max_post_age_days = config.get("max_post_age_days", 7)
+        self.post_limit = config.post_limit or 50
+        self.min_upvotes = config.min_upvotes
+        self.max_post_age_days = config.max_post_age_days
 
     @property
     def name(self) -> str:
@@ -175,6 +422,35 @@ class RedditSentimentProviderV2(SentimentProvider):
         score = self.analyzer.polarity_scores(text)["compound"]
         return score * weight, weight
 
+    def _score_crawled(self, items: list) -> List[float]:
+        """
+        Score crawled items with the same weights as search.
+
+        Posts must be recent and are weighted by upvote ratio; comments
+        get half weight. Crawled posts are read from ``new`` and never
+        re-read, so their score is that of a fresh post and
+        ``min_upvotes`` is not applied.
+        """
+        weighted_scores = []
+        weights = []
+
+        for item in items:
+            if hasattr(item, "title"):
+                if not self._is_post_recent(item):
+                    continue
+                weight = min(item.upvote_ratio, 1.0)
+            else:
+                weight = 0.5
+
+            score, w = self._calculate_weighted_sentiment(
+                self._item_text(item), weight
+            )
+            weighted_scores.append(score)
+            weights.append(w)
+
+        return [s / w for s, w in zip(weighted_scores, weights) if w > 0]
+
+    @single_flight
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -183,78 +459,52 @@ class RedditSentimentProviderV2(SentimentProvider):
         self, symbol: str, company_name: str
     ) -> List[float]:
         """Fetch weighted sentiment from Reddit."""
+        crawled = self._crawled_items(symbol)
+        if crawled is not None:
+            return self._score_crawled(crawled)
+
         weighted_scores = []
         weights = []
 
         try:
-            subreddit = await self.client.subreddit(
-                "+".join(self.subreddits)
+            deadline = self._deadline()
+            posts = await self._search(
+                [symbol, f"${symbol}", f"{symbol} stock", company_name],
+                deadline,
             )
 
-            search_terms = [
-                symbol,
-                f"${symbol}",
-                f"{symbol} stock",
-                company_name,
+            # Filter by recency and popularity
+            posts = [
+                post
+                for post in posts
+                if self._is_post_recent(post)
+                and post.score >= self.min_upvotes
             ]
-
-            for term in search_terms:
-                async for post in subreddit.search(
-                    term, time_filter="week", limit=self.post_limit
-                ):
-                    # Filter by recency and popularity
-                    if not self._is_post_recent(post):
-                        continue
-
-                    if post.score < self.min_upvotes:
-                        continue
-
-                    # Weight by upvote ratio (0.5 to 1.0)
-                    weight = min(post.upvote_ratio, 1.0)
-
-                    # Analyze post
-                    text = f"{post.title} {post.selftext or ''}"
-                    score, w = self._calculate_weighted_sentiment(
-                        text, weight
-                    )
-                    weighted_scores.append(score)
-                    weights.append(w)
-
-                    # Load and analyze comments
-                    if post.num_comments > 0:
-                        try:
-                            # Load submission to get comments
-                            submission = await self.client.submission(
-                                id=post.id
-                            )
-                            await submission.load()
-                            await submission.comments.replace_more(limit=0)
-
-                            # Get and sort comments
-                            comments = submission.comments.list()
-                            top_comments = sorted(
-                                comments,
-                                key=lambda x: getattr(x, "score", 0),
-                                reverse=True,
-                            )[:5]
-
-                            for comment in top_comments:
-                                if hasattr(comment, "body") and comment.body:
-                                    comment_weight = weight * 0.5
-                                    c_score, c_w = (
-                                        self._calculate_weighted_sentiment(
-                                            comment.body, comment_weight
-                                        )
-                                    )
-                                    weighted_scores.append(c_score)
-                                    weights.append(c_w)
-                        except Exception as comment_error:
-                            self.logger.warning(
-                                "Failed to process comments",
-                                symbol=symbol,
-                                post_id=post.id,
-                                error=str(comment_error),
-                            )
+            comments = await self._post_comments(posts, symbol, deadline)
+
+            for post, post_comments in zip(posts, comments):
+                # Weight by upvote ratio (0.5 to 1.0)
+                weight = min(post.upvote_ratio, 1.0)
+
+                # Analyze post
+                text = f"{post.title} {post.selftext or ''}"
+                score, w = self._calculate_weighted_sentiment(text, weight)
+                weighted_scores.append(score)
+                weights.append(w)
+
+                top_comments = sorted(
+                    post_comments,
+                    key=lambda x: getattr(x, "score", 0),
+                    reverse=True,
+                )[:5]
+
+                for comment in top_comments:
+                    if hasattr(comment, "body") and comment.body:
+                        c_score, c_w = self._calculate_weighted_sentiment(
+                            comment.body, weight * 0.5
+                        )
+                        weighted_scores.append(c_score)
+                        weights.append(c_w)
 
             # Calculate weighted average
             if weighted_scores and weights:
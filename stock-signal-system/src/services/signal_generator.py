@@ -1,15 +1,19 @@
 """Signal generation service."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 
 from ..config.settings import Settings, ThresholdsConfig, WeightsConfig
-from ..models.indicators import TechnicalIndicators
+from ..models.indicators import IndicatorPanel, TechnicalIndicators
 from ..models.signal import (
+    SIGNAL_ORDER,
     SentimentScore,
+    SignalBatch,
     SignalType,
+    SignalWarning,
     TechnicalScore,
+    TechnicalScoreBatch,
     TradingSignal,
 )
 from ..utils.logger import get_logger
@@ -20,6 +24,11 @@ logger = get_logger(__name__)
 class SignalGenerator:
     """Generate trading signals from analysis data."""
 
+    # Indicators read for signal fields and warnings
+    REQUIRED_INDICATORS = frozenset(
+        {"price", "rsi", "week_change", "volume_ratio"}
+    )
+
     def __init__(
         self,
         thresholds: ThresholdsConfig,
@@ -97,16 +106,16 @@ class SignalGenerator:
         warnings = []
 
         if indicators.is_overbought():
-            warnings.append("⚠️ Overbought (RSI > 70)")
+            warnings.append(SignalWarning.OVERBOUGHT.message)
 
         if indicators.is_oversold():
-            warnings.append("✅ Oversold (RSI < 30)")
+            warnings.append(SignalWarning.OVERSOLD.message)
 
         if sentiment_score.source_count < 10:
-            warnings.append("⚠️ Low sentiment data")
+            warnings.append(SignalWarning.LOW_SENTIMENT.message)
 
         if not indicators.has_high_volume(threshold=0.5):
-            warnings.append("⚠️ Low volume")
+            warnings.append(SignalWarning.LOW_VOLUME.message)
 
         return warnings
 
@@ -169,3 +178,108 @@ class SignalGenerator:
         )
 
         return signal
+
+    @property
+    def threshold_edges(self) -> np.ndarray:
+        """Lower bounds of SELL, HOLD, BUY and STRONG_BUY, ascending."""
+        return np.array(
+            [
+                self.thresholds.sell,
+                self.thresholds.hold,
+                self.thresholds.buy,
+                self.thresholds.strong_buy,
+            ]
+        )
+
+    def generate_batch(
+        self,
+        symbols: Sequence[str],
+        company_names: Sequence[str],
+        sentiment_values: np.ndarray,
+        source_counts: np.ndarray,
+        technical: TechnicalScoreBatch,
+        indicators: IndicatorPanel,
+        sentiment_sources: Optional[List[Dict[str, float]]] = None,
+    ) -> SignalBatch:
+        """
+        Generate signals for many symbols at once.
+
+        Produces the same values as calling ``generate`` per symbol,
+        without building TradingSignal objects up front.
+
+        Args:
+            symbols: Stock ticker symbols
+            company_names: Company names aligned with ``symbols``
+            sentiment_values: Sentiment score per symbol
+            source_counts: Sentiment source count per symbol
+            technical: Technical scores aligned with ``symbols``
+            indicators: Indicators aligned with ``symbols``
+            sentiment_sources: Per-provider sentiment per symbol, used
+                when materializing signals
+
+        Returns:
+            SignalBatch with signal codes, confidence and warning flags
+        """
+        sentiment_values = np.asarray(sentiment_values, dtype=float)
+        source_counts = np.asarray(source_counts)
+
+        if not (
+            len(symbols)
+            == len(company_names)
+            == len(sentiment_values)
+            == len(source_counts)
+            == len(technical)
+            == len(indicators)
+        ):
+            raise ValueError("Batch inputs must have one entry per symbol")
+
+        combined = np.clip(
+            sentiment_values * self.weights.sentiment
+            + technical.values * self.weights.technical,
+            -1,
+            1,
+        )
+
+        # Number of thresholds reached indexes SIGNAL_ORDER; NaN scores
+        # reach none, like the scalar comparison chain
+        codes = np.searchsorted(self.threshold_edges, combined, side="right")
+        codes[np.isnan(combined)] = 0
+
+        rsi = indicators.rsi
+        warnings = (
+            np.where(rsi > 70, SignalWarning.OVERBOUGHT, 0)
+            | np.where(rsi < 30, SignalWarning.OVERSOLD, 0)
+            | np.where(source_counts < 10, SignalWarning.LOW_SENTIMENT, 0)
+            | np.where(
+                ~(indicators.volume_ratio > 0.5), SignalWarning.LOW_VOLUME, 0
+            )
+        ).astype(np.uint8)
+
+        batch = SignalBatch(
+            symbols=list(symbols),
+            company_names=list(company_names),
+            signal_codes=codes.astype(np.int8),
+            confidence=np.abs(combined) * 100,
+            combined_score=combined,
+            sentiment_values=sentiment_values,
+            source_counts=source_counts,
+            technical=technical,
+            current_price=indicators.price,
+            rsi=rsi,
+            week_change=indicators.week_change,
+            warnings=warnings,
+            sentiment_sources=sentiment_sources,
+        )
+
+        self.logger.info(
+            "Signals generated",
+            symbols=len(batch),
+            **{
+                signal_type.name.lower(): int(count)
+                for signal_type, count in zip(
+                    SIGNAL_ORDER, np.bincount(codes, minlength=5)
+                )
+            },
+        )
+
+        return batch
@@ -1,10 +1,12 @@
 """Technical analysis scoring."""
 
+from typing import FrozenSet
+
 import numpy as np
 
 from ...config.settings import TechnicalWeightsConfig
-from ...models.indicators import TechnicalIndicators
-from ...models.signal import TechnicalScore
+from ...models.indicators import IndicatorPanel, TechnicalIndicators
+from ...models.signal import TechnicalScore, TechnicalScoreBatch
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,6 +15,16 @@ logger = get_logger(__name__)
 class TechnicalAnalyzer:
     """Analyze technical indicators and generate scores."""
 
+    # Indicators each weighted component reads
+    COMPONENT_INDICATORS = {
+        "moving_averages": ("price", "ma_20", "ma_50", "ma_200"),
+        "rsi": ("rsi",),
+        "momentum": ("week_change", "month_change"),
+        "volume": ("volume_ratio",),
+        "macd": ("macd_hist",),
+        "bollinger": ("bb_percent_b",),
+    }
+
     def __init__(self, weights: TechnicalWeightsConfig):
         """
         Initialize analyzer with weights.
@@ -23,6 +35,24 @@ class TechnicalAnalyzer:
         self.weights = weights
         self.logger = logger.bind(analyzer="Technical")
 
+    @property
+    def enabled_components(self) -> tuple[str, ...]:
+        """Components with a non-zero weight."""
+        return tuple(
+            component
+            for component in self.COMPONENT_INDICATORS
+            if getattr(self.weights, component)
+        )
+
+    @property
+    def required_indicators(self) -> FrozenSet[str]:
+        """Indicators the enabled components consume."""
+        return frozenset(
+            name
+            for component in self.enabled_components
+            for name in self.COMPONENT_INDICATORS[component]
+        )
+
     def analyze_moving_averages(
         self, indicators: TechnicalIndicators
     ) -> float:
@@ -110,6 +140,38 @@ class TechnicalAnalyzer:
 
         return 0.0
 
+    def analyze_macd(self, indicators: TechnicalIndicators) -> float:
+        """
+        Analyze MACD histogram direction.
+
+        Returns:
+            Score contribution from MACD
+        """
+        hist = indicators.value("macd_hist")
+
+        if hist > 0:
+            return self.weights.macd
+        elif hist < 0:
+            return -self.weights.macd
+
+        return 0.0
+
+    def analyze_bollinger(self, indicators: TechnicalIndicators) -> float:
+        """
+        Analyze price position within the Bollinger bands.
+
+        Returns:
+            Score contribution from Bollinger bands
+        """
+        percent_b = indicators.value("bb_percent_b")
+
+        if percent_b < 0:  # Below lower band - bullish
+            return self.weights.bollinger
+        elif percent_b > 1:  # Above upper band - bearish
+            return -self.weights.bollinger
+
+        return 0.0
+
     def analyze(
         self, indicators: TechnicalIndicators
     ) -> TechnicalScore:
@@ -124,27 +186,106 @@ class TechnicalAnalyzer:
         """
         self.logger.debug("Analyzing technical indicators")
 
-        # Calculate component scores
-        ma_score = self.analyze_moving_averages(indicators)
-        rsi_score = self.analyze_rsi(indicators)
-        momentum_score = self.analyze_momentum(indicators)
-        volume_score = self.analyze_volume(indicators)
-
-        # Total score
-        total_score = ma_score + rsi_score + momentum_score + volume_score
-
-        # Clip to [-1, 1] range
-        total_score = np.clip(total_score, -1, 1)
-
+        # Calculate component scores (unweighted components score 0)
         components = {
-            "moving_averages": ma_score,
-            "rsi": rsi_score,
-            "momentum": momentum_score,
-            "volume": volume_score,
+            component: 0.0 for component in self.COMPONENT_INDICATORS
         }
+        for component in self.enabled_components:
+            analyze = getattr(self, f"analyze_{component}")
+            components[component] = analyze(indicators)
+
+        # Total score, clipped to [-1, 1] range
+        total_score = np.clip(sum(components.values()), -1, 1)
 
         self.logger.debug(
             "Technical analysis complete", score=f"{total_score:.3f}"
         )
 
         return TechnicalScore(value=total_score, components=components)
+
+    def _moving_averages_batch(self, panel: IndicatorPanel) -> np.ndarray:
+        """Vectorized ``analyze_moving_averages``."""
+        ma_weight = self.weights.moving_averages / 3
+        score = np.zeros(len(panel))
+
+        for ma in (panel.ma_20, panel.ma_50, panel.ma_200):
+            score = score + np.where(panel.price > ma, ma_weight, -ma_weight)
+
+        return score
+
+    def _rsi_batch(self, panel: IndicatorPanel) -> np.ndarray:
+        """Vectorized ``analyze_rsi``."""
+        rsi, weight = panel.rsi, self.weights.rsi
+
+        return np.select(
+            [rsi < 30, rsi < 40, rsi > 70, rsi > 60],
+            [weight, weight * 0.5, -weight, -weight * 0.5],
+            default=0.0,
+        )
+
+    def _momentum_batch(self, panel: IndicatorPanel) -> np.ndarray:
+        """Vectorized ``analyze_momentum``."""
+        momentum_weight = self.weights.momentum / 2
+        score = np.zeros(len(panel))
+
+        limits = ((panel.week_change, 5), (panel.month_change, 10))
+        for change, limit in limits:
+            score = score + np.select(
+                [change > limit, change < -limit],
+                [momentum_weight, -momentum_weight],
+                default=0.0,
+            )
+
+        return score
+
+    def _volume_batch(self, panel: IndicatorPanel) -> np.ndarray:
+        """Vectorized ``analyze_volume``."""
+        return np.where(panel.volume_ratio > 1.5, self.weights.volume, 0.0)
+
+    def _macd_batch(self, panel: IndicatorPanel) -> np.ndarray:
+        """Vectorized ``analyze_macd``."""
+        hist, weight = panel.extra["macd_hist"], self.weights.macd
+
+        return np.select([hist > 0, hist < 0], [weight, -weight], default=0.0)
+
+    def _bollinger_batch(self, panel: IndicatorPanel) -> np.ndarray:
+        """Vectorized ``analyze_bollinger``."""
+        percent_b, weight = panel.extra["bb_percent_b"], self.weights.bollinger
+
+        return np.select(
+            [percent_b < 0, percent_b > 1], [weight, -weight], default=0.0
+        )
+
+    def analyze_batch(self, panel: IndicatorPanel) -> TechnicalScoreBatch:
+        """
+        Score many symbols at once.
+
+        Produces the same values as calling ``analyze`` per symbol.
+
+        Args:
+            panel: Columnar indicators for N symbols
+
+        Returns:
+            TechnicalScoreBatch with total and per-component scores
+        """
+        components = {
+            component: np.zeros(len(panel))
+            for component in self.COMPONENT_INDICATORS
+        }
+        for component in self.enabled_components:
+            components[component] = getattr(self, f"_{component}_batch")(
+                panel
+            )
+
+        # Same summation order as the scalar path
+        total = np.zeros(len(panel))
+        for scores in components.values():
+            total = total + scores
+
+        self.logger.debug("Technical batch analysis complete", n=len(panel))
+
+        return TechnicalScoreBatch(
+            symbols=list(panel.symbols),
+            values=np.clip(total, -1, 1),
+            components=components,
+        )
@@ -1,31 +1,131 @@
 """Technical indicator calculations."""
 
-from typing import Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Sequence
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from ...models.indicators import TechnicalIndicators
+from ...models.indicators import (
+    CORE_INDICATORS,
+    IndicatorPanel,
+    TechnicalIndicators,
+)
+from ...models.market_data import PriceHistoryRef, PricePanel
+from ...repositories.market_data import MarketDataRepository
+from ...repositories.sources import MarketDataSource
 from ...utils.logger import get_logger
+from .panel import (
+    LOOKBACK,
+    MA_WINDOWS,
+    MONTH_BARS,
+    RSI_PERIOD,
+    VOLUME_WINDOW,
+    WEEK_BARS,
+    panel_change,
+    panel_rsi,
+    panel_volume_ratio,
+    tail_mean,
+)
+from .registry import REGISTRY, IndicatorRegistry
+from .result_cache import IndicatorResultCache
 
 logger = get_logger(__name__)
 
 
+def _log_fetch_failure(retry_state) -> None:
+    """Give up on an async price fetch after its final attempt."""
+    calculator, symbol = retry_state.args[:2]
+    calculator.logger.error(
+        "Failed to fetch price data",
+        symbol=symbol,
+        error=str(retry_state.outcome.exception()),
+    )
+    return None
+
+
 class TechnicalIndicatorCalculator:
     """Calculate technical indicators from price data."""
 
-    def __init__(self, history_months: int = 6):
+    def __init__(
+        self,
+        history_months: int = 6,
+        data_source: Optional[MarketDataSource] = None,
+        fetch_workers: int = 8,
+        indicators: Optional[Iterable[str]] = None,
+        registry: Optional[IndicatorRegistry] = None,
+        result_cache: Optional[IndicatorResultCache] = None,
+    ):
         """
         Initialize calculator.
 
         Args:
             history_months: Months of historical data to fetch
+            data_source: Price data source (defaults to the cached
+                yfinance repository, created on first use)
+            fetch_workers: Threads for blocking price I/O in async calls
+            indicators: Registered indicators to calculate (defaults to
+                the TechnicalIndicators fields); the price is always
+                included
+            registry: Indicator registry (defaults to the built-in one)
+            result_cache: Cache of results for unchanged price data
+                (None to always recalculate)
         """
         self.history_months = history_months
+        self._data_source = data_source
+        self.registry = registry or REGISTRY
+        self.indicators = tuple(
+            dict.fromkeys(["price", *(indicators or CORE_INDICATORS)])
+        )
+        # Only the price fields and bars the indicators need are read
+        self.price_columns = self.registry.columns(self.indicators)
+        self.lookback = self.registry.lookback(self.indicators)
+        self.result_cache = result_cache
+        self.fingerprint = self.registry.fingerprint(self.indicators)
+        self.executor = ThreadPoolExecutor(
+            max_workers=fetch_workers, thread_name_prefix="price-fetch"
+        )
         self.logger = logger.bind(calculator="TechnicalIndicator")
 
+    @property
+    def data_source(self) -> MarketDataSource:
+        """Price data source (the default repository is built lazily)."""
+        if self._data_source is None:
+            self._data_source = MarketDataRepository()
+        return self._data_source
+
+    @data_source.setter
+    def data_source(self, source: MarketDataSource):
+        self._data_source = source
+
+    def close(self):
+        """Stop the price fetch threads."""
+        self.executor.shutdown(wait=True)
+
+    def _load_price_data(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Load price data from the data source (blocking, may raise).
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            DataFrame with price data or None if no data
+        """
+        hist = self.data_source.get_price_history(
+            symbol,
+            period=f"{self.history_months}mo",
+            columns=self.price_columns,
+        )
+
+        if hist is None or hist.empty:
+            self.logger.warning("No price data available", symbol=symbol)
+            return None
+
+        return hist
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -41,16 +141,7 @@ class TechnicalIndicatorCalculator:
             DataFrame with OHLCV data or None if failed
         """
         try:
-            stock = yf.Ticker(symbol)
-            hist = stock.history(period=f"{self.history_months}mo")
-
-            if hist.empty:
-                self.logger.warning(
-                    "No price data available", symbol=symbol
-                )
-                return None
-
-            return hist
+            return self._load_price_data(symbol)
 
         except Exception as e:
             self.logger.error(
@@ -58,11 +149,53 @@ class TechnicalIndicatorCalculator:
             )
             return None
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry_error_callback=_log_fetch_failure,
+    )
+    async def fetch_price_data_async(
+        self, symbol: str
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch historical price data without blocking the event loop.
+
+        Blocking I/O runs on the calculator's bounded thread pool and
+        retry backoff awaits instead of sleeping.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            DataFrame with price data or None if failed
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self._load_price_data, symbol
+        )
+
+    def _window(self, df: pd.DataFrame) -> tuple[np.ndarray, ...]:
+        """
+        Slice the lookback window needed for latest values.
+
+        Args:
+            df: Price data DataFrame
+
+        Returns:
+            Tuple of (closes, volumes, lengths) as single-row panels
+            holding only the trailing ``LOOKBACK`` bars
+        """
+        closes = df["Close"].to_numpy(dtype=float)[-LOOKBACK:]
+        volumes = df["Volume"].to_numpy(dtype=float)[-LOOKBACK:]
+        lengths = np.array([len(df)])
+
+        return closes[np.newaxis, :], volumes[np.newaxis, :], lengths
+
     def calculate_moving_averages(
         self, df: pd.DataFrame
     ) -> tuple[float, float, float]:
         """
-        Calculate moving averages.
+        Calculate latest moving averages.
 
         Args:
             df: Price data DataFrame
@@ -70,17 +203,18 @@ class TechnicalIndicatorCalculator:
         Returns:
             Tuple of (MA20, MA50, MA200)
         """
-        ma_20 = df["Close"].rolling(window=20).mean().iloc[-1]
-        ma_50 = df["Close"].rolling(window=50).mean().iloc[-1]
-        ma_200 = df["Close"].rolling(window=100).mean().iloc[-1]
+        closes, _, _ = self._window(df)
+        ma_20, ma_50, ma_200 = (
+            float(tail_mean(closes, w)[0]) for w in MA_WINDOWS
+        )
 
         return ma_20, ma_50, ma_200
 
     def calculate_rsi(
-        self, df: pd.DataFrame, period: int = 14
+        self, df: pd.DataFrame, period: int = RSI_PERIOD
     ) -> float:
         """
-        Calculate Relative Strength Index.
+        Calculate latest Relative Strength Index.
 
         Args:
             df: Price data DataFrame
@@ -89,14 +223,10 @@ class TechnicalIndicatorCalculator:
         Returns:
             Current RSI value
         """
-        delta = df["Close"].diff()
-        gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return rsi.iloc[-1]
+        closes = df["Close"].to_numpy(dtype=float)[-(period + 1):]
+        return float(
+            panel_rsi(closes[np.newaxis, :], np.array([len(df)]), period)[0]
+        )
 
     def calculate_volume_ratio(self, df: pd.DataFrame) -> float:
         """
@@ -108,10 +238,8 @@ class TechnicalIndicatorCalculator:
         Returns:
             Volume ratio
         """
-        avg_volume = df["Volume"].rolling(window=20).mean().iloc[-1]
-        current_volume = df["Volume"].iloc[-1]
-
-        return current_volume / avg_volume if avg_volume > 0 else 1.0
+        _, volumes, _ = self._window(df)
+        return float(panel_volume_ratio(volumes)[0])
 
     def calculate_price_momentum(
         self, df: pd.DataFrame
@@ -125,16 +253,62 @@ class TechnicalIndicatorCalculator:
         Returns:
             Tuple of (week_change_pct, month_change_pct)
         """
-        current = df["Close"].iloc[-1]
-
-        week_ago = df["Close"].iloc[-5] if len(df) >= 5 else current
-        month_ago = df["Close"].iloc[-20] if len(df) >= 20 else current
+        closes, _, lengths = self._window(df)
 
-        week_change = ((current - week_ago) / week_ago) * 100
-        month_change = ((current - month_ago) / month_ago) * 100
+        week_change = float(panel_change(closes, lengths, WEEK_BARS)[0])
+        month_change = float(panel_change(closes, lengths, MONTH_BARS)[0])
 
         return week_change, month_change
 
+    def calculate_series(
+        self, df: pd.DataFrame, period: int = RSI_PERIOD
+    ) -> pd.DataFrame:
+        """
+        Calculate full indicator series for charting and backtests.
+
+        Each row holds the values the latest-only calculations would
+        return if the history ended at that bar.
+
+        Args:
+            df: Price data DataFrame
+            period: RSI period (default 14)
+
+        Returns:
+            DataFrame aligned with ``df`` with one column per indicator
+        """
+        close = df["Close"].astype(float)
+        volume = df["Volume"].astype(float)
+
+        ma_20, ma_50, ma_200 = (
+            close.rolling(window=w).mean() for w in MA_WINDOWS
+        )
+
+        delta = close.diff()
+        gain = delta.where(delta > 0, 0).rolling(window=period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        rsi = 100 - (100 / (1 + gain / loss))
+
+        avg_volume = volume.rolling(window=VOLUME_WINDOW).mean()
+        volume_ratio = (volume / avg_volume).where(avg_volume > 0, 1.0)
+
+        # Bars short of the lookback compare against themselves (0%)
+        week_change = close.pct_change(WEEK_BARS - 1).fillna(0) * 100
+        month_change = close.pct_change(MONTH_BARS - 1).fillna(0) * 100
+
+        return pd.DataFrame(
+            {
+                "price": close,
+                "ma_20": ma_20,
+                "ma_50": ma_50,
+                "ma_200": ma_200,
+                "rsi": rsi,
+                "volume_ratio": volume_ratio,
+                "week_change": week_change,
+                "month_change": month_change,
+            },
+            index=df.index,
+        )
+
     def calculate(self, symbol: str) -> Optional[TechnicalIndicators]:
         """
         Calculate all technical indicators.
@@ -151,39 +325,94 @@ class TechnicalIndicatorCalculator:
         if hist is None:
             return None
 
+        return self.calculate_from_history(symbol, hist)
+
+    async def calculate_async(
+        self, symbol: str
+    ) -> Optional[TechnicalIndicators]:
+        """
+        Calculate all technical indicators without blocking the loop.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            TechnicalIndicators object or None if failed
+        """
+        self.logger.info("Calculating indicators", symbol=symbol)
+
+        hist = await self.fetch_price_data_async(symbol)
+        if hist is None:
+            return None
+
+        return self.calculate_from_history(symbol, hist)
+
+    def history_ref(
+        self, symbol: str, hist: Optional[pd.DataFrame] = None
+    ) -> PriceHistoryRef:
+        """
+        Reference a symbol's price history without owning it.
+
+        Args:
+            symbol: Stock ticker symbol
+            hist: Already loaded price history
+
+        Returns:
+            PriceHistoryRef that reloads from the data source
+        """
+        return PriceHistoryRef(symbol, self._load_price_data, hist)
+
+    def _cache_key(self, symbol: str, hist: pd.DataFrame):
+        """Result cache key for a price history (None if uncached)."""
+        if self.result_cache is None:
+            return None
+        return self.result_cache.key(symbol, hist, self.fingerprint)
+
+    def calculate_from_history(
+        self, symbol: str, hist: pd.DataFrame
+    ) -> Optional[TechnicalIndicators]:
+        """
+        Calculate all technical indicators from price history.
+
+        Args:
+            symbol: Stock ticker symbol
+            hist: Price data DataFrame
+
+        Returns:
+            TechnicalIndicators object or None if failed
+        """
         try:
-            # Current price
-            current_price = hist["Close"].iloc[-1]
-
-            # Moving averages
-            ma_20, ma_50, ma_200 = self.calculate_moving_averages(hist)
-
-            # RSI
-            rsi = self.calculate_rsi(hist)
-
-            # Volume
-            volume_ratio = self.calculate_volume_ratio(hist)
-
-            # Momentum
-            week_change, month_change = self.calculate_price_momentum(hist)
-
-            indicators = TechnicalIndicators(
-                price=current_price,
-                ma_20=ma_20,
-                ma_50=ma_50,
-                ma_200=ma_200,
-                rsi=rsi,
-                volume_ratio=volume_ratio,
-                week_change=week_change,
-                month_change=month_change,
-                price_history=hist,
+            key = self._cache_key(symbol, hist)
+            if key is not None:
+                values = self.result_cache.get(key)
+                if values is not None:
+                    return TechnicalIndicators.from_values(
+                        values, self.history_ref(symbol, hist)
+                    )
+
+            # A single-row panel holding only the trailing lookback
+            panel = PricePanel.from_frames(
+                {symbol: hist}, max_bars=self.lookback
+            )
+            values = self.registry.evaluate(panel, self.indicators).values(
+                symbol
+            )
+
+            if values is None:
+                self.logger.warning("No valid price data", symbol=symbol)
+                return None
+
+            if key is not None:
+                self.result_cache.put(key, values)
+            indicators = TechnicalIndicators.from_values(
+                values, self.history_ref(symbol, hist)
             )
 
             self.logger.info(
                 "Indicators calculated",
                 symbol=symbol,
-                price=f"${current_price:.2f}",
-                rsi=f"{rsi:.1f}",
+                price=f"${indicators.price:.2f}",
+                rsi=f"{indicators.rsi:.1f}",
             )
 
             return indicators
@@ -195,3 +424,108 @@ class TechnicalIndicatorCalculator:
                 error=str(e),
             )
             return None
+
+    def calculate_batch(self, symbols: Sequence[str]) -> IndicatorPanel:
+        """
+        Calculate the latest indicators for many symbols at once.
+
+        Price histories are fetched in one batch request and stacked
+        into an aligned panel, so every indicator is a few array passes
+        over all symbols instead of per-symbol DataFrame work.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            IndicatorPanel in ``symbols`` order (rows without price data
+            have NaN values)
+        """
+        symbols = list(symbols)
+        batch = self.data_source.get_price_histories(
+            symbols,
+            period=f"{self.history_months}mo",
+            columns=self.price_columns,
+        )
+
+        if batch.missing:
+            self.logger.warning(
+                "No price data available",
+                symbols=len(batch.missing),
+                sample=batch.missing[:10],
+            )
+
+        # Reuse cached results for symbols whose bars are unchanged
+        keys = {
+            symbol: self._cache_key(symbol, df)
+            for symbol, df in batch.frames.items()
+        }
+        cached = {}
+        for symbol, key in keys.items():
+            values = self.result_cache.get(key) if key else None
+            if values is not None:
+                cached[symbol] = values
+
+        pending = [symbol for symbol in symbols if symbol not in cached]
+        panel = PricePanel.from_frames(
+            batch.frames, symbols=pending, max_bars=self.lookback
+        )
+        computed = self.registry.evaluate(panel, self.indicators)
+
+        if cached:
+            computed = self._merge_cached(symbols, computed, cached)
+
+        for symbol in pending:
+            key = keys.get(symbol)
+            values = computed.values(symbol) if key else None
+            if values is not None:
+                self.result_cache.put(key, values)
+
+        self.logger.info(
+            "Indicators calculated",
+            symbols=len(symbols),
+            cached=len(cached),
+            valid=int(computed.valid.sum()),
+        )
+
+        return computed
+
+    async def calculate_batch_async(
+        self, symbols: Sequence[str]
+    ) -> IndicatorPanel:
+        """
+        Calculate the latest indicators for many symbols off the loop.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            IndicatorPanel in ``symbols`` order
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.calculate_batch, list(symbols)
+        )
+
+    @staticmethod
+    def _merge_cached(
+        symbols: Sequence[str],
+        computed: IndicatorPanel,
+        cached: dict,
+    ) -> IndicatorPanel:
+        """Combine freshly computed rows with cached values."""
+        rows = {symbol: row for row, symbol in enumerate(symbols)}
+        names = list(computed.COLUMNS) + list(computed.extra)
+        columns = {name: np.full(len(symbols), np.nan) for name in names}
+
+        computed_rows = [rows[symbol] for symbol in computed.symbols]
+        for name, values in columns.items():
+            source = (
+                computed.extra[name]
+                if name in computed.extra
+                else getattr(computed, name)
+            )
+            values[computed_rows] = source
+            for symbol, cached_values in cached.items():
+                values[rows[symbol]] = cached_values.get(name, np.nan)
+
+        return IndicatorPanel.from_columns(symbols, columns)
@@ -0,0 +1,339 @@
+"""
+Rolling indicator kernels with a switchable backend.
+
+Kernels work on right-aligned (symbols x bars) panels whose rows are
+only NaN-padded on the left. The NumPy backend is always available;
+when numba is installed a JIT-compiled backend with the same
+arithmetic can be selected.
+"""
+
+from typing import Callable, Dict, List
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ...utils.logger import get_logger
+
+try:
+    import numba
+except ImportError:  # optional dependency
+    numba = None
+
+logger = get_logger(__name__)
+
+HAS_NUMBA = numba is not None
+
+
+# NumPy backend: loops run over bars, vectorized across symbols
+
+
+def _ema_numpy(values: np.ndarray, alpha: float) -> np.ndarray:
+    out = np.empty(values.shape)
+    previous = np.full(values.shape[0], np.nan)
+
+    for bar in range(values.shape[1]):
+        current = values[:, bar]
+        previous = np.where(
+            np.isnan(previous),
+            current,
+            alpha * current + (1 - alpha) * previous,
+        )
+        out[:, bar] = previous
+
+    return out
+
+
+def _wilder_numpy(values: np.ndarray, period: int) -> np.ndarray:
+    rows, bars = values.shape
+    out = np.full((rows, bars), np.nan)
+    seen = np.zeros(rows, dtype=np.int64)
+    total = np.zeros(rows)
+    average = np.full(rows, np.nan)
+
+    for bar in range(bars):
+        current = values[:, bar]
+        real = ~np.isnan(current)
+        seen += real
+
+        seeding = real & (seen <= period)
+        total = np.where(seeding, total + current, total)
+        average = np.where(real & (seen == period), total / period, average)
+        average = np.where(
+            real & (seen > period),
+            (average * (period - 1) + current) / period,
+            average,
+        )
+        out[:, bar] = np.where(seen >= period, average, np.nan)
+
+    return out
+
+
+def _rolling_numpy(reduce: Callable) -> Callable:
+    def kernel(values: np.ndarray, window: int) -> np.ndarray:
+        out = np.full(values.shape, np.nan)
+        if values.shape[1] >= window:
+            windows = sliding_window_view(values, window, axis=1)
+            out[:, window - 1:] = reduce(windows, axis=-1)
+        return out
+
+    return kernel
+
+
+_NUMPY_KERNELS: Dict[str, Callable] = {
+    "ema": _ema_numpy,
+    "wilder": _wilder_numpy,
+    "rolling_mean": _rolling_numpy(np.mean),
+    "rolling_max": _rolling_numpy(np.max),
+}
+
+
+# numba backend: the same recurrences, one row at a time
+
+
+def _numba_kernels() -> Dict[str, Callable]:
+    """Compile the numba kernels (only called when numba is present)."""
+    jit = numba.njit(cache=True, nogil=True)
+
+    @jit
+    def ema(values, alpha):
+        rows, bars = values.shape
+        out = np.empty((rows, bars))
+        for row in range(rows):
+            previous = np.nan
+            for bar in range(bars):
+                current = values[row, bar]
+                if np.isnan(previous):
+                    previous = current
+                else:
+                    previous = alpha * current + (1 - alpha) * previous
+                out[row, bar] = previous
+        return out
+
+    @jit
+    def wilder(values, period):
+        rows, bars = values.shape
+        out = np.full((rows, bars), np.nan)
+        for row in range(rows):
+            seen = 0
+            total = 0.0
+            average = np.nan
+            for bar in range(bars):
+                current = values[row, bar]
+                if not np.isnan(current):
+                    seen += 1
+                    if seen <= period:
+                        total = total + current
+                    if seen == period:
+                        average = total / period
+                    elif seen > period:
+                        average = (average * (period - 1) + current) / period
+                if seen >= period:
+                    out[row, bar] = average
+        return out
+
+    @jit
+    def rolling_mean(values, window):
+        rows, bars = values.shape
+        out = np.full((rows, bars), np.nan)
+        for row in range(rows):
+            for bar in range(window - 1, bars):
+                out[row, bar] = np.mean(values[row, bar - window + 1:bar + 1])
+        return out
+
+    @jit
+    def rolling_max(values, window):
+        # Monotonic deque of candidate maxima; NaNs in the window
+        # make the result NaN
+        rows, bars = values.shape
+        out = np.full((rows, bars), np.nan)
+        queue = np.empty(bars, dtype=np.int64)
+        for row in range(rows):
+            head = 0
+            tail = 0
+            nans = 0
+            for bar in range(bars):
+                current = values[row, bar]
+                if np.isnan(current):
+                    nans += 1
+                else:
+                    while tail > head:
+                        if values[row, queue[tail - 1]] > current:
+                            break
+                        tail -= 1
+                    queue[tail] = bar
+                    tail += 1
+
+                start = bar - window + 1
+                if start > 0 and np.isnan(values[row, start - 1]):
+                    nans -= 1
+                while tail > head and queue[head] < start:
+                    head += 1
+                if start >= 0 and nans == 0:
+                    out[row, bar] = values[row, queue[head]]
+        return out
+
+    return {
+        "ema": ema,
+        "wilder": wilder,
+        "rolling_mean": rolling_mean,
+        "rolling_max": rolling_max,
+    }
+
+
+_BACKENDS: Dict[str, Dict[str, Callable]] = {"numpy": _NUMPY_KERNELS}
+_active = "numpy"
+
+
+def available_backends() -> List[str]:
+    """Names of the backends that can be selected."""
+    return ["numpy", "numba"] if HAS_NUMBA else ["numpy"]
+
+
+def get_backend() -> str:
+    """Name of the active backend."""
+    return _active
+
+
+def set_backend(name: str):
+    """
+    Select the kernel backend.
+
+    Args:
+        name: "numpy", "numba", or "auto" (numba when installed)
+
+    Raises:
+        ValueError: Unknown backend name
+        ImportError: numba requested but not installed
+    """
+    global _active
+
+    if name == "auto":
+        name = "numba" if HAS_NUMBA else "numpy"
+
+    if name not in ("numpy", "numba"):
+        raise ValueError(f"Unknown kernel backend: {name}")
+
+    if name == "numba":
+        if not HAS_NUMBA:
+            raise ImportError("The numba kernel backend requires numba")
+        if "numba" not in _BACKENDS:
+            _BACKENDS["numba"] = _numba_kernels()
+
+    _active = name
+    logger.info("Kernel backend selected", backend=name)
+
+
+def _kernel(name: str) -> Callable:
+    return _BACKENDS[_active][name]
+
+
+def _panel(values: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponential moving average seeded at each row's first real value.
+
+    Args:
+        values: (symbols x bars) right-aligned panel
+        span: EMA span (alpha = 2 / (span + 1))
+
+    Returns:
+        EMA series with the same shape as ``values``
+    """
+    return _kernel("ema")(_panel(values), 2 / (span + 1))
+
+
+def wilder(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder smoothing: a ``period``-bar simple average seed followed by
+    ``avg = (avg * (period - 1) + value) / period``.
+
+    Args:
+        values: (symbols x bars) right-aligned panel
+        period: Smoothing period
+
+    Returns:
+        Smoothed series (NaN until ``period`` real values are seen)
+    """
+    return _kernel("wilder")(_panel(values), period)
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean along bars.
+
+    Args:
+        values: (symbols x bars) right-aligned panel
+        window: Window length
+
+    Returns:
+        Series of window means (NaN if the window has any NaN)
+    """
+    return _kernel("rolling_mean")(_panel(values), window)
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling maximum along bars.
+
+    Args:
+        values: (symbols x bars) right-aligned panel
+        window: Window length
+
+    Returns:
+        Series of window maxima (NaN if the window has any NaN)
+    """
+    return _kernel("rolling_max")(_panel(values), window)
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling minimum along bars.
+
+    Args:
+        values: (symbols x bars) right-aligned panel
+        window: Window length
+
+    Returns:
+        Series of window minima (NaN if the window has any NaN)
+    """
+    return -rolling_max(-_panel(values), window)
+
+
+def rsi(
+    closes: np.ndarray, period: int = 14, smoothing: str = "simple"
+) -> np.ndarray:
+    """
+    RSI series.
+
+    Args:
+        closes: (symbols x bars) right-aligned close prices
+        period: RSI period
+        smoothing: "simple" rolling averages of gains and losses (same
+            as the pandas calculation) or "wilder"
+
+    Returns:
+        RSI series with the same shape as ``closes``
+    """
+    closes = _panel(closes)
+    delta = np.diff(closes, axis=1, prepend=np.nan)
+
+    # The first change of each row counts as no gain or loss
+    first = np.isnan(delta) & ~np.isnan(closes)
+    delta[first] = 0.0
+
+    gain = np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0))
+    loss = np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0))
+
+    if smoothing == "wilder":
+        average_gain, average_loss = wilder(gain, period), wilder(loss, period)
+    elif smoothing == "simple":
+        average_gain = rolling_mean(gain, period)
+        average_loss = rolling_mean(loss, period)
+    else:
+        raise ValueError(f"Unknown RSI smoothing: {smoothing}")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - 100 / (1 + average_gain / average_loss)
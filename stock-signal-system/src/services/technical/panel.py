@@ -0,0 +1,112 @@
+"""Vectorized indicator calculations over multi-symbol price panels."""
+
+import numpy as np
+
+from . import kernels
+
+# Same windows as TechnicalIndicatorCalculator (the long average spans
+# 100 bars)
+MA_WINDOWS = (20, 50, 100)
+VOLUME_WINDOW = 20
+RSI_PERIOD = 14
+WEEK_BARS = 5
+MONTH_BARS = 20
+
+# Bars needed to compute every latest value
+LOOKBACK = max(*MA_WINDOWS, VOLUME_WINDOW, RSI_PERIOD + 1, MONTH_BARS)
+
+
+def _tail(values: np.ndarray, bars: int) -> np.ndarray:
+    """Get the last ``bars`` columns, NaN-padding narrow panels."""
+    width = values.shape[1]
+    if width >= bars:
+        return values[:, width - bars:]
+
+    padding = np.full((values.shape[0], bars - width), np.nan)
+    return np.hstack([padding, values])
+
+
+def tail_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Latest rolling mean of each row.
+
+    Args:
+        values: (symbols x bars) right-aligned panel
+        window: Rolling window length
+
+    Returns:
+        Mean of each row's last ``window`` bars (NaN if shorter)
+    """
+    return kernels.rolling_mean(_tail(values, window), window)[:, -1]
+
+
+def panel_rsi(
+    closes: np.ndarray, lengths: np.ndarray, period: int = RSI_PERIOD
+) -> np.ndarray:
+    """
+    Latest RSI of each row using simple average gains and losses.
+
+    Args:
+        closes: (symbols x bars) right-aligned close prices
+        lengths: Number of real bars per row
+        period: RSI period
+
+    Returns:
+        RSI per row (NaN for rows shorter than ``period``)
+    """
+    delta = np.diff(_tail(closes, period + 1), axis=1)
+    # Missing deltas count as no change, like the pandas calculation
+    delta = np.nan_to_num(delta, nan=0.0)
+
+    gain = tail_mean(np.where(delta > 0, delta, 0.0), period)
+    loss = tail_mean(np.where(delta < 0, -delta, 0.0), period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + gain / loss)
+
+    rsi[lengths < period] = np.nan
+    return rsi
+
+
+def panel_volume_ratio(
+    volumes: np.ndarray, window: int = VOLUME_WINDOW
+) -> np.ndarray:
+    """
+    Latest volume relative to its rolling average.
+
+    Args:
+        volumes: (symbols x bars) right-aligned volumes
+        window: Averaging window
+
+    Returns:
+        Volume ratio per row (1.0 where the average is unavailable)
+    """
+    recent = _tail(volumes, window)
+    average = tail_mean(recent, window)
+    current = recent[:, -1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(average > 0, current / average, 1.0)
+
+
+def panel_change(
+    closes: np.ndarray, lengths: np.ndarray, bars: int
+) -> np.ndarray:
+    """
+    Percent change of the latest close over ``bars`` bars.
+
+    Args:
+        closes: (symbols x bars) right-aligned close prices
+        lengths: Number of real bars per row
+        bars: Offset of the reference close from the end (a row shorter
+            than this compares against its latest close, i.e. 0%)
+
+    Returns:
+        Percent change per row
+    """
+    recent = _tail(closes, bars)
+    current = recent[:, -1]
+    reference = np.where(lengths >= bars, recent[:, 0], current)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (current - reference) / reference * 100
@@ -0,0 +1,362 @@
+"""Indicator registry with dependency resolution over price panels."""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from ...models.indicators import IndicatorPanel
+from ...models.market_data import PricePanel
+from .kernels import ema
+from .panel import (
+    MA_WINDOWS,
+    MONTH_BARS,
+    RSI_PERIOD,
+    VOLUME_WINDOW,
+    WEEK_BARS,
+    _tail,
+    panel_change,
+    panel_rsi,
+    panel_volume_ratio,
+    tail_mean,
+)
+
+# Panel inputs available to indicators, and their price columns
+SOURCES = {
+    "close": "Close",
+    "volume": "Volume",
+    "high": "High",
+    "low": "Low",
+    "lengths": None,
+}
+
+
+@dataclass(frozen=True)
+class IndicatorNode:
+    """
+    A registered indicator or shared intermediate.
+
+    ``func`` receives the values of ``inputs`` (panel sources or other
+    nodes) followed by ``params`` as keyword arguments. Public
+    indicators return one latest value per symbol; intermediates may
+    return any array their consumers expect.
+    """
+
+    name: str
+    func: Callable[..., np.ndarray]
+    inputs: Tuple[str, ...]
+    lookback: int = 1
+    public: bool = True
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+class IndicatorRegistry:
+    """
+    Registry of indicators that declare their inputs and parameters.
+
+    Evaluating a set of indicators resolves their dependency DAG,
+    slices the panel once to the longest lookback among them, and
+    computes every needed node exactly once.
+    """
+
+    def __init__(self):
+        self._nodes: Dict[str, IndicatorNode] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., np.ndarray],
+        inputs: Iterable[str],
+        lookback: int = 1,
+        public: bool = True,
+        **params,
+    ) -> IndicatorNode:
+        """
+        Register an indicator or intermediate.
+
+        Args:
+            name: Unique node name
+            func: Calculation over input arrays
+            inputs: Panel sources or node names the calculation needs
+            lookback: Trailing bars needed for the latest value
+            public: False for intermediates that only feed other nodes
+            **params: Parameters passed to ``func``
+
+        Returns:
+            Registered IndicatorNode
+        """
+        if name in self._nodes or name in SOURCES:
+            raise ValueError(f"Indicator already registered: {name}")
+
+        node = IndicatorNode(
+            name=name,
+            func=func,
+            inputs=tuple(inputs),
+            lookback=lookback,
+            public=public,
+            params=params,
+        )
+        self._nodes[name] = node
+        return node
+
+    def register(
+        self,
+        name: str,
+        inputs: Iterable[str],
+        lookback: int = 1,
+        public: bool = True,
+        **params,
+    ) -> Callable:
+        """Decorator form of ``add``."""
+
+        def decorator(func: Callable) -> Callable:
+            self.add(name, func, inputs, lookback, public, **params)
+            return func
+
+        return decorator
+
+    def names(self, public_only: bool = True) -> List[str]:
+        """List registered node names."""
+        return [
+            name
+            for name, node in self._nodes.items()
+            if node.public or not public_only
+        ]
+
+    def resolve(self, targets: Iterable[str]) -> List[IndicatorNode]:
+        """
+        Get the nodes needed for ``targets`` in dependency order.
+
+        Args:
+            targets: Indicator names
+
+        Returns:
+            Nodes ordered so every node follows its inputs
+
+        Raises:
+            KeyError: Unknown indicator or input
+            ValueError: Dependency cycle
+        """
+        order: List[IndicatorNode] = []
+        state: Dict[str, bool] = {}  # False while visiting, True when done
+
+        def visit(name: str):
+            if name in SOURCES or state.get(name):
+                return
+            if name in state:
+                raise ValueError(f"Indicator dependency cycle at {name}")
+            if name not in self._nodes:
+                raise KeyError(f"Unknown indicator: {name}")
+
+            state[name] = False
+            node = self._nodes[name]
+            for dependency in node.inputs:
+                visit(dependency)
+            state[name] = True
+            order.append(node)
+
+        for target in targets:
+            visit(target)
+
+        return order
+
+    def lookback(self, targets: Iterable[str]) -> int:
+        """Trailing bars needed to evaluate ``targets``."""
+        nodes = self.resolve(targets)
+        return max((node.lookback for node in nodes), default=1)
+
+    def columns(self, targets: Iterable[str]) -> Tuple[str, ...]:
+        """Price columns needed to evaluate ``targets``."""
+        sources = {
+            source
+            for node in self.resolve(targets)
+            for source in node.inputs
+            if SOURCES.get(source)
+        }
+        return tuple(SOURCES[s] for s in SOURCES if s in sources)
+
+    def fingerprint(self, targets: Iterable[str]) -> str:
+        """
+        Hash of the nodes and parameters used to evaluate ``targets``.
+
+        Args:
+            targets: Indicator names
+
+        Returns:
+            Hex digest that changes when any involved node changes
+        """
+        spec = [
+            [node.name, node.inputs, node.lookback, node.params]
+            for node in self.resolve(sorted(set(targets)))
+        ]
+        raw = json.dumps(spec, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+    def evaluate(
+        self, panel: PricePanel, targets: Iterable[str]
+    ) -> IndicatorPanel:
+        """
+        Calculate latest indicator values for every panel symbol.
+
+        Args:
+            panel: Aligned price panel
+            targets: Public indicator names to calculate
+
+        Returns:
+            IndicatorPanel (core indicators not requested are NaN)
+        """
+        targets = list(dict.fromkeys(targets))
+        nodes = self.resolve(targets)
+        lookback = max((node.lookback for node in nodes), default=1)
+
+        arrays = {
+            "close": panel.closes,
+            "volume": panel.volumes,
+            "high": panel.highs,
+            "low": panel.lows,
+        }
+        values: Dict[str, Any] = {"lengths": panel.lengths}
+
+        for node in nodes:
+            for source in node.inputs:
+                if source in values or source not in arrays:
+                    continue
+                if arrays[source] is None:
+                    raise ValueError(
+                        f"{node.name} needs {SOURCES[source]} prices"
+                    )
+                # One shared lookback slice per source
+                values[source] = _tail(arrays[source], lookback)
+
+            args = [values[name] for name in node.inputs]
+            values[node.name] = node.func(*args, **node.params)
+
+        return IndicatorPanel.from_columns(
+            panel.symbols, {name: values[name] for name in targets}
+        )
+
+
+def _latest(series: np.ndarray) -> np.ndarray:
+    """Latest value of each row."""
+    return series[:, -1].copy()
+
+
+def _tail_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Sample standard deviation of each row's last ``window`` bars."""
+    return _tail(values, window).std(axis=1, ddof=1)
+
+
+def _true_range(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray
+) -> np.ndarray:
+    """True range series (the first bar uses its high-low range)."""
+    previous = np.roll(close, 1, axis=1)
+    previous[:, 0] = np.nan
+
+    return np.fmax(
+        high - low,
+        np.fmax(np.abs(high - previous), np.abs(low - previous)),
+    )
+
+
+def _band(mean: np.ndarray, std: np.ndarray, width: float) -> np.ndarray:
+    """Bollinger band ``width`` standard deviations from the mean."""
+    return mean + width * std
+
+
+def _percent_b(
+    price: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> np.ndarray:
+    """Position of the price within the bands (0 = lower, 1 = upper)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (price - lower) / (upper - lower)
+
+
+def _with_defaults(registry: IndicatorRegistry) -> IndicatorRegistry:
+    """Register the built-in indicators."""
+    add = registry.add
+
+    # Core indicators (the long average spans 100 bars)
+    add("price", _latest, ["close"])
+    for name, window in zip(("ma_20", "ma_50", "ma_200"), MA_WINDOWS):
+        add(name, tail_mean, ["close"], lookback=window, window=window)
+    add(
+        "rsi",
+        panel_rsi,
+        ["close", "lengths"],
+        lookback=RSI_PERIOD + 1,
+        period=RSI_PERIOD,
+    )
+    add(
+        "volume_ratio",
+        panel_volume_ratio,
+        ["volume"],
+        lookback=VOLUME_WINDOW,
+        window=VOLUME_WINDOW,
+    )
+    add(
+        "week_change",
+        panel_change,
+        ["close", "lengths"],
+        lookback=WEEK_BARS,
+        bars=WEEK_BARS,
+    )
+    add(
+        "month_change",
+        panel_change,
+        ["close", "lengths"],
+        lookback=MONTH_BARS,
+        bars=MONTH_BARS,
+    )
+
+    # MACD (12/26/9). EMAs are seeded at the start of the lookback
+    # window, which is long enough for the seed to wash out.
+    macd_lookback = 120
+    add("ema_12", ema, ["close"], public=False, span=12)
+    add("ema_26", ema, ["close"], public=False, span=26)
+    add("macd_line", np.subtract, ["ema_12", "ema_26"], public=False)
+    add("macd_signal_line", ema, ["macd_line"], public=False, span=9)
+    add("macd", _latest, ["macd_line"], lookback=macd_lookback)
+    add(
+        "macd_signal",
+        _latest,
+        ["macd_signal_line"],
+        lookback=macd_lookback,
+    )
+    add(
+        "macd_hist",
+        np.subtract,
+        ["macd", "macd_signal"],
+        lookback=macd_lookback,
+    )
+
+    # Bollinger bands (20 bars, 2 standard deviations around MA20)
+    add(
+        "close_std_20",
+        _tail_std,
+        ["close"],
+        lookback=20,
+        public=False,
+        window=20,
+    )
+    add("bb_upper", _band, ["ma_20", "close_std_20"], width=2.0)
+    add("bb_lower", _band, ["ma_20", "close_std_20"], width=-2.0)
+    add("bb_percent_b", _percent_b, ["price", "bb_lower", "bb_upper"])
+
+    # Average true range (14 bars, simple average)
+    add(
+        "true_range",
+        _true_range,
+        ["high", "low", "close"],
+        lookback=15,
+        public=False,
+    )
+    add("atr", tail_mean, ["true_range"], lookback=15, window=14)
+
+    return registry
+
+
+# Registry used by default throughout the technical services
+REGISTRY = _with_defaults(IndicatorRegistry())
@@ -0,0 +1,138 @@
+"""Memoized indicator results keyed by price data fingerprint."""
+
+import json
+import os
+import sys
+import uuid
+from pathlib import Path
+from typing import Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from ...utils.cache import LRUCache
+from ...utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+IndicatorValues = Dict[str, float]
+
+
+def _values_size(values: IndicatorValues) -> int:
+    """Approximate memory footprint of a cached result."""
+    return sys.getsizeof(values) + sum(
+        sys.getsizeof(name) + sys.getsizeof(value)
+        for name, value in values.items()
+    )
+
+
+class IndicatorResultCache:
+    """
+    Cache of calculated indicator values.
+
+    Entries are keyed by (symbol, last bar timestamp, bar count, last
+    close, indicator fingerprint), so identical bars with identical
+    indicator definitions reuse the earlier result, while a new bar, a
+    revised latest bar or changed parameters miss.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 16 * 1024 * 1024,
+        path: Optional[Path] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Memory budget for cached results
+            path: JSON file loaded here and written by ``save()``,
+                which the owner calls on shutdown (None to keep results
+                in memory only)
+        """
+        self.memory = LRUCache(max_bytes, sizeof=_values_size)
+        self.path = Path(path) if path else None
+        self.logger = logger.bind(component="IndicatorResultCache")
+
+        if self.path is not None:
+            self.load()
+
+    @staticmethod
+    def key(
+        symbol: str, hist: pd.DataFrame, fingerprint: str
+    ) -> Optional[Tuple[Hashable, ...]]:
+        """
+        Build the cache key for a price history.
+
+        Args:
+            symbol: Stock ticker symbol
+            hist: Price data the indicators are calculated from
+            fingerprint: Hash of the indicator definitions
+
+        Returns:
+            Cache key, or None for empty histories
+        """
+        if hist is None or hist.empty:
+            return None
+
+        # Epoch nanoseconds avoid slow Timestamp boxing and formatting
+        index = hist.index
+        if isinstance(index, pd.DatetimeIndex):
+            last_bar = int(index.asi8[-1])
+        else:
+            last_bar = str(index[-1])
+
+        return (
+            symbol,
+            last_bar,
+            len(hist),
+            float(hist["Close"].array[-1]),
+            fingerprint,
+        )
+
+    def get(self, key: Optional[Tuple]) -> Optional[IndicatorValues]:
+        """Get cached indicator values for a key."""
+        if key is None:
+            return None
+        return self.memory.get(key)
+
+    def put(self, key: Optional[Tuple], values: IndicatorValues):
+        """Store indicator values for a key."""
+        if key is not None:
+            self.memory.put(key, values)
+
+    def load(self):
+        """Load persisted results, ignoring an unusable file."""
+        try:
+            with open(self.path) as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.logger.warning(
+                "Indicator cache unreadable", path=str(self.path), error=str(e)
+            )
+            return
+
+        for key, values in raw.get("entries", []):
+            self.memory.put(tuple(key), values)
+
+        self.logger.info("Indicator cache loaded", entries=len(self.memory))
+
+    def save(self):
+        """Atomically persist cached results (least recent first)."""
+        if self.path is None:
+            return
+
+        raw = {"version": 1, "entries": self.memory.items()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(
+            f".{self.path.name}.{uuid.uuid4().hex}.tmp"
+        )
+
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(raw, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            self.logger.warning("Indicator cache write failed", error=str(e))
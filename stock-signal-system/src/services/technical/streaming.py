@@ -0,0 +1,361 @@
+"""Incremental indicator state for streaming bar updates."""
+
+import json
+import os
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from ...models.indicators import TechnicalIndicators
+from .panel import (
+    MA_WINDOWS,
+    MONTH_BARS,
+    RSI_PERIOD,
+    VOLUME_WINDOW,
+    WEEK_BARS,
+)
+
+
+class RollingMean:
+    """Constant-time rolling mean over a fixed window."""
+
+    # Re-sum the window this often to stop floating-point drift
+    RESYNC_INTERVAL = 1000
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: deque = deque(maxlen=window)
+        self.total = 0.0
+        self._updates = 0
+
+    def push(self, value: float):
+        """Add a value, dropping the oldest once the window is full."""
+        if len(self.values) == self.window:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+        self._updates += 1
+        if self._updates % self.RESYNC_INTERVAL == 0:
+            self.total = float(sum(self.values))
+
+    def replace_last(self, value: float):
+        """Revise the most recent value."""
+        self.total += value - self.values[-1]
+        self.values[-1] = value
+
+    @property
+    def value(self) -> float:
+        """Current mean (NaN until the window is full)."""
+        if len(self.values) < self.window:
+            return np.nan
+        return self.total / self.window
+
+
+class RSIState:
+    """
+    Incremental RSI.
+
+    ``smoothing="simple"`` averages the last ``period`` gains and losses,
+    matching TechnicalIndicatorCalculator.calculate_rsi; ``"wilder"``
+    uses Wilder's exponential smoothing.
+    """
+
+    def __init__(self, period: int = RSI_PERIOD, smoothing: str = "simple"):
+        if smoothing not in ("simple", "wilder"):
+            raise ValueError(f"Unknown RSI smoothing: {smoothing}")
+
+        self.period = period
+        self.smoothing = smoothing
+        self.gains = RollingMean(period)
+        self.losses = RollingMean(period)
+        # Wilder averages, and their values before the latest delta
+        self.avg_gain = np.nan
+        self.avg_loss = np.nan
+        self._prev_avgs = (np.nan, np.nan)
+        self.count = 0
+
+    def push(self, delta: float):
+        """Add the change between two consecutive closes."""
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        self.gains.push(gain)
+        self.losses.push(loss)
+        self.count += 1
+
+        if self.smoothing == "wilder":
+            self._prev_avgs = (self.avg_gain, self.avg_loss)
+            self._smooth(gain, loss)
+
+    def replace_last(self, delta: float):
+        """Revise the most recent change."""
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        self.gains.replace_last(gain)
+        self.losses.replace_last(loss)
+
+        if self.smoothing == "wilder":
+            self.avg_gain, self.avg_loss = self._prev_avgs
+            self._smooth(gain, loss)
+
+    def _smooth(self, gain: float, loss: float):
+        """Advance Wilder averages, seeding from the first full window."""
+        if self.count < self.period:
+            return
+        if self.count == self.period:
+            self.avg_gain = self.gains.value
+            self.avg_loss = self.losses.value
+            return
+
+        n = self.period
+        self.avg_gain = (self.avg_gain * (n - 1) + gain) / n
+        self.avg_loss = (self.avg_loss * (n - 1) + loss) / n
+
+    @property
+    def value(self) -> float:
+        """Current RSI (NaN until ``period`` changes are seen)."""
+        if self.smoothing == "wilder":
+            gain, loss = self.avg_gain, self.avg_loss
+        else:
+            gain, loss = self.gains.value, self.losses.value
+
+        if np.isnan(gain) or np.isnan(loss) or gain == loss == 0:
+            return np.nan
+        if loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + gain / loss)
+
+
+class IndicatorState:
+    """
+    Indicator values for one symbol, advanced one bar at a time.
+
+    Each update costs O(1) regardless of history length, and the state
+    can be checkpointed to a dict and restored without re-reading
+    history.
+    """
+
+    def __init__(self, rsi_smoothing: str = "simple"):
+        """
+        Initialize empty state.
+
+        Args:
+            rsi_smoothing: "simple" (same as the batch calculation) or
+                "wilder"
+        """
+        self.moving_averages = {w: RollingMean(w) for w in MA_WINDOWS}
+        self.volume = RollingMean(VOLUME_WINDOW)
+        self.rsi = RSIState(RSI_PERIOD, rsi_smoothing)
+        self.closes: deque = deque(maxlen=max(WEEK_BARS, MONTH_BARS) + 1)
+        self.last_volume = np.nan
+        self.last_timestamp: Optional[pd.Timestamp] = None
+        self.bars = 0
+
+    @classmethod
+    def from_history(
+        cls, df: pd.DataFrame, rsi_smoothing: str = "simple"
+    ) -> "IndicatorState":
+        """
+        Seed state from a price history.
+
+        Args:
+            df: Price data with Close and Volume columns
+            rsi_smoothing: RSI smoothing mode
+
+        Returns:
+            IndicatorState positioned after the last bar of ``df``
+        """
+        state = cls(rsi_smoothing)
+        closes = df["Close"].to_numpy(dtype=float)
+        volumes = df["Volume"].to_numpy(dtype=float)
+
+        for close, volume in zip(closes, volumes):
+            state.update(close, volume)
+
+        if len(df):
+            state.last_timestamp = df.index[-1]
+        return state
+
+    def update(
+        self,
+        close: float,
+        volume: float,
+        timestamp: Optional[pd.Timestamp] = None,
+    ):
+        """
+        Advance by one bar, or revise the latest bar.
+
+        A bar with the same timestamp as the previous one (e.g. an
+        in-progress daily bar refreshed intraday) replaces it.
+
+        Args:
+            close: Bar close price
+            volume: Bar volume
+            timestamp: Bar timestamp (optional)
+        """
+        if (
+            timestamp is not None
+            and self.last_timestamp is not None
+            and timestamp == self.last_timestamp
+        ):
+            self._replace_last(close, volume)
+            return
+
+        close, volume = float(close), float(volume)
+
+        if self.closes:
+            self.rsi.push(close - self.closes[-1])
+        else:
+            # The first bar has no change, which counts as no gain/loss
+            self.rsi.push(0.0)
+
+        for average in self.moving_averages.values():
+            average.push(close)
+        self.volume.push(volume)
+        self.closes.append(close)
+        self.last_volume = volume
+        self.last_timestamp = timestamp
+        self.bars += 1
+
+    def _replace_last(self, close: float, volume: float):
+        """Revise the latest bar in place."""
+        close, volume = float(close), float(volume)
+
+        delta = close - self.closes[-2] if len(self.closes) > 1 else 0.0
+        self.rsi.replace_last(delta)
+
+        for average in self.moving_averages.values():
+            average.replace_last(close)
+        self.volume.replace_last(volume)
+        self.closes[-1] = close
+        self.last_volume = volume
+
+    def _change(self, bars: int) -> float:
+        """Percent change of the latest close over ``bars`` bars."""
+        current = self.closes[-1]
+        reference = self.closes[-bars] if self.bars >= bars else current
+        return (current - reference) / reference * 100
+
+    def snapshot(self) -> Optional[TechnicalIndicators]:
+        """
+        Get current indicator values.
+
+        Returns:
+            TechnicalIndicators (without price history) or None before
+            the first bar
+        """
+        if not self.bars:
+            return None
+
+        ma_20, ma_50, ma_200 = (
+            self.moving_averages[w].value for w in MA_WINDOWS
+        )
+        avg_volume = self.volume.value
+
+        return TechnicalIndicators(
+            price=self.closes[-1],
+            ma_20=ma_20,
+            ma_50=ma_50,
+            ma_200=ma_200,
+            rsi=self.rsi.value,
+            volume_ratio=(
+                self.last_volume / avg_volume if avg_volume > 0 else 1.0
+            ),
+            week_change=self._change(WEEK_BARS),
+            month_change=self._change(MONTH_BARS),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize state to JSON-compatible values."""
+        return {
+            "rsi_smoothing": self.rsi.smoothing,
+            "bars": self.bars,
+            "last_timestamp": (
+                self.last_timestamp.isoformat()
+                if self.last_timestamp is not None
+                else None
+            ),
+            "last_volume": self.last_volume,
+            "closes": list(self.closes),
+            "moving_averages": {
+                str(w): list(average.values)
+                for w, average in self.moving_averages.items()
+            },
+            "volumes": list(self.volume.values),
+            "gains": list(self.rsi.gains.values),
+            "losses": list(self.rsi.losses.values),
+            "rsi_count": self.rsi.count,
+            "avg_gain": self.rsi.avg_gain,
+            "avg_loss": self.rsi.avg_loss,
+            "prev_avgs": list(self.rsi._prev_avgs),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndicatorState":
+        """Restore state serialized by ``to_dict``."""
+        state = cls(data["rsi_smoothing"])
+        state.bars = data["bars"]
+        if data["last_timestamp"] is not None:
+            state.last_timestamp = pd.Timestamp(data["last_timestamp"])
+        state.last_volume = data["last_volume"]
+        state.closes.extend(data["closes"])
+
+        def fill(average: RollingMean, values):
+            average.values.extend(values)
+            average.total = float(sum(average.values))
+
+        for w, average in state.moving_averages.items():
+            fill(average, data["moving_averages"][str(w)])
+        fill(state.volume, data["volumes"])
+        fill(state.rsi.gains, data["gains"])
+        fill(state.rsi.losses, data["losses"])
+        state.rsi.count = data["rsi_count"]
+        state.rsi.avg_gain = data["avg_gain"]
+        state.rsi.avg_loss = data["avg_loss"]
+        state.rsi._prev_avgs = tuple(data["prev_avgs"])
+        return state
+
+
+def save_checkpoint(states: Dict[str, IndicatorState], path: Path):
+    """
+    Atomically write indicator states to a JSON checkpoint.
+
+    Args:
+        states: Indicator state per symbol
+        path: Checkpoint file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+    raw = {symbol: state.to_dict() for symbol, state in states.items()}
+
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(raw, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_checkpoint(path: Path) -> Dict[str, IndicatorState]:
+    """
+    Read indicator states from a JSON checkpoint.
+
+    Args:
+        path: Checkpoint file
+
+    Returns:
+        Indicator state per symbol (empty if the file does not exist)
+    """
+    try:
+        with open(path) as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        return {}
+
+    return {
+        symbol: IndicatorState.from_dict(data) for symbol, data in raw.items()
+    }
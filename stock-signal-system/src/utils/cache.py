@@ -0,0 +1,201 @@
+"""In-memory caching utilities."""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+
+    return sys.getsizeof(value)
+
+
+@dataclass
+class CacheStats:
+    """Counters for cache monitoring."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+    max_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for logging."""
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache bounded by total size in bytes.
+
+    Features:
+    - Least-recently-used eviction once ``max_bytes`` is exceeded
+    - Optional per-entry time-to-live
+    - Hit/miss/eviction counters
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        default_ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Total size budget for all entries
+            default_ttl: Default time-to-live in seconds (None = no expiry)
+            sizeof: Function estimating an entry's size in bytes
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sizeof = sizeof
+        # key -> (value, size, expires_at)
+        self._entries: OrderedDict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats(max_bytes=max_bytes)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            value, size, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Store a value, evicting least-recently-used entries as needed.
+
+        Entries larger than the whole budget are not cached.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (defaults to ``default_ttl``)
+        """
+        size = self.sizeof(value)
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (value, size, expires_at)
+            self._size += size
+
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        """Remove an entry if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Snapshot of unexpired entries, least recently used first.
+
+        Returns:
+            List of (key, value) pairs
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (key, value)
+                for key, (value, _, expires_at) in self._entries.items()
+                if expires_at is None or now < expires_at
+            ]
+
+    def _remove(self, key: Hashable):
+        """Remove an entry (caller holds the lock)."""
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                expirations=self._stats.expirations,
+                entries=len(self._entries),
+                size_bytes=self._size,
+                max_bytes=self.max_bytes,
+            )
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,10 +1,12 @@
 """Utility decorators."""
 
 import functools
+import inspect
 import time
 from typing import Callable
 
 from .logger import get_logger
+from .singleflight import AsyncSingleFlight
 
 logger = get_logger(__name__)
 
@@ -20,17 +22,29 @@ def log_execution_time(func: Callable) -> Callable:
         Decorated function
     """
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        start = time.time()
-        result = func(*args, **kwargs)
+    def log_elapsed(start: float):
         elapsed = time.time() - start
-
         logger.info(
             f"{func.__name__} completed",
             duration_ms=f"{elapsed * 1000:.2f}",
         )
 
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start = time.time()
+            result = await func(*args, **kwargs)
+            log_elapsed(start)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.time()
+        result = func(*args, **kwargs)
+        log_elapsed(start)
         return result
 
     return wrapper
@@ -63,3 +77,26 @@ def handle_errors(default_return=None):
         return wrapper
 
     return decorator
+
+
+def single_flight(func: Callable) -> Callable:
+    """
+    Decorator to coalesce concurrent identical calls of a coroutine.
+
+    Callers with the same arguments (including ``self``) while a call is
+    in flight await that call instead of starting their own.
+
+    Args:
+        func: Coroutine function to decorate
+
+    Returns:
+        Decorated coroutine function
+    """
+    flights = AsyncSingleFlight()
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        return await flights.do(key, func, *args, **kwargs)
+
+    return wrapper
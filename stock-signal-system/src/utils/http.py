@@ -0,0 +1,122 @@
+"""Shared keep-alive HTTP client for async API providers."""
+
+import asyncio
+from typing import Any, Mapping, Optional
+
+import aiohttp
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HttpClient:
+    """
+    Lazily created aiohttp session with pooled keep-alive connections.
+
+    One client can be shared by several providers so requests to the
+    same host reuse connections. The session belongs to the event loop
+    it was created on and is recreated when used from another loop.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        timeout: float = 30,
+        keepalive_timeout: float = 30,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            limit: Maximum open connections overall
+            limit_per_host: Maximum open connections per host
+            timeout: Default total request timeout in seconds
+            keepalive_timeout: Seconds an idle connection is kept open
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.logger = logger.bind(component="HttpClient")
+
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Get the session for the running event loop.
+
+        Returns:
+            Open aiohttp session
+        """
+        loop = asyncio.get_running_loop()
+
+        if (
+            self._session is None
+            or self._session.closed
+            or self._loop is not loop
+        ):
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                raise_for_status=True,
+            )
+            self._loop = loop
+            self.logger.debug(
+                "HTTP session opened",
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+            )
+
+        return self._session
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Any:
+        """
+        GET a URL and decode its JSON body.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            timeout: Total timeout in seconds (defaults to the client's)
+            headers: Extra request headers
+
+        Returns:
+            Decoded JSON
+
+        Raises:
+            aiohttp.ClientResponseError: Non-2xx response
+            aiohttp.ClientError: Connection failure
+            asyncio.TimeoutError: Request timed out
+        """
+        options = {"params": params, "headers": headers}
+        if timeout is not None:
+            options["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        async with self.session().get(url, **options) as response:
+            return await response.json(content_type=None)
+
+    async def close(self):
+        """Close the session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    async def __aenter__(self) -> "HttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
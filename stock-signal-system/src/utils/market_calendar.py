@@ -0,0 +1,174 @@
+"""Exchange trading session calendar."""
+
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import yaml
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _parse_time(value: str | time) -> time:
+    """Parse an "HH:MM" string."""
+    if isinstance(value, time):
+        return value
+    return datetime.strptime(value, "%H:%M").time()
+
+
+class MarketCalendar:
+    """
+    Trading sessions of an exchange from a local calendar table.
+
+    Days outside the table's holiday list are treated as regular
+    weekday sessions. The table only covers the years it lists holidays
+    for; other years are also treated as plain weekday sessions, with a
+    warning (once per year) since holidays there are unknown.
+    """
+
+    def __init__(
+        self,
+        timezone: str = "America/New_York",
+        open_time: str | time = "09:30",
+        close_time: str | time = "16:00",
+        holidays: Iterable[date] = (),
+        early_closes: Optional[Dict[date, str | time]] = None,
+    ):
+        """
+        Initialize calendar.
+
+        Args:
+            timezone: Exchange timezone name
+            open_time: Regular session open (local time)
+            close_time: Regular session close (local time)
+            holidays: Dates the exchange is closed
+            early_closes: Dates with a shortened session and their close
+        """
+        self.tz = ZoneInfo(timezone)
+        self.open_time = _parse_time(open_time)
+        self.close_time = _parse_time(close_time)
+        self.holidays = frozenset(holidays)
+        self.years = frozenset(day.year for day in self.holidays)
+        self._warned_years: set[int] = set()
+        self.early_closes = {
+            day: _parse_time(close)
+            for day, close in (early_closes or {}).items()
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> "MarketCalendar":
+        """
+        Load a calendar table from YAML.
+
+        Args:
+            path: Calendar file (falls back to weekday sessions if missing)
+
+        Returns:
+            MarketCalendar instance
+        """
+        path = Path(path)
+
+        if not path.exists():
+            logger.warning(
+                "Market calendar not found, using weekday sessions",
+                path=str(path),
+            )
+            return cls()
+
+        with open(path) as f:
+            table = yaml.safe_load(f) or {}
+
+        return cls(
+            timezone=table.get("timezone", "America/New_York"),
+            open_time=table.get("open", "09:30"),
+            close_time=table.get("close", "16:00"),
+            holidays=table.get("holidays", []),
+            early_closes=table.get("early_closes", {}),
+        )
+
+    def covers(self, day: date) -> bool:
+        """Check whether the holiday table includes a date's year."""
+        return not self.years or day.year in self.years
+
+    def _check_coverage(self, day: date):
+        """Warn once per year for dates beyond the holiday table."""
+        if self.covers(day) or day.year in self._warned_years:
+            return
+
+        self._warned_years.add(day.year)
+        logger.warning(
+            "Market calendar has no holidays for year, "
+            "assuming weekday sessions",
+            year=day.year,
+            covered_years=sorted(self.years),
+        )
+
+    def is_session_day(self, day: date) -> bool:
+        """Check whether the exchange trades on a date."""
+        self._check_coverage(day)
+        return day.weekday() < 5 and day not in self.holidays
+
+    def session_bounds(self, day: date) -> Tuple[datetime, datetime]:
+        """
+        Get the open and close of a session day.
+
+        Args:
+            day: Session date
+
+        Returns:
+            Tuple of tz-aware (open, close) datetimes
+        """
+        close_time = self.early_closes.get(day, self.close_time)
+        return (
+            datetime.combine(day, self.open_time, tzinfo=self.tz),
+            datetime.combine(day, close_time, tzinfo=self.tz),
+        )
+
+    def _localize(self, at: datetime) -> datetime:
+        """Convert to exchange time (naive values are local wall time)."""
+        if at.tzinfo is None:
+            at = at.astimezone()
+        return at.astimezone(self.tz)
+
+    def is_open(self, at: datetime) -> bool:
+        """Check whether the regular session is in progress."""
+        at = self._localize(at)
+        if not self.is_session_day(at.date()):
+            return False
+
+        open_, close = self.session_bounds(at.date())
+        return open_ <= at < close
+
+    def next_session_day(self, day: date) -> date:
+        """First session day strictly after ``day``."""
+        day += timedelta(days=1)
+        while not self.is_session_day(day):
+            day += timedelta(days=1)
+        return day
+
+    def next_open(self, at: datetime) -> datetime:
+        """First session open strictly after ``at``."""
+        at = self._localize(at)
+        day = at.date()
+
+        if self.is_session_day(day):
+            open_, _ = self.session_bounds(day)
+            if at < open_:
+                return open_
+
+        return self.session_bounds(self.next_session_day(day))[0]
+
+    def next_close(self, at: datetime) -> datetime:
+        """First session close strictly after ``at``."""
+        at = self._localize(at)
+        day = at.date()
+
+        if self.is_session_day(day):
+            _, close = self.session_bounds(day)
+            if at < close:
+                return close
+
+        return self.session_bounds(self.next_session_day(day))[1]
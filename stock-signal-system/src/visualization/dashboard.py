@@ -1,13 +1,13 @@
 """Interactive dashboard generation."""
 
 from pathlib import Path
-from typing import List
 
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from ..models.signal import TradingSignal
+from ..models.signal import SIGNAL_ORDER
+from ..models.signal_frame import SignalFrame
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,14 +27,14 @@ class Dashboard:
         self.output_path.mkdir(parents=True, exist_ok=True)
         self.logger = logger.bind(component="Dashboard")
 
-    def create_overview(self, signals: List[TradingSignal]):
+    def create_overview(self, signals: SignalFrame):
         """
         Create overview dashboard.
 
         Args:
-            signals: List of trading signals
+            signals: Trading signals
         """
-        if not signals:
+        if not len(signals):
             self.logger.warning("No signals to visualize")
             return
 
@@ -55,21 +55,24 @@ class Dashboard:
             ],
         )
 
-        symbols = [s.symbol for s in signals]
+        symbols = signals.symbols
 
         # Chart 1: Signal distribution
-        signal_types = [s.signal_type.value for s in signals]
-        signal_counts = pd.Series(signal_types).value_counts()
+        signal_counts = {
+            signal_type.value: count
+            for signal_type, count in signals.counts().items()
+            if count
+        }
 
         colors = [
             "green" if "BUY" in s else "red" if "SELL" in s else "yellow"
-            for s in signal_counts.index
+            for s in signal_counts
         ]
 
         fig.add_trace(
             go.Bar(
-                x=signal_counts.index,
-                y=signal_counts.values,
+                x=list(signal_counts),
+                y=list(signal_counts.values()),
                 marker_color=colors,
                 name="Signals",
             ),
@@ -78,15 +81,14 @@ class Dashboard:
         )
 
         # Chart 2: Confidence levels
-        confidences = [s.confidence for s in signals]
-        bar_colors = [s.color for s in signals]
+        confidences = signals.confidence
 
         fig.add_trace(
             go.Bar(
                 x=symbols,
                 y=confidences,
-                marker_color=bar_colors,
-                text=[f"{c:.0f}%" for c in confidences],
+                marker_color=signals.colors,
+                text=np.char.mod("%.0f%%", confidences),
                 textposition="auto",
                 name="Confidence",
             ),
@@ -94,34 +96,47 @@ class Dashboard:
             col=2,
         )
 
-        # Chart 3: Score breakdown
-        for signal in signals:
+        # Chart 3: Score breakdown, one trace per signal type with a
+        # gap-separated line per symbol
+        metrics = np.array(["Sentiment", "Technical", "Combined", None])
+        for code, signal_type in enumerate(SIGNAL_ORDER):
+            group = signals[signals.signal_codes == code]
+            if not len(group):
+                continue
+
+            scores = np.column_stack(
+                [
+                    group.sentiment,
+                    group.technical,
+                    group.combined_score,
+                    np.full(len(group), np.nan),
+                ]
+            )
             fig.add_trace(
                 go.Scatter(
-                    x=["Sentiment", "Technical", "Combined"],
-                    y=[
-                        signal.sentiment_score.value,
-                        signal.technical_score.value,
-                        signal.combined_score,
-                    ],
+                    x=np.tile(metrics, len(group)),
+                    y=scores.ravel(),
+                    text=np.repeat(group.symbols, len(metrics)),
+                    hovertemplate="%{text}: %{y:+.3f}",
                     mode="lines+markers",
-                    name=signal.symbol,
-                    line=dict(width=3),
+                    name=signal_type.value,
+                    line=dict(width=3, color=signal_type.color),
+                    connectgaps=False,
                 ),
                 row=2,
                 col=1,
             )
 
         # Chart 4: Weekly performance
-        week_changes = [s.week_change for s in signals]
-        perf_colors = ["green" if x > 0 else "red" for x in week_changes]
+        week_changes = signals.week_change
+        perf_colors = np.where(week_changes > 0, "green", "red")
 
         fig.add_trace(
             go.Bar(
                 x=symbols,
                 y=week_changes,
                 marker_color=perf_colors,
-                text=[f"{x:+.1f}%" for x in week_changes],
+                text=np.char.mod("%+.1f%%", week_changes),
                 textposition="auto",
                 name="Week %",
             ),
@@ -154,18 +169,18 @@ class Dashboard:
 
         fig.show()
 
-    def export_csv(self, signals: List[TradingSignal], filename: str):
+    def export_csv(self, signals: SignalFrame, filename: str):
         """
         Export signals to CSV.
 
         Args:
-            signals: List of trading signals
+            signals: Trading signals
             filename: Output filename
         """
-        if not signals:
+        if not len(signals):
             return
 
-        df = pd.DataFrame([s.to_dict() for s in signals])
+        df = signals.to_export_frame()
         output_file = self.output_path / filename
 
         df.to_csv(output_file, index=False)
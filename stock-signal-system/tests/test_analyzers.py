@@ -0,0 +1,63 @@
+"""Tests for technical analysis scoring."""
+
+import numpy as np
+import pytest
+
+from src.config.settings import TechnicalWeightsConfig
+from src.models.indicators import IndicatorPanel, TechnicalIndicators
+from src.services.technical.analyzers import TechnicalAnalyzer
+
+
+@pytest.fixture
+def panel():
+    """Indicator panel including threshold boundaries and NaNs."""
+    rng = np.random.default_rng(0)
+    n = 500
+
+    def column(center, scale, edges=()):
+        values = center + rng.standard_normal(n) * scale
+        values[: len(edges)] = edges
+        values[rng.random(n) < 0.03] = np.nan
+        return values
+
+    return IndicatorPanel.from_columns(
+        [f"S{i}" for i in range(n)],
+        {
+            "price": column(100, 10),
+            "ma_20": column(100, 10),
+            "ma_50": column(100, 10),
+            "ma_200": column(100, 10),
+            "rsi": column(50, 20, edges=(30, 40, 60, 70)),
+            "volume_ratio": column(1.2, 0.5, edges=(1.5,)),
+            "week_change": column(0, 6, edges=(5, -5)),
+            "month_change": column(0, 12, edges=(10, -10)),
+            "macd_hist": column(0, 1, edges=(0.0,)),
+            "bb_percent_b": column(0.5, 0.7, edges=(0.0, 1.0)),
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [
+        TechnicalWeightsConfig(),
+        TechnicalWeightsConfig(macd=0.2, bollinger=0.3, volume=0.0),
+    ],
+)
+def test_analyze_batch_matches_analyze(panel, weights):
+    """Test that batch scores equal per-symbol scores exactly."""
+    analyzer = TechnicalAnalyzer(weights)
+    batch = analyzer.analyze_batch(panel)
+
+    for row, symbol in enumerate(panel.symbols):
+        values = {
+            name: float(getattr(panel, name)[row])
+            for name in panel.COLUMNS
+        }
+        values.update(
+            {name: float(v[row]) for name, v in panel.extra.items()}
+        )
+        score = analyzer.analyze(TechnicalIndicators.from_values(values))
+
+        assert batch.values[row] == score.value
+        assert batch[row].components == score.components
@@ -0,0 +1,166 @@
+"""Tests for in-memory caching, request coalescing and freshness."""
+
+import threading
+import time
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from structlog.testing import capture_logs
+
+from src.repositories.freshness import MarketSessionPolicy, MaxAgePolicy
+from src.utils.cache import LRUCache
+from src.utils.market_calendar import MarketCalendar
+from src.utils.singleflight import SingleFlight
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def test_lru_evicts_least_recently_used():
+    """Entries beyond the byte budget are evicted oldest use first."""
+    cache = LRUCache(max_bytes=3, sizeof=lambda value: 1)
+    for key in "abc":
+        cache.put(key, key)
+
+    cache.get("a")
+    cache.put("d", "d")
+
+    assert "b" not in cache
+    assert [key for key, _ in cache.items()] == ["c", "a", "d"]
+    assert cache.stats.evictions == 1
+
+
+def test_lru_expires_entries():
+    """Entries are dropped once their TTL has passed."""
+    cache = LRUCache(max_bytes=100, sizeof=lambda value: 1)
+    cache.put("short", 1, ttl=0.01)
+    cache.put("long", 2, ttl=60)
+    time.sleep(0.02)
+
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    assert cache.stats.expirations == 1
+
+
+def test_lru_skips_oversized_entries():
+    """An entry larger than the whole budget is not cached."""
+    cache = LRUCache(max_bytes=2, sizeof=lambda value: len(value))
+    cache.put("small", "ab")
+    cache.put("large", "abc")
+
+    assert "large" not in cache
+    assert cache.get("small") == "ab"
+
+
+def test_single_flight_shares_one_call():
+    """Concurrent callers with the same key share one execution."""
+    flights = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(1)
+        return "bars"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(flights.do("AAPL", fetch))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ["bars"] * 5
+
+
+def test_single_flight_shares_errors():
+    """A failing call raises for every waiting caller."""
+    flights = SingleFlight()
+
+    def fail():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        flights.do("AAPL", fail)
+
+    # Failed calls are not remembered
+    assert flights.do("AAPL", lambda: "ok") == "ok"
+
+
+def test_max_age_policy():
+    """Data is valid for a fixed age."""
+    fetched_at = datetime(2025, 3, 3, 12, tzinfo=NEW_YORK)
+    policy = MaxAgePolicy(timedelta(hours=1))
+
+    assert policy.ttl(fetched_at, now=fetched_at) == 3600
+    assert policy.ttl(fetched_at, now=fetched_at + timedelta(hours=2)) == 0
+
+
+@pytest.mark.parametrize(
+    "fetched_at, expires_at",
+    [
+        # Mid-session: until the day's bar settles
+        (datetime(2025, 3, 3, 11, 0), datetime(2025, 3, 3, 16, 30)),
+        # Just after the close: until the bar settles
+        (datetime(2025, 3, 3, 16, 20), datetime(2025, 3, 3, 16, 30)),
+        # Evening: until the next session's bar settles
+        (datetime(2025, 3, 3, 20, 0), datetime(2025, 3, 4, 16, 30)),
+        # Friday evening: until Monday's close
+        (datetime(2025, 3, 7, 20, 0), datetime(2025, 3, 10, 16, 30)),
+        # Before a holiday: skips the closed day
+        (datetime(2025, 1, 17, 20, 0), datetime(2025, 1, 21, 16, 30)),
+    ],
+)
+def test_market_session_policy(fetched_at, expires_at):
+    """Freshness follows exchange session closes by default."""
+    calendar = MarketCalendar(holidays=[datetime(2025, 1, 20).date()])
+    policy = MarketSessionPolicy(calendar)
+
+    expiry = policy.expires_at(fetched_at.replace(tzinfo=NEW_YORK))
+
+    assert expiry == expires_at.replace(tzinfo=NEW_YORK)
+
+
+@pytest.mark.parametrize(
+    "fetched_at, expires_at",
+    [
+        # Mid-session: intraday max age
+        (datetime(2025, 3, 3, 11, 0), datetime(2025, 3, 3, 11, 15)),
+        # Just after the close: until the bar settles
+        (datetime(2025, 3, 3, 16, 20), datetime(2025, 3, 3, 16, 30)),
+        # Evening: until the next open
+        (datetime(2025, 3, 3, 20, 0), datetime(2025, 3, 4, 9, 30)),
+        # Before a holiday: skips the closed day
+        (datetime(2025, 1, 17, 20, 0), datetime(2025, 1, 21, 9, 30)),
+    ],
+)
+def test_market_session_policy_intraday(fetched_at, expires_at):
+    """Opting into intraday refresh expires the in-progress bar early."""
+    calendar = MarketCalendar(holidays=[datetime(2025, 1, 20).date()])
+    policy = MarketSessionPolicy(calendar, refresh_intraday=True)
+
+    expiry = policy.expires_at(fetched_at.replace(tzinfo=NEW_YORK))
+
+    assert expiry == expires_at.replace(tzinfo=NEW_YORK)
+
+
+def test_calendar_warns_beyond_holiday_table():
+    """Years without holidays in the table warn once and trade weekdays."""
+    calendar = MarketCalendar(holidays=[date(2025, 1, 20)])
+
+    with capture_logs() as logs:
+        assert calendar.is_session_day(date(2025, 3, 3))
+        assert calendar.is_session_day(date(2030, 1, 2))
+        assert calendar.is_session_day(date(2030, 1, 3))
+
+    assert calendar.covers(date(2025, 12, 31))
+    assert not calendar.covers(date(2030, 1, 2))
+    assert [log["year"] for log in logs] == [2030]
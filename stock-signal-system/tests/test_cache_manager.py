@@ -0,0 +1,78 @@
+"""Tests for cache directory management."""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from src.repositories.cache_manager import CacheManager
+from src.services.technical.result_cache import IndicatorResultCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Cache directory with one indexed price store."""
+    path = tmp_path / "cache"
+    path.mkdir()
+    frame = pd.DataFrame({"Close": [1.0, 2.0]})
+    frame.to_parquet(path / "AAPL_bars.parquet")
+    return path
+
+
+def saved_result_cache(path):
+    """Persist one indicator result to ``path``."""
+    cache = IndicatorResultCache(path=path)
+    cache.put(("AAPL", 1, 2, 2.0, "fp"), {"rsi": 55.0})
+    cache.save()
+    return cache
+
+
+def test_collect_keeps_exempt_indicator_cache(cache_dir):
+    """GC leaves an indicator cache inside cache_dir alone if exempt."""
+    indicator_file = cache_dir / "indicators.json"
+    saved_result_cache(indicator_file)
+
+    manager = CacheManager(cache_dir, exempt=[indicator_file.name])
+    report = manager.collect()
+
+    assert report.orphans == []
+    assert indicator_file.exists()
+    assert manager.lookup(indicator_file.name) is None
+
+    reloaded = IndicatorResultCache(path=indicator_file)
+    assert reloaded.get(("AAPL", 1, 2, 2.0, "fp")) == {"rsi": 55.0}
+
+
+def test_collect_removes_only_own_temp_files(cache_dir):
+    """Stale write temps are removed; other unknown files are kept."""
+    stale = time.time() - 2 * CacheManager.TEMP_GRACE_SECONDS
+    for name in (".MSFT_bars.parquet.0a1b.tmp", "notes.tmp"):
+        (cache_dir / name).write_text("partial")
+        os.utime(cache_dir / name, (stale, stale))
+    (cache_dir / ".GOOG_bars.parquet.2c3d.tmp").write_text("in flight")
+    (cache_dir / "stray.json").write_text("{}")
+
+    manager = CacheManager(cache_dir)
+    report = manager.collect()
+
+    assert report.orphans == [".MSFT_bars.parquet.0a1b.tmp"]
+    assert (cache_dir / ".GOOG_bars.parquet.2c3d.tmp").exists()
+    assert (cache_dir / "notes.tmp").exists()
+    assert (cache_dir / "stray.json").exists()
+    assert manager.lookup("stray.json") is None
+    assert manager.lookup("AAPL_bars.parquet") is not None
+
+
+def test_collect_evicts_least_recently_used(cache_dir):
+    """Files beyond the byte budget are evicted oldest access first."""
+    frame = pd.DataFrame({"Close": [3.0]})
+    frame.to_parquet(cache_dir / "MSFT_bars.parquet")
+
+    manager = CacheManager(cache_dir)
+    manager.record_access("MSFT_bars.parquet")
+    manager.max_bytes = manager.lookup("MSFT_bars.parquet").size
+    report = manager.collect()
+
+    assert report.evicted == ["AAPL_bars.parquet"]
+    assert manager.names() == ["MSFT_bars.parquet"]
@@ -0,0 +1,284 @@
+"""Tests for technical indicator calculation."""
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.market_data import PriceHistoryRef, PricePanel
+from src.repositories.sources import MarketDataSource
+from src.services.technical import indicators
+from src.services.technical.indicators import TechnicalIndicatorCalculator
+from src.services.technical.registry import REGISTRY, IndicatorRegistry
+from src.services.technical.result_cache import IndicatorResultCache
+from src.services.technical.streaming import (
+    IndicatorState,
+    load_checkpoint,
+    save_checkpoint,
+)
+
+FIELDS = (
+    "price",
+    "ma_20",
+    "ma_50",
+    "ma_200",
+    "rsi",
+    "volume_ratio",
+    "week_change",
+    "month_change",
+)
+
+
+def make_history(bars: int, seed: int = 0) -> pd.DataFrame:
+    """Create a random-walk price history."""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(bars).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(100_000, 1_000_000, bars),
+        },
+        index=pd.date_range("2024-01-01", periods=bars, freq="B"),
+    )
+
+
+class FrameSource(MarketDataSource):
+    """Source serving fixed histories."""
+
+    def __init__(self, frames):
+        super().__init__()
+        self.frames = frames
+
+    @property
+    def name(self) -> str:
+        return "frames"
+
+    def get_price_history(
+        self, symbol, period="6mo", start=None, columns=None
+    ):
+        return self.frames.get(symbol)
+
+
+@pytest.fixture
+def histories():
+    """Histories longer and shorter than the longest window."""
+    return {
+        "LONG": make_history(180, seed=1),
+        "SHORT": make_history(60, seed=2),
+        "TINY": make_history(8, seed=3),
+    }
+
+
+@pytest.fixture
+def calculator(histories):
+    """Calculator over fixed histories without a result cache."""
+    return TechnicalIndicatorCalculator(data_source=FrameSource(histories))
+
+
+def assert_indicators_equal(actual, expected):
+    """Compare TechnicalIndicators field by field (NaN-aware)."""
+    for name in FIELDS:
+        assert getattr(actual, name) == pytest.approx(
+            getattr(expected, name), rel=1e-9, nan_ok=True
+        ), name
+
+
+def test_calculator_defers_default_source_and_closes(monkeypatch):
+    """The default repository is built on first use; close stops workers."""
+    built = []
+    monkeypatch.setattr(
+        indicators, "MarketDataRepository", lambda: built.append(1) or "repo"
+    )
+
+    calculator = TechnicalIndicatorCalculator()
+    assert built == []
+    assert calculator.data_source == "repo"
+    assert calculator.data_source == "repo"
+    assert built == [1]
+
+    calculator.close()
+    with pytest.raises(RuntimeError):
+        calculator.executor.submit(print)
+
+
+def test_batch_matches_single_symbol(calculator, histories):
+    """calculate_batch gives the same values as the per-symbol path."""
+    panel = calculator.calculate_batch([*histories, "MISSING"])
+
+    assert list(panel.valid) == [True, True, True, False]
+    for symbol, hist in histories.items():
+        expected = calculator.calculate_from_history(symbol, hist)
+        assert_indicators_equal(panel.get(symbol), expected)
+
+
+@pytest.mark.parametrize("symbol", ["LONG", "SHORT", "TINY"])
+def test_streaming_state_matches_history(calculator, histories, symbol):
+    """IndicatorState gives the same values as calculate_from_history."""
+    hist = histories[symbol]
+    expected = calculator.calculate_from_history(symbol, hist)
+
+    state = IndicatorState.from_history(hist)
+    assert_indicators_equal(state.snapshot(), expected)
+
+    # Advancing bar by bar matches recalculating on the longer history
+    state = IndicatorState.from_history(hist.iloc[:-3])
+    for timestamp, bar in hist.iloc[-3:].iterrows():
+        state.update(bar["Close"], bar["Volume"], timestamp)
+    assert_indicators_equal(state.snapshot(), expected)
+
+
+def test_streaming_state_revises_latest_bar(calculator, histories):
+    """A bar with the latest timestamp replaces it."""
+    hist = histories["LONG"]
+    revised = hist.copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 2.5
+
+    state = IndicatorState.from_history(hist)
+    bar = revised.iloc[-1]
+    state.update(bar["Close"], bar["Volume"], revised.index[-1])
+
+    assert_indicators_equal(
+        state.snapshot(), calculator.calculate_from_history("LONG", revised)
+    )
+
+
+def test_streaming_checkpoint_round_trip(tmp_path, histories):
+    """Checkpointed states resume with identical values."""
+    states = {
+        symbol: IndicatorState.from_history(hist)
+        for symbol, hist in histories.items()
+    }
+    path = tmp_path / "states.json"
+
+    save_checkpoint(states, path)
+    restored = load_checkpoint(path)
+
+    for symbol, state in states.items():
+        assert_indicators_equal(
+            restored[symbol].snapshot(), state.snapshot()
+        )
+
+
+def test_registry_resolves_dependencies():
+    """Dependencies come before dependents; cycles and unknowns fail."""
+    registry = IndicatorRegistry()
+    registry.add("mean", lambda close: close.mean(axis=1), ["close"], 10)
+    registry.add("double", lambda mean: mean * 2, ["mean"])
+
+    assert [n.name for n in registry.resolve(["double"])] == [
+        "mean",
+        "double",
+    ]
+    assert registry.lookback(["double"]) == 10
+    assert registry.columns(["double"]) == ("Close",)
+
+    with pytest.raises(KeyError):
+        registry.resolve(["missing"])
+    with pytest.raises(ValueError):
+        registry.add("mean", lambda close: close, ["close"])
+
+    registry.add("a", lambda b: b, ["b"])
+    registry.add("b", lambda a: a, ["a"])
+    with pytest.raises(ValueError):
+        registry.resolve(["a"])
+
+
+def test_registry_evaluates_panel(histories):
+    """Evaluating a panel computes only requested indicators."""
+    panel = PricePanel.from_frames(histories)
+    result = REGISTRY.evaluate(panel, ["price", "ma_20"])
+
+    assert result.price == pytest.approx(
+        [h["Close"].iloc[-1] for h in histories.values()]
+    )
+    assert result.ma_20[0] == pytest.approx(
+        histories["LONG"]["Close"].tail(20).mean()
+    )
+    assert np.isnan(result.ma_20[2])
+    assert np.isnan(result.rsi).all()
+
+
+def test_registry_fingerprint_tracks_parameters():
+    """Changing a node's parameters changes the fingerprint."""
+    registry = IndicatorRegistry()
+    registry.add("m", lambda close, window: close, ["close"], window=5)
+    before = registry.fingerprint(["m"])
+
+    other = IndicatorRegistry()
+    other.add("m", lambda close, window: close, ["close"], window=6)
+
+    assert before == registry.fingerprint(["m"])
+    assert before != other.fingerprint(["m"])
+
+
+def test_result_cache_misses_on_changed_bars(tmp_path, histories):
+    """Cached results are reused only for identical bars."""
+    hist = histories["LONG"]
+    cache = IndicatorResultCache(path=tmp_path / "indicators.json")
+    key = cache.key("LONG", hist, "fp")
+    cache.put(key, {"rsi": 42.0})
+
+    revised = hist.copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 1
+
+    assert cache.get(cache.key("LONG", hist, "fp")) == {"rsi": 42.0}
+    assert cache.get(cache.key("LONG", revised, "fp")) is None
+    assert cache.get(cache.key("LONG", hist.iloc[:-1], "fp")) is None
+    assert cache.get(cache.key("LONG", hist, "other")) is None
+
+    cache.save()
+    reloaded = IndicatorResultCache(path=tmp_path / "indicators.json")
+    assert reloaded.get(key) == {"rsi": 42.0}
+
+
+def test_calculator_reuses_cached_results(histories):
+    """A result cache serves repeat calculations on unchanged bars."""
+    calculator = TechnicalIndicatorCalculator(
+        data_source=FrameSource(histories),
+        result_cache=IndicatorResultCache(),
+    )
+    first = calculator.calculate_from_history("LONG", histories["LONG"])
+    second = calculator.calculate_from_history("LONG", histories["LONG"])
+
+    assert_indicators_equal(second, first)
+    assert calculator.result_cache.memory.stats.hits == 1
+
+
+def test_history_ref_reloads_released_frame(histories):
+    """A released price history is loaded again on access."""
+    loads = []
+
+    def loader(symbol):
+        loads.append(symbol)
+        return histories[symbol].copy()
+
+    frame = loader("LONG")
+    ref = PriceHistoryRef("LONG", loader, frame)
+    assert ref.get() is frame
+    assert ref.loaded
+
+    del frame
+    gc.collect()
+    assert not ref.loaded
+
+    pd.testing.assert_frame_equal(ref.get(), histories["LONG"])
+    assert loads == ["LONG", "LONG"]
+
+
+def test_extra_indicators_allocated_on_demand(histories):
+    """Core-only results carry no extra dict."""
+    hist = histories["LONG"]
+    core = TechnicalIndicatorCalculator(data_source=FrameSource(histories))
+    macd = TechnicalIndicatorCalculator(
+        data_source=FrameSource(histories), indicators=["macd_hist"]
+    )
+
+    assert core.calculate_from_history("LONG", hist).extra is None
+    values = macd.calculate_from_history("LONG", hist)
+    assert set(values.extra) == {"macd_hist"}
+    assert values.value("macd_hist") == values.extra["macd_hist"]
+
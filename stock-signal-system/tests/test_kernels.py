@@ -0,0 +1,158 @@
+"""Tests for rolling indicator kernels."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.technical import kernels
+
+BACKENDS = [
+    pytest.param(
+        "numba",
+        marks=pytest.mark.skipif(
+            not kernels.HAS_NUMBA, reason="numba not installed"
+        ),
+    ),
+    "numpy",
+]
+
+
+@pytest.fixture
+def panel():
+    """Right-aligned panel with rows of different lengths."""
+    rng = np.random.default_rng(42)
+    values = 100 + rng.standard_normal((6, 160)).cumsum(axis=1)
+
+    for row, padding in enumerate([0, 3, 20, 60, 145, 159]):
+        values[row, :padding] = np.nan
+
+    return values
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    """Run a test with each available backend selected."""
+    previous = kernels.get_backend()
+    kernels.set_backend(request.param)
+    yield request.param
+    kernels.set_backend(previous)
+
+
+def by_row(panel, func):
+    """Apply a pandas calculation to each row's real values."""
+    out = np.full(panel.shape, np.nan)
+
+    for row, values in enumerate(panel):
+        start = np.argmax(~np.isnan(values))
+        out[row, start:] = func(pd.Series(values[start:])).to_numpy()
+
+    return out
+
+
+def test_ema_matches_pandas(panel, backend):
+    """Test EMA against pandas' recursive exponential average."""
+    expected = by_row(panel, lambda s: s.ewm(span=12, adjust=False).mean())
+
+    np.testing.assert_allclose(
+        kernels.ema(panel, 12), expected, rtol=1e-12
+    )
+
+
+@pytest.mark.parametrize("window", [1, 5, 20, 100])
+def test_rolling_mean_matches_pandas(panel, backend, window):
+    """Test rolling mean against pandas."""
+    expected = by_row(panel, lambda s: s.rolling(window).mean())
+
+    np.testing.assert_allclose(
+        kernels.rolling_mean(panel, window), expected, rtol=1e-12
+    )
+
+
+@pytest.mark.parametrize("window", [1, 5, 20])
+def test_rolling_extremes_match_pandas(panel, backend, window):
+    """Test rolling max/min against pandas."""
+    np.testing.assert_array_equal(
+        kernels.rolling_max(panel, window),
+        by_row(panel, lambda s: s.rolling(window).max()),
+    )
+    np.testing.assert_array_equal(
+        kernels.rolling_min(panel, window),
+        by_row(panel, lambda s: s.rolling(window).min()),
+    )
+
+
+def test_wilder_matches_recurrence(panel, backend):
+    """Test Wilder smoothing against a plain Python recurrence."""
+    period = 14
+    row = panel[2]
+    values = row[~np.isnan(row)]
+
+    expected = [np.nan] * (period - 1)
+    average = sum(values[:period]) / period
+    expected.append(average)
+    for value in values[period:]:
+        average = (average * (period - 1) + value) / period
+        expected.append(average)
+
+    np.testing.assert_allclose(
+        kernels.wilder(panel, period)[2, -len(values):],
+        expected,
+        rtol=1e-12,
+    )
+
+
+def test_simple_rsi_matches_pandas(panel, backend):
+    """Test simple RSI against the pandas calculation."""
+
+    def pandas_rsi(close):
+        delta = close.diff()
+        gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+        return 100 - (100 / (1 + gain / loss))
+
+    np.testing.assert_allclose(
+        kernels.rsi(panel, 14), by_row(panel, pandas_rsi), rtol=1e-10
+    )
+
+
+@pytest.mark.skipif(not kernels.HAS_NUMBA, reason="numba not installed")
+@pytest.mark.parametrize(
+    "kernel",
+    [
+        lambda p: kernels.ema(p, 26),
+        lambda p: kernels.wilder(p, 14),
+        lambda p: kernels.rolling_mean(p, 20),
+        lambda p: kernels.rolling_max(p, 20),
+        lambda p: kernels.rolling_min(p, 20),
+        lambda p: kernels.rsi(p, 14, smoothing="wilder"),
+    ],
+)
+def test_backends_agree(panel, kernel):
+    """Test that the numba backend reproduces the NumPy results."""
+    previous = kernels.get_backend()
+    try:
+        kernels.set_backend("numpy")
+        expected = kernel(panel)
+        kernels.set_backend("numba")
+        result = kernel(panel)
+    finally:
+        kernels.set_backend(previous)
+
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_unknown_backend_rejected():
+    """Test that unknown backend names raise."""
+    with pytest.raises(ValueError):
+        kernels.set_backend("cuda")
+
+
+def test_auto_backend():
+    """Test that auto prefers numba only when installed."""
+    previous = kernels.get_backend()
+    try:
+        kernels.set_backend("auto")
+        expected = "numba" if kernels.HAS_NUMBA else "numpy"
+        assert kernels.get_backend() == expected
+    finally:
+        kernels.set_backend(previous)
@@ -0,0 +1,258 @@
+"""Tests for the market data repository."""
+
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.market_data import PriceBatch
+from src.repositories.freshness import MaxAgePolicy
+from src.repositories.market_data import MarketDataRepository
+from src.repositories.sources import MarketDataSource
+
+
+def make_bars(
+    start: str, periods: int, tz=None, factor: float = 1.0
+) -> pd.DataFrame:
+    """Create daily OHLCV bars whose close depends only on the date."""
+    index = pd.date_range(start, periods=periods, freq="D", tz=tz)
+    offset = (pd.Timestamp(start) - pd.Timestamp("2024-01-01")).days
+    close = (100.0 + offset + np.arange(periods)) * factor
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": np.full(periods, 1000),
+        },
+        index=index.rename("Date"),
+    )
+
+
+class StubSource(MarketDataSource):
+    """Source returning tz-naive batches and tz-aware single frames."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    @property
+    def name(self) -> str:
+        return "stub"
+
+    def get_price_history(
+        self, symbol, period="6mo", start=None, columns=None
+    ):
+        self.calls.append(("single", symbol, start))
+        return make_bars("2024-01-08", 5, tz="America/New_York")
+
+    def get_price_histories(
+        self, symbols, period="6mo", start=None, columns=None
+    ):
+        self.calls.append(("batch", tuple(symbols), start))
+        batch = PriceBatch()
+        for symbol in symbols:
+            batch.frames[symbol] = make_bars("2024-01-01", 10)
+            batch.fetched.append(symbol)
+        return batch
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repository whose stores are always stale."""
+    return MarketDataRepository(
+        cache_dir=tmp_path,
+        source=StubSource(),
+        memory_cache_bytes=0,
+        freshness=MaxAgePolicy(timedelta(0)),
+    )
+
+
+def test_merge_mixed_timezones(repository):
+    """Naive and aware bars merge into one tz-aware index."""
+    naive = make_bars("2024-01-01", 10)
+    aware = make_bars("2024-01-08", 5, tz="America/New_York")
+
+    merged = repository._merge(repository._merge(None, naive), aware)
+
+    assert str(merged.index.tz) == "America/New_York"
+    assert merged.index.is_monotonic_increasing
+    assert not merged.index.duplicated().any()
+    assert len(merged) == 12
+
+    # An aware store keeps its timezone when naive bars arrive
+    again = repository._merge(merged, naive)
+    assert str(again.index.tz) == "America/New_York"
+    assert len(again) == 12
+
+
+def test_batch_fill_then_single_refresh(repository):
+    """A store filled by batch download can be refreshed per symbol."""
+    start = pd.Timestamp("2024-01-01")
+
+    batch = repository.get_price_histories(["AAPL"], start=start)
+    assert batch.fetched == ["AAPL"]
+
+    for _ in range(2):
+        df = repository.get_price_history("AAPL", start=start)
+        assert df is not None
+        assert len(df) == 12
+        assert df.index.is_monotonic_increasing
+
+    single = [c for c in repository.source.calls if c[0] == "single"]
+    assert single[0][2] == pd.Timestamp("2024-01-09")
+
+
+def test_merge_replaces_overlapping_bars(repository):
+    """Re-fetched bars replace stored ones and coverage only widens."""
+    store = repository._merge(
+        None, make_bars("2024-01-01", 10), covered_from="2024-01-01"
+    )
+    revised = make_bars("2024-01-10", 3) + 50
+
+    merged = repository._merge(store, revised)
+
+    assert len(merged) == 12
+    assert merged.loc["2024-01-10", "Close"] == pytest.approx(159.0)
+    assert merged.attrs[repository.COVERAGE_KEY] == "2024-01-01"
+    assert merged["Close"].dtype == np.float32
+
+    wider = repository._merge(
+        merged, make_bars("2023-12-01", 5), covered_from="2023-12-01"
+    )
+    assert wider.attrs[repository.COVERAGE_KEY] == "2023-12-01"
+    assert repository._covers(wider, pd.Timestamp("2023-12-15"))
+    assert not repository._covers(wider, pd.Timestamp("2023-11-01"))
+
+
+def test_refresh_start_overlaps_settled_bar(repository):
+    """Refreshes re-fetch the last stored bar and the one before it."""
+    store = repository._merge(
+        None, make_bars("2024-01-01", 5, tz="America/New_York")
+    )
+
+    assert repository._refresh_start(store) == pd.Timestamp("2024-01-04")
+    assert repository._refresh_start(store.iloc[:1]) == pd.Timestamp(
+        "2024-01-01"
+    )
+
+
+class SplitSource(StubSource):
+    """Source serving history up to ``end`` scaled by ``factor``."""
+
+    def __init__(self):
+        super().__init__()
+        self.factor = 1.0
+        self.end = pd.Timestamp("2024-01-10")
+
+    def get_price_history(
+        self, symbol, period="6mo", start=None, columns=None
+    ):
+        self.calls.append(("single", symbol, start))
+        first = pd.Timestamp(start or "2024-01-01")
+        periods = (self.end - first).days + 1
+        return make_bars(str(first.date()), periods, factor=self.factor)
+
+
+def test_adjustment_change_triggers_full_download(tmp_path):
+    """A split re-adjusting old closes replaces the whole store."""
+    source = SplitSource()
+    repository = MarketDataRepository(
+        cache_dir=tmp_path,
+        source=source,
+        memory_cache_bytes=0,
+        freshness=MaxAgePolicy(timedelta(0)),
+    )
+    start = pd.Timestamp("2024-01-01")
+
+    first = repository.get_price_history("AAPL", start=start)
+    assert len(first) == 10
+
+    # Unchanged adjustment: incremental top-up only
+    source.end = pd.Timestamp("2024-01-12")
+    topped = repository.get_price_history("AAPL", start=start)
+    assert len(topped) == 12
+    assert source.calls[-1][2] == pd.Timestamp("2024-01-09")
+
+    # 2-for-1 split: every stored close is halved by the source
+    source.factor = 0.5
+    source.end = pd.Timestamp("2024-01-13")
+    split = repository.get_price_history("AAPL", start=start)
+
+    assert len(split) == 13
+    assert source.calls[-1][2] == start
+    expected = make_bars("2024-01-01", 13, factor=0.5)["Close"]
+    np.testing.assert_allclose(split["Close"].to_numpy(), expected)
+    assert split.attrs[repository.COVERAGE_KEY] == first.attrs[
+        repository.COVERAGE_KEY
+    ]
+
+
+def test_storage_round_trip(repository):
+    """Stored bars come back with their timezone and compact dtypes."""
+    bars = repository._merge(
+        None,
+        make_bars("2024-01-01", 5, tz="America/New_York"),
+        covered_from="2024-01-01",
+    )
+    repository._save_store("AAPL", bars)
+
+    loaded = repository._load_store("AAPL")
+    assert loaded.index.equals(bars.index)
+    assert loaded.attrs[repository.COVERAGE_KEY] == "2024-01-01"
+
+    projected = repository._load_store("AAPL", columns=("Close",))
+    assert list(projected.columns) == ["Close"]
+    assert projected["Close"].dtype == np.float32
+
+
+def test_stale_projection_survives_missing_store(repository, monkeypatch):
+    """A store that vanishes before the full reload is downloaded again."""
+    start = pd.Timestamp("2024-01-01")
+    repository.get_price_histories(["AAPL", "MSFT"], start=start)
+
+    load_store = repository._load_store
+
+    def projected_only(symbol, columns=None):
+        return None if columns is None else load_store(symbol, columns)
+
+    monkeypatch.setattr(repository, "_load_store", projected_only)
+
+    close = repository.get_price_history(
+        "AAPL", start=start, columns=["Close"]
+    )
+    batch = repository.get_price_histories(
+        ["MSFT"], start=start, columns=["Close"]
+    )
+
+    assert list(close.columns) == ["Close"]
+    assert batch.fetched == ["MSFT"]
+    assert list(batch.frames["MSFT"].columns) == ["Close"]
+    assert repository.source.calls[1:] == [
+        ("single", "AAPL", start),
+        ("batch", ("MSFT",), start),
+    ]
+
+
+def test_memory_tier_serves_fresh_stores(tmp_path):
+    """Fresh stores are served without touching the source again."""
+    repository = MarketDataRepository(
+        cache_dir=tmp_path,
+        source=StubSource(),
+        freshness=MaxAgePolicy(timedelta(hours=1)),
+    )
+    start = pd.Timestamp("2024-01-01")
+
+    first = repository.get_price_histories(["AAPL", "MSFT"], start=start)
+    second = repository.get_price_histories(["AAPL", "MSFT"], start=start)
+    close = repository.get_price_history(
+        "AAPL", start=start, columns=["Close"]
+    )
+
+    assert first.fetched == ["AAPL", "MSFT"]
+    assert second.cache_hits == ["AAPL", "MSFT"]
+    assert list(close.columns) == ["Close"]
+    assert len(repository.source.calls) == 1
+    assert repository.cache_stats.hits >= 3
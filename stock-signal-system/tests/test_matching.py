@@ -0,0 +1,53 @@
+"""Tests for ticker and company name matching."""
+
+import pytest
+
+from src.services.sentiment.matching import SymbolMatcher
+
+
+@pytest.fixture
+def matcher():
+    """Matcher with ambiguous tickers, aliases and dotted tickers."""
+    return SymbolMatcher(
+        {
+            "AAPL": "Apple",
+            "AMD": "AMD",
+            "ALL": "Allstate",
+            "A": "Agilent",
+            "BRK.B": "Berkshire Hathaway",
+            "GOOGL": "Google",
+        },
+        aliases={"GOOGL": ["Alphabet"]},
+    )
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("AAPL and AMD rally", {"AAPL", "AMD"}),
+        ("$aapl calls", {"AAPL"}),
+        ("apple's new phone", {"AAPL"}),
+        ("Pineapple prices", set()),
+        ("aapl lowercase ticker", set()),
+        ("ALL in, A big day", set()),
+        ("$ALL and $A", {"ALL", "A"}),
+        ("Allstate raises rates", {"ALL"}),
+        ("BRK.B hits a high", {"BRK.B"}),
+        ("ALPHABET earnings", {"GOOGL"}),
+        ("XAAPL AAPLX AAPL_1", set()),
+        ("", set()),
+    ],
+)
+def test_match(matcher, text, expected):
+    """Test word boundaries, case rules and ambiguity rules."""
+    assert matcher.match(text) == expected
+
+
+def test_overlapping_terms():
+    """Test that terms sharing prefixes and suffixes all match."""
+    matcher = SymbolMatcher(
+        {"META": "Meta", "MET": "MetLife", "T": "AT&T"}, ambiguous=()
+    )
+
+    assert matcher.match("MetLife and META, not AT&T") == {"META", "MET", "T"}
+    assert matcher.match_many(["MET", "Metaverse"]) == [{"MET"}, set()]
@@ -0,0 +1,388 @@
+"""Tests for sentiment providers against local HTTP stubs."""
+
+import asyncio
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import yaml
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.config.settings import (
+    FinnhubConfig,
+    NewsAPIConfig,
+    RedditConfig,
+    Settings,
+)
+from src.services.sentiment.finnhub import (
+    FinnhubSentimentProvider,
+    FinnhubSentimentProviderV2,
+)
+from src.services.sentiment.news_api import NewsAPISentimentProvider
+from src.services.sentiment.reddit import (
+    RedditSentimentProvider,
+    RedditSentimentProviderV2,
+)
+from src.utils.http import HttpClient
+
+CONFIG_FILE = Path(__file__).parents[1] / "src" / "config" / "config.yaml"
+
+ARTICLES = [
+    {"headline": "Apple beats estimates", "summary": "Strong growth"},
+    {"headline": "", "summary": ""},
+    {"headline": "Apple faces lawsuit", "summary": "Shares fall badly"},
+]
+
+
+async def serve(handlers, run):
+    """Run ``run(base_url)`` against a local app serving ``handlers``."""
+    app = web.Application()
+    app.add_routes([web.get(path, handler) for path, handler in handlers])
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        return await run(str(server.make_url("")).rstrip("/"))
+    finally:
+        await server.close()
+
+
+def test_finnhub_coalesces_requests_on_shared_session():
+    """Concurrent calls share one request and one pooled session."""
+    requests = []
+
+    async def company_news(request):
+        requests.append(dict(request.query))
+        await asyncio.sleep(0.01)
+        return web.json_response(ARTICLES)
+
+    async def run(base_url):
+        http = HttpClient()
+        provider = FinnhubSentimentProvider(
+            "key",
+            FinnhubConfig(base_url=base_url, max_articles=2),
+            http=http,
+        )
+        session = http.session()
+        results = await asyncio.gather(
+            *(provider.fetch_sentiment("AAPL", "Apple") for _ in range(3))
+        )
+        assert http.session() is session
+        await http.close()
+        return results
+
+    results = asyncio.run(serve([("/company-news", company_news)], run))
+
+    assert len(requests) == 1
+    assert requests[0]["symbol"] == "AAPL"
+    assert requests[0]["token"] == "key"
+    # Only the first max_articles articles are read; blank ones skipped
+    assert [len(scores) for scores in results] == [1, 1, 1]
+    assert results[0][0] > 0
+
+
+def test_finnhub_v2_keeps_news_without_social_access():
+    """A 403 from the premium social endpoint leaves news scores."""
+
+    async def company_news(request):
+        return web.json_response(ARTICLES)
+
+    async def social(request):
+        raise web.HTTPForbidden()
+
+    async def run(base_url):
+        async with HttpClient() as http:
+            provider = FinnhubSentimentProviderV2(
+                "key", FinnhubConfig(base_url=base_url), http=http
+            )
+            return await provider.fetch_sentiment("AAPL", "Apple")
+
+    scores = asyncio.run(
+        serve(
+            [
+                ("/company-news", company_news),
+                ("/stock/social-sentiment", social),
+            ],
+            run,
+        )
+    )
+
+    assert len(scores) == 2
+    assert scores[0] > 0 > scores[1]
+
+
+def news(url, title):
+    """NewsAPI article."""
+    return {"url": url, "title": title, "description": ""}
+
+
+def test_news_prefetch_leaves_crowded_symbols_to_own_query():
+    """Symbols crowded out of a packed query are fetched on their own."""
+    queries = []
+
+    async def everything(request):
+        query = request.query["q"]
+        queries.append(query)
+        if "Apple" in query and "Microsoft" in query:
+            # A full page of Apple news; more results remain
+            articles = [news(f"a{i}", f"Apple gains {i}") for i in range(3)]
+            return web.json_response(
+                {"totalResults": 10, "articles": articles}
+            )
+        return web.json_response(
+            {
+                "totalResults": 1,
+                "articles": [news("m0", "Microsoft wins big")],
+            }
+        )
+
+    async def run(base_url):
+        config = NewsAPIConfig(base_url=base_url, max_articles=2, page_size=3)
+        async with HttpClient() as http:
+            provider = NewsAPISentimentProvider("key", config, http=http)
+            await provider.prefetch({"AAPL": "Apple", "MSFT": "Microsoft"})
+            return (
+                await provider.fetch_sentiment("AAPL", "Apple"),
+                await provider.fetch_sentiment("MSFT", "Microsoft"),
+            )
+
+    apple, microsoft = asyncio.run(serve([("/everything", everything)], run))
+
+    assert len(apple) == 2
+    assert len(microsoft) == 1
+    assert queries[1:] == ['"Microsoft" OR MSFT']
+
+
+def test_news_prefetch_keeps_symbols_of_exhausted_queries():
+    """When every result was read, symbols without news need no query."""
+    queries = []
+
+    async def everything(request):
+        queries.append(request.query["q"])
+        return web.json_response(
+            {"totalResults": 1, "articles": [news("a0", "Apple gains")]}
+        )
+
+    async def run(base_url):
+        config = NewsAPIConfig(base_url=base_url)
+        async with HttpClient() as http:
+            provider = NewsAPISentimentProvider("key", config, http=http)
+            await provider.prefetch({"AAPL": "Apple", "MSFT": "Microsoft"})
+            return await provider.fetch_sentiment("MSFT", "Microsoft")
+
+    assert asyncio.run(serve([("/everything", everything)], run)) == []
+    assert len(queries) == 1
+
+
+def test_config_file_reaches_providers(tmp_path, monkeypatch):
+    """Provider settings in config.yaml are applied, not dropped."""
+    for key in (
+        "NEWS_API_KEY",
+        "FINNHUB_KEY",
+        "REDDIT_CLIENT_ID",
+        "REDDIT_SECRET",
+    ):
+        monkeypatch.setenv(key, "test")
+    config = yaml.safe_load(CONFIG_FILE.read_text())
+    # Values differing from the model defaults
+    config["api"]["news_api"].update(
+        max_articles=7, max_query_length=120, page_size=50, max_pages=3
+    )
+    config["api"]["finnhub"].update(max_articles=5)
+    config["api"]["reddit"].update(
+        comment_concurrency=3,
+        time_budget_seconds=7,
+        crawl_watchlist=True,
+        crawl_limit=50,
+        crawl_window_hours=6,
+    )
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.safe_dump(config))
+
+    settings = Settings.load_from_yaml(str(config_file))
+    news_api = NewsAPISentimentProvider(
+        "key", settings.api_configs["news_api"]
+    )
+    finnhub = FinnhubSentimentProviderV2(
+        "key", settings.api_configs["finnhub"]
+    )
+
+    assert (
+        news_api.max_articles,
+        news_api.max_query_length,
+        news_api.page_size,
+        news_api.max_pages,
+        news_api.max_results,
+    ) == (7, 120, 50, 3, config["api"]["news_api"]["max_results"])
+    assert finnhub.max_articles == 5
+    assert finnhub.base_url == config["api"]["finnhub"]["base_url"]
+    reddit = RedditSentimentProvider(
+        "id", "secret", "agent", settings.api_configs["reddit"]
+    )
+    assert reddit.subreddits == config["api"]["reddit"]["subreddits"]
+    assert reddit.comment_slots._value == 3
+    assert (
+        reddit.time_budget,
+        reddit.crawl_watchlist,
+        reddit.crawl_limit,
+        reddit.crawl_window,
+    ) == (7, True, 50, 6 * 3600)
+
+
+def post(post_id, title, num_comments=0, score=50):
+    """Reddit submission as asyncpraw returns it."""
+    return SimpleNamespace(
+        id=post_id,
+        title=title,
+        selftext="",
+        num_comments=num_comments,
+        score=score,
+        upvote_ratio=0.9,
+        created_utc=time.time() - 3600,
+    )
+
+
+class FakeReddit:
+    """Stand-in for asyncpraw.Reddit serving fixed posts and comments."""
+
+    def __init__(self, results=None, comment_delay=0.0, listings=None):
+        self.results = results or {}
+        self.comment_delay = comment_delay
+        # Newest-first items of the "new" and "comments" listings
+        self.listings = listings or {"new": [], "comments": []}
+        self.listed = []
+        self.searches = []
+        self.loads = []
+        self.loading = 0
+        self.peak_loading = 0
+
+    async def subreddit(self, name):
+        return SimpleNamespace(
+            search=self.search,
+            new=lambda limit: self.listing("new", limit),
+            comments=lambda limit: self.listing("comments", limit),
+        )
+
+    async def listing(self, kind, limit):
+        for item in self.listings[kind][:limit]:
+            self.listed.append(item.id)
+            yield item
+
+    async def search(self, query, time_filter, limit):
+        self.searches.append(query)
+        for found in self.results.get(query, ())[:limit]:
+            yield found
+
+    async def submission(self, id):
+        self.loads.append(id)
+        reddit = self
+
+        class Comments:
+            async def replace_more(self, limit):
+                pass
+
+            def list(self):
+                return [SimpleNamespace(body=f"Great {id}", score=1)]
+
+        async def load():
+            reddit.loading += 1
+            reddit.peak_loading = max(reddit.peak_loading, reddit.loading)
+            try:
+                await asyncio.sleep(reddit.comment_delay)
+            finally:
+                reddit.loading -= 1
+
+        return SimpleNamespace(load=load, comments=Comments())
+
+
+def reddit_provider(cls, fake, **config):
+    """Provider whose asyncpraw client is replaced by ``fake``."""
+    provider = cls("id", "secret", "agent", RedditConfig(**config))
+    provider.client = fake
+    return provider
+
+
+def test_reddit_loads_each_post_once_with_bounded_comments():
+    """Posts found by several queries are scored and loaded once."""
+    shared = post("p1", "AAPL to the moon", num_comments=3)
+    fake = FakeReddit(
+        {
+            "AAPL": [shared, post("p2", "AAPL earnings", num_comments=1)],
+            "$AAPL": [shared, post("p3", "$AAPL calls", num_comments=2)],
+            "Apple": [shared, post("p4", "Apple news")],
+        }
+    )
+    provider = reddit_provider(
+        RedditSentimentProvider, fake, comment_concurrency=2
+    )
+
+    scores = asyncio.run(provider.fetch_sentiment("AAPL", "Apple"))
+
+    assert fake.searches == ["AAPL", "$AAPL", "Apple"]
+    assert sorted(fake.loads) == ["p1", "p2", "p3"]
+    assert fake.peak_loading <= 2
+    # Four posts plus one comment for each post with comments
+    assert len(scores) == 7
+
+
+def test_reddit_time_budget_keeps_posts_without_slow_comments():
+    """Comments that miss the time budget are skipped, posts kept."""
+    fake = FakeReddit(
+        {"NVDA": [post("p1", "NVDA rally", num_comments=5, score=100)]},
+        comment_delay=5,
+    )
+    provider = reddit_provider(
+        RedditSentimentProviderV2, fake, time_budget_seconds=0.05
+    )
+
+    started = time.perf_counter()
+    scores = asyncio.run(provider.fetch_sentiment("NVDA", "Nvidia"))
+
+    assert time.perf_counter() - started < 1
+    assert len(scores) == 1
+    assert provider.post_limit == 50
+
+
+def comment(comment_id, body, age_hours=1):
+    """Reddit comment as a listing returns it."""
+    return SimpleNamespace(
+        id=comment_id, body=body, created_utc=time.time() - age_hours * 3600
+    )
+
+
+def test_reddit_crawl_routes_watchlist_without_searching():
+    """One crawl serves every symbol; later crawls read only new items."""
+    fake = FakeReddit(
+        listings={
+            "new": [post("p2", "MSFT beats"), post("p1", "AAPL and MSFT")],
+            "comments": [
+                comment("c2", "Apple looks great"),
+                comment("c1", "old news about AAPL", age_hours=48),
+            ],
+        }
+    )
+    provider = reddit_provider(
+        RedditSentimentProviderV2, fake, crawl_watchlist=True
+    )
+    company_names = {"AAPL": "Apple", "MSFT": "Microsoft", "TSLA": "Tesla"}
+
+    async def run():
+        await provider.prefetch(company_names)
+        first = {
+            symbol: await provider.fetch_sentiment(symbol, name)
+            for symbol, name in company_names.items()
+        }
+        fake.listings["new"].insert(0, post("p3", "TSLA deliveries"))
+        fake.listed.clear()
+        await provider.prefetch(company_names)
+        return first, await provider.fetch_sentiment("TSLA", "Tesla")
+
+    first, tesla = asyncio.run(run())
+
+    assert fake.searches == []
+    # Comments older than the crawl window are dropped
+    assert [len(first[s]) for s in company_names] == [2, 2, 0]
+    assert len(tesla) == 1
+    # The second crawl stops at the newest items already seen
+    assert fake.listed == ["p3", "p2", "c2"]
+
@@ -0,0 +1,69 @@
+"""Tests for the watchlist analysis scheduler."""
+
+import asyncio
+
+from src.services.scheduler import AnalysisScheduler
+
+
+def test_results_follow_input_order():
+    """Results align with the symbols; failures become None."""
+    scheduler = AnalysisScheduler(max_concurrency=4)
+
+    async def analyze(symbol):
+        await asyncio.sleep(0.01 * (5 - len(symbol)))
+        if symbol == "FAIL":
+            raise RuntimeError("no data")
+        return None if symbol == "NONE" else symbol.lower()
+
+    report = asyncio.run(
+        scheduler.run(["AAPL", "FAIL", "MS", "NONE"], analyze)
+    )
+
+    assert report.results == ["aapl", None, "ms", None]
+    assert [t.ok for t in report.timings] == [True, False, True, False]
+
+
+def test_limits_bound_concurrency():
+    """Symbols and provider calls never exceed their limits."""
+    scheduler = AnalysisScheduler(
+        max_concurrency=3, provider_limits={"News": 2}
+    )
+    running = {"symbols": 0, "News": 0}
+    peak = {"symbols": 0, "News": 0}
+
+    def enter(name):
+        running[name] += 1
+        peak[name] = max(peak[name], running[name])
+
+    async def analyze(symbol):
+        enter("symbols")
+        async with scheduler.limit("News"):
+            enter("News")
+            await asyncio.sleep(0.01)
+            running["News"] -= 1
+        async with scheduler.limit("Unlimited"):
+            await asyncio.sleep(0)
+        running["symbols"] -= 1
+        return symbol
+
+    report = asyncio.run(
+        scheduler.run([f"S{i}" for i in range(10)], analyze)
+    )
+
+    assert all(report.results)
+    assert peak == {"symbols": 3, "News": 2}
+
+
+def test_scheduler_survives_several_event_loops():
+    """Provider limits work across separate ``asyncio.run`` calls."""
+    scheduler = AnalysisScheduler(provider_limits={"News": 1})
+
+    async def analyze(symbol):
+        async with scheduler.limit("News"):
+            await asyncio.sleep(0)
+        return symbol
+
+    for _ in range(2):
+        report = asyncio.run(scheduler.run(["AAPL", "MSFT"], analyze))
+        assert report.results == ["AAPL", "MSFT"]
+
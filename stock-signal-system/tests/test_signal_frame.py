@@ -0,0 +1,100 @@
+"""Tests for the columnar signal container."""
+
+import dataclasses
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.signal import (
+    SentimentScore,
+    SignalType,
+    TechnicalScore,
+    TradingSignal,
+)
+from src.models.signal_frame import SignalFrame
+
+
+@pytest.fixture
+def signals():
+    """Trading signals with ties, warnings and score details."""
+    rng = np.random.default_rng(3)
+    timestamp = datetime(2024, 1, 2, 15, 30)
+    result = []
+
+    for i in range(50):
+        combined = round(float(rng.uniform(-1, 1)), 1)
+        result.append(
+            TradingSignal(
+                symbol=f"S{i}",
+                company_name=f"Company {i}",
+                signal_type=list(SignalType)[i % 5],
+                confidence=abs(combined) * 100,
+                combined_score=combined,
+                sentiment_score=SentimentScore(
+                    value=float(rng.uniform(-1, 1)),
+                    source_count=i,
+                    sources={"news": 0.5} if i % 2 else {},
+                ),
+                technical_score=TechnicalScore(
+                    value=float(rng.uniform(-1, 1)),
+                    components={"rsi": 0.25, "volume": -0.1},
+                ),
+                current_price=float(rng.uniform(10, 500)),
+                rsi=float(rng.uniform(0, 100)),
+                week_change=float(rng.normal(0, 5)),
+                warnings=["⚠️ Overbought (RSI > 70)", "⚠️ Low volume"][
+                    : i % 3
+                ],
+                timestamp=timestamp,
+            )
+        )
+
+    return result
+
+
+def test_round_trip(signals):
+    """Test that signals survive conversion to a frame and back."""
+    assert SignalFrame.from_signals(signals).to_signals() == signals
+
+
+def test_export_matches_to_dict(signals):
+    """Test that the vectorized export equals per-signal formatting."""
+    expected = pd.DataFrame([s.to_dict() for s in signals])
+
+    pd.testing.assert_frame_equal(
+        SignalFrame.from_signals(signals).to_export_frame(), expected
+    )
+
+
+@pytest.mark.parametrize("k", [0, 1, 7, 50, 80])
+def test_top_matches_sorted(signals, k):
+    """Test that top-K agrees with a full stable sort, ties included."""
+    frame = SignalFrame.from_signals(signals)
+    expected = sorted(signals, key=lambda s: -s.combined_score)[:k]
+
+    assert list(frame.top(k).symbols) == [s.symbol for s in expected]
+
+
+def test_slices_are_views(signals):
+    """Test that slicing shares memory with the frame."""
+    frame = SignalFrame.from_signals(signals)
+
+    assert np.shares_memory(frame[5:10].confidence, frame.confidence)
+    assert frame[frame.buy_mask].signal_values.tolist() == [
+        s.signal_type.value for s in signals if "BUY" in s.signal_type.value
+    ]
+
+
+def test_best_with_all_nan_scores(signals):
+    """Test that best falls back to the first row without scores."""
+    frame = SignalFrame.from_signals(signals)
+    assert frame.best().combined_score == max(
+        s.combined_score for s in signals
+    )
+
+    unscored = dataclasses.replace(
+        frame, combined_score=np.full(len(frame), np.nan)
+    )
+    assert unscored.best().symbol == signals[0].symbol
@@ -1,9 +1,16 @@
 """Tests for signal generation."""
 
+import numpy as np
 import pytest
 
 from src.config.settings import ThresholdsConfig, WeightsConfig
-from src.models.signal import SentimentScore, SignalType, TechnicalScore
+from src.models.indicators import IndicatorPanel, TechnicalIndicators
+from src.models.signal import (
+    SentimentScore,
+    SignalType,
+    TechnicalScore,
+    TechnicalScoreBatch,
+)
 from src.services.signal_generator import SignalGenerator
 
 
@@ -43,3 +50,50 @@ def test_hold_signal(signal_generator):
 
     assert signal_type == SignalType.HOLD
     assert -0.4 < combined < 0.4
+
+
+def test_generate_batch_matches_generate(signal_generator):
+    """Test that batch signals equal per-symbol signals."""
+    rng = np.random.default_rng(1)
+    n = 300
+    symbols = [f"S{i}" for i in range(n)]
+
+    sentiment = rng.uniform(-1, 1, n)
+    sentiment[:6] = [0.7, 0.4, -0.4, -0.7, 0.0, 1.0]
+    technical = rng.uniform(-1, 1, n)
+    technical[:6] = [0.7, 0.4, -0.4, -0.7, 0.0, 1.0]
+    source_counts = rng.integers(0, 30, n)
+
+    panel = IndicatorPanel.from_columns(
+        symbols,
+        {
+            "price": rng.uniform(10, 200, n),
+            "rsi": rng.uniform(10, 90, n),
+            "volume_ratio": rng.uniform(0, 2, n),
+            "week_change": rng.normal(0, 5, n),
+        },
+    )
+    scores = TechnicalScoreBatch(symbols, technical, {})
+
+    batch = signal_generator.generate_batch(
+        symbols, symbols, sentiment, source_counts, scores, panel
+    )
+
+    for row, symbol in enumerate(symbols):
+        expected = signal_generator.generate(
+            symbol,
+            symbol,
+            SentimentScore(
+                value=sentiment[row], source_count=int(source_counts[row])
+            ),
+            TechnicalScore(value=technical[row]),
+            TechnicalIndicators.from_values(panel.values(symbol)),
+        )
+        signal = batch.signal(row)
+
+        assert signal.signal_type == expected.signal_type
+        assert signal.warnings == expected.warnings
+        np.testing.assert_equal(signal.confidence, expected.confidence)
+        np.testing.assert_equal(
+            signal.combined_score, expected.combined_score
+        )